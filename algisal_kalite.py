@@ -0,0 +1,97 @@
+import io
+import numpy as np
+from PIL import Image
+
+# =============================================================================
+# ⚙️ AYARLAR
+# =============================================================================
+
+# Ölçüm, kısa kenarı bu değere yakın (en az bu kadar) olacak şekilde tam sayı katla küçültülmüş
+# parlaklık (luma) düzleminde yapılır. 1000 px çıktıda 2x küçültme: ~4 kat az piksel.
+OLCUM_KISA_KENAR = 500
+
+# SSIM pencereleri: HUCRE x HUCRE hücrelerin 2x2'lik grupları (2*HUCRE kenarlı, yarı örtüşen kare pencere).
+# Pencere toplamları hücre toplamlarından (reshape + sum) elde edilir; kayan pencere döngüsü yoktur.
+HUCRE = 4
+_C1 = (0.01 * 255) ** 2
+_C2 = (0.03 * 255) ** 2
+
+# =============================================================================
+# 🖼 PARLAKLIK DÜZLEMİ
+# =============================================================================
+
+def olcum_olcegi(boyut):
+    """(genişlik, yükseklik) için küçültme katı: kısa kenar OLCUM_KISA_KENAR'ın altına inmez."""
+    return max(1, min(boyut) // OLCUM_KISA_KENAR)
+
+
+def luma(img, olcek=1):
+    """Görselin parlaklık düzlemini (float32) verilen tam sayı katla küçültülmüş olarak döner."""
+    if img.mode not in ("L", "RGB"):
+        img = img.convert("RGB")
+    gri = img.convert("L") if img.mode != "L" else img
+    if olcek > 1:
+        gri = gri.reduce(olcek)
+    return np.asarray(gri, dtype=np.float32)
+
+
+def luma_coz(veri, olcek=1):
+    """
+    Kodlanmış baytları çözüp parlaklık düzlemini döner. RGB JPEG'de çözücü sadece Y kanalını
+    üretir (draft "L"; renk dönüşümü yapılmaz), diğer biçimler normal çözülür.
+    """
+    with Image.open(io.BytesIO(veri)) as img:
+        if img.format == "JPEG" and img.mode == "RGB":
+            img.draft("L", img.size)
+        return luma(img, olcek)
+
+# =============================================================================
+# 📐 SSIM (Vektörel NumPy)
+# =============================================================================
+
+def _pencere_ortalamalari(duzlem):
+    """Düzlemin yarı örtüşen (2*HUCRE) x (2*HUCRE) pencerelerdeki ortalamaları (float64)."""
+    h = duzlem.shape[0] // HUCRE * HUCRE
+    w = duzlem.shape[1] // HUCRE * HUCRE
+    hucreler = duzlem[:h, :w].reshape(h // HUCRE, HUCRE, w // HUCRE, HUCRE).sum(axis=(1, 3), dtype=np.float64)
+    toplam = hucreler[:-1, :-1] + hucreler[1:, :-1] + hucreler[:-1, 1:] + hucreler[1:, 1:]
+    return toplam / (4 * HUCRE * HUCRE)
+
+
+def _istatistikler(duzlem):
+    """Referans tarafı (ortalama, kare ortalaması): aynı referansla çok aday ölçülürken bir kez hesaplanır."""
+    return _pencere_ortalamalari(duzlem), _pencere_ortalamalari(duzlem * duzlem)
+
+
+def ssim(a, b, a_istatistik=None):
+    """
+    İki parlaklık düzleminin ortalama SSIM değeri (1.0 = aynı). Tüm pencereler tek seferde, döngüsüz hesaplanır.
+    Boyutlar farklıysa (ör. kodlayıcı yuvarlaması) ortak bölge karşılaştırılır.
+    """
+    h = min(a.shape[0], b.shape[0])
+    w = min(a.shape[1], b.shape[1])
+    if h < 2 * HUCRE or w < 2 * HUCRE:
+        return 1.0
+    if a.shape != (h, w) or b.shape != (h, w):
+        a, b, a_istatistik = a[:h, :w], b[:h, :w], None
+    mu_a, aa = a_istatistik or _istatistikler(a)
+    mu_b, bb = _istatistikler(b)
+    ab = _pencere_ortalamalari(a * b)
+    mu_aa, mu_bb, mu_ab = mu_a * mu_a, mu_b * mu_b, mu_a * mu_b
+    pay = (2 * mu_ab + _C1) * (2 * (ab - mu_ab) + _C2)
+    payda = (mu_aa + mu_bb + _C1) * ((aa - mu_aa) + (bb - mu_bb) + _C2)
+    return float(np.mean(pay / payda))
+
+
+class AlgisalOlcer:
+    """
+    Bir seviyenin referans görseli için (parlaklık düzlemi bir kez çıkarılır) aday kodlamaların
+    SSIM skorunu hesaplar.
+    """
+    def __init__(self, referans_img):
+        self.olcek = olcum_olcegi(referans_img.size)
+        self.referans = luma(referans_img, self.olcek)
+        self._istatistik = _istatistikler(self.referans)
+
+    def skor(self, veri):
+        return ssim(self.referans, luma_coz(veri, self.olcek), self._istatistik)
@@ -0,0 +1,222 @@
+import numpy as np
+from itertools import combinations
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image
+
+# =============================================================================
+# ⚙️ AYARLAR
+# =============================================================================
+
+# İki görselin "aynı fotoğraf" sayılması için izin verilen en fazla farklı bit (64 bit içinde)
+# 0-4: neredeyse birebir | 5-10: farklı boyut/kalite ile yeniden dışa aktarım
+BENZERLIK_ESIGI = 6
+
+# Aynı anda kodu çözülen (decode) görsel sayısı (PIL decode sırasında GIL'i bırakır)
+ISCI_SAYISI = 4
+
+# Vektörel özet hesabında tek seferde işlenen görsel sayısı (bellek sınırı)
+PARCA_BOYUTU = 2048
+
+# pHash için kullanılan küçük gri görüntü boyutu
+PHASH_BOYUTU = 32
+
+# 32x32 DCT-II dönüşüm matrisi (bir kez hesaplanır)
+_n = np.arange(PHASH_BOYUTU)
+_DCT = np.sqrt(2.0 / PHASH_BOYUTU) * np.cos(np.pi * (2 * _n[None, :] + 1) * _n[:, None] / (2 * PHASH_BOYUTU))
+_DCT[0, :] = np.sqrt(1.0 / PHASH_BOYUTU)
+_DCT = _DCT.astype(np.float32)
+
+# =============================================================================
+# 🖼 KÜÇÜLTÜLMÜŞ OKUMA
+# =============================================================================
+
+def kucuk_gri_oku(yol):
+    """
+    Görseli JPEG draft modunda (1/2, 1/4, 1/8 ölçekli, gri) çözer ve özet için
+    iki küçük gri dizi döner: pHash için 32x32, dHash için 8x9.
+    Tam çözünürlüklü raster hiç oluşturulmaz.
+    """
+    try:
+        with Image.open(yol) as img:
+            img.draft("L", (PHASH_BOYUTU * 2, PHASH_BOYUTU * 2))
+            gri = img.convert("L")
+            kucuk = np.asarray(gri.resize((PHASH_BOYUTU, PHASH_BOYUTU), Image.BOX), dtype=np.float32)
+            fark = np.asarray(gri.resize((9, 8), Image.BOX), dtype=np.float32)
+            return kucuk, fark
+    except Exception:
+        return None
+
+# =============================================================================
+# 🔢 VEKTÖREL ÖZETLER (NumPy)
+# =============================================================================
+
+def _bitleri_sayiya(bitler):
+    """(N, 64) bool dizisini 64 bitlik Python tam sayılarına çevirir."""
+    paket = np.packbits(bitler.astype(np.uint8), axis=1)
+    return [int.from_bytes(satir.tobytes(), "big") for satir in paket]
+
+
+def dhash_toplu(fark_dizileri):
+    """(N, 8, 9) gri dizilerden dHash: her piksel sağ komşusundan parlak mı?"""
+    bitler = fark_dizileri[:, :, 1:] > fark_dizileri[:, :, :-1]
+    return _bitleri_sayiya(bitler.reshape(len(fark_dizileri), 64))
+
+
+def phash_toplu(kucuk_diziler):
+    """(N, 32, 32) gri dizilerden pHash: 2B DCT'nin düşük frekanslı 8x8 bloğu, medyana göre."""
+    katsayilar = _DCT @ kucuk_diziler @ _DCT.T
+    dusuk = katsayilar[:, :8, :8].reshape(len(kucuk_diziler), 64)
+    # DC bileşeni (ortalama parlaklık) medyan hesabına katılmaz
+    medyan = np.median(dusuk[:, 1:], axis=1, keepdims=True)
+    return _bitleri_sayiya(dusuk > medyan)
+
+
+def hamming(a, b):
+    return bin(a ^ b).count("1")
+
+
+def ozetleri_hesapla(yollar, isci_sayisi=ISCI_SAYISI):
+    """
+    Yollar için (yol, phash, dhash) üretir. Okuma paralel, özet hesabı parça parça
+    vektörel yapılır; okunamayan dosyalar atlanır.
+    """
+    yollar = list(yollar)
+    with ThreadPoolExecutor(max_workers=max(1, isci_sayisi)) as havuz:
+        for bas in range(0, len(yollar), PARCA_BOYUTU):
+            parca = yollar[bas:bas + PARCA_BOYUTU]
+            sonuclar = [(y, s) for y, s in zip(parca, havuz.map(kucuk_gri_oku, parca)) if s is not None]
+            if not sonuclar:
+                continue
+            kucukler = np.stack([s[0] for _, s in sonuclar])
+            farklar = np.stack([s[1] for _, s in sonuclar])
+            for (yol, _), p, d in zip(sonuclar, phash_toplu(kucukler), dhash_toplu(farklar)):
+                yield yol, p, d
+
+# =============================================================================
+# 🗂 ÇOKLU İNDEKS (Multi-Index Hashing ile hızlı Hamming komşu arama)
+# =============================================================================
+
+# 64 bitlik özet bu kadar parçaya bölünür (4 x 16 bit)
+PARCA_SAYISI = 4
+_PARCA_BITI = 64 // PARCA_SAYISI
+
+# Bayt başına 1 bit sayısı tablosu (vektörel popcount için)
+_BIT_SAYISI = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def _hamming_dizi(a, b):
+    """İki uint64 dizisi arasındaki eleman bazlı Hamming mesafesi."""
+    return _BIT_SAYISI[(a ^ b).view(np.uint8)].reshape(-1, 8).sum(axis=1)
+
+
+def _cevirme_desenleri(en_fazla_bit):
+    """Bir parça içinde en fazla 'en_fazla_bit' biti çeviren tüm maskeler (0 dahil)."""
+    desenler = [0]
+    for k in range(1, en_fazla_bit + 1):
+        for bitler in combinations(range(_PARCA_BITI), k):
+            desenler.append(sum(1 << b for b in bitler))
+    return desenler
+
+
+def yakin_ciftler(ozetler, esik):
+    """
+    Mesafesi eşik ve altında olan tüm özet çiftlerini bulur: (i, j, mesafe) dizileri, i < j.
+
+    Güvercin yuvası ilkesi: 64 bit 4 parçaya bölündüğünde, toplam en fazla 'esik' bit farklı
+    olan iki özetin en az bir parçası en fazla r = ceil((esik+1)/4) - 1 bit farklıdır.
+    Her parça için sıralı anahtar dizisinde sadece bu küçük komşuluk aranır, adaylar da
+    vektörel popcount ile elenir. O(n²) karşılaştırma yapılmaz.
+    """
+    ozetler = np.asarray(ozetler, dtype=np.uint64)
+    n = len(ozetler)
+    if n < 2:
+        bos = np.array([], dtype=np.int64)
+        return bos, bos, bos
+
+    desenler = _cevirme_desenleri(-(-(esik + 1) // PARCA_SAYISI) - 1)
+    maske = np.uint64((1 << _PARCA_BITI) - 1)
+    sira_no = np.arange(n)
+    bulunan_i, bulunan_j = [], []
+
+    for parca in range(PARCA_SAYISI):
+        anahtar = ((ozetler >> np.uint64(parca * _PARCA_BITI)) & maske).astype(np.int64)
+        sira = np.argsort(anahtar, kind="stable")
+        sirali = anahtar[sira]
+
+        for desen in desenler:
+            aranan = anahtar ^ desen
+            alt = np.searchsorted(sirali, aranan, "left")
+            adet = np.searchsorted(sirali, aranan, "right") - alt
+            toplam = int(adet.sum())
+            if toplam == 0:
+                continue
+
+            # Her i için [alt, ust) aralığındaki tüm j adaylarını tek seferde aç
+            i = np.repeat(sira_no, adet)
+            j = sira[np.repeat(alt - (np.cumsum(adet) - adet), adet) + np.arange(toplam)]
+
+            sec = i < j
+            i, j = i[sec], j[sec]
+            yakin = _hamming_dizi(ozetler[i], ozetler[j]) <= esik
+            bulunan_i.append(i[yakin])
+            bulunan_j.append(j[yakin])
+
+    if not bulunan_i:
+        bos = np.array([], dtype=np.int64)
+        return bos, bos, bos
+
+    # Aynı çift birden fazla parçada bulunabilir: tekilleştir
+    ciftler = np.unique(np.concatenate(bulunan_i).astype(np.int64) * n + np.concatenate(bulunan_j))
+    i, j = np.divmod(ciftler, n)
+    return i, j, _hamming_dizi(ozetler[i], ozetler[j])
+
+# =============================================================================
+# 🧩 BENZER GÖRSEL GRUPLARI
+# =============================================================================
+
+def benzer_gruplar(yollar, esik=BENZERLIK_ESIGI, isci_sayisi=ISCI_SAYISI):
+    """
+    Yeniden dışa aktarılmış (farklı boyut/kalite) aynı fotoğrafları gruplar (pHash mesafesi).
+    Dönüş: [[{"Yol", "pHash", "dHash", "Mesafe"}, ...], ...]  (her grupta en az 2 görsel)
+    """
+    kayitlar = list(ozetleri_hesapla(yollar, isci_sayisi))
+
+    # Birebir aynı özetler doğrudan aynı gruptadır; komşu arama sadece farklı özetlerde yapılır
+    benzersiz, ters = np.unique(np.array([p for _, p, _ in kayitlar], dtype=np.uint64), return_inverse=True)
+
+    # Birleşim-bul (union-find): eşik altındaki her çift aynı gruba düşer
+    ebeveyn = list(range(len(benzersiz)))
+
+    def bul(i):
+        while ebeveyn[i] != i:
+            ebeveyn[i] = ebeveyn[ebeveyn[i]]
+            i = ebeveyn[i]
+        return i
+
+    for i, j in zip(*yakin_ciftler(benzersiz, esik)[:2]):
+        a, b = bul(int(i)), bul(int(j))
+        if a != b:
+            ebeveyn[b] = a
+
+    uyeler = {}
+    for i in range(len(kayitlar)):
+        uyeler.setdefault(bul(int(ters[i])), []).append(i)
+
+    gruplar = []
+    for indeksler in uyeler.values():
+        if len(indeksler) < 2:
+            continue
+        indeksler.sort(key=lambda i: str(kayitlar[i][0]))
+        temsilci = kayitlar[indeksler[0]][1]
+        gruplar.append([
+            {
+                "Yol": str(kayitlar[i][0]),
+                "pHash": f"{kayitlar[i][1]:016x}",
+                "dHash": f"{kayitlar[i][2]:016x}",
+                "Mesafe": hamming(temsilci, kayitlar[i][1]),
+            }
+            for i in indeksler
+        ])
+
+    gruplar.sort(key=lambda g: g[0]["Yol"])
+    return gruplar
@@ -1,10 +1,11 @@
 import pandas as pd
-import shutil
-import os
 import re
 from pathlib import Path
 from tqdm import tqdm
 
+import icerik_indeksi
+import kopya_motoru
+
 # =============================================================================
 # ⚙️ AYARLAR VE SABİTLER
 # =============================================================================
@@ -20,6 +21,22 @@ RAPOR_DOSYASI = "/Volumes/KIOXIA/Güral Seramik/Katalog/Bayi_Paketi_Raporu_v2.x
 # Güvenlik Modu (True = Kopyalamaz, sadece raporlar)
 DRY_RUN = False 
 
+# Mükerrer Görseller
+# True -> Birebir aynı görseller kaynaktan sadece bir kez kopyalanır; paketteki diğer kopyalar
+#         ilk kopyadan çoğaltılır (kaynak diske tekrar gidilmez).
+MUKERRER_TEK_KOPYA = True
+# True -> Mükerrer kopyalar ilk kopyaya hardlink olarak bağlanır (yer kaplamaz; bağlanamazsa çoğaltılır).
+#         Dikkat: Bağlı dosyalardan biri düzenlenirse diğerleri de değişir. Paket sonradan
+#         düzenlenecekse False bırakın.
+MUKERRER_HARDLINK = False
+
+# Kopyalama
+# Görseller ortak kopya motoruyla aktarılır (reflink/clonefile, copy_file_range, sendfile, olmazsa
+# büyük tampon; tarih ve izinler korunur).
+# True -> Paket kaynakla aynı diskteyse görseller kopyalanmaz, kaynağa hardlink olarak bağlanır
+#         (yer kaplamaz). Paket sonradan düzenlenecekse False bırakın.
+KAYNAGA_HARDLINK = False
+
 # Yüzey Haritası (Kısaltmalar)
 SURFACE_MAP = {
     "FULL LAPPATO": "FLP", "LAPPATO": "FLP", "FLP": "FLP",
@@ -193,6 +210,23 @@ class BayiPaketiOlusturucu:
 
         basarili = 0
         hatali = 0
+        mukerrer = 0
+
+        # Birebir aynı içerikleri bul (boyut -> kısmi özet -> tam özet)
+        indeks = icerik_indeksi.IcerikIndeksi()
+        if MUKERRER_TEK_KOPYA and not DRY_RUN:
+            for item in liste:
+                try:
+                    for dosya in Path(item['kaynak']).iterdir():
+                        if dosya.is_file() and dosya.suffix.lower() in ['.jpg', '.jpeg']:
+                            indeks.ekle(dosya)
+                except OSError:
+                    continue
+            grup_sayisi, fazla, _ = indeks.ozet()
+            if fazla:
+                print(f"♊ {grup_sayisi} grupta {fazla} mükerrer görsel bulundu, kaynaktan bir kez kopyalanacak.")
+
+        kopyalanan = {}  # içerik özeti -> paketteki ilk kopya
         
         for item in tqdm(liste, desc="Kopyalanıyor"):
             kaynak = Path(item['kaynak'])
@@ -215,7 +249,15 @@ class BayiPaketiOlusturucu:
                 # Klasör içindeki görselleri kopyala
                 for dosya in kaynak.iterdir():
                     if dosya.is_file() and dosya.suffix.lower() in ['.jpg', '.jpeg']:
-                        shutil.copy2(dosya, hedef / dosya.name)
+                        anahtar = indeks.icerik_anahtari(dosya)
+                        if anahtar in kopyalanan:
+                            self.mukerrer_olustur(kopyalanan[anahtar], hedef / dosya.name)
+                            mukerrer += 1
+                            continue
+
+                        kopya_motoru.kopyala(dosya, hedef / dosya.name, baglanti=KAYNAGA_HARDLINK)
+                        if anahtar:
+                            kopyalanan[anahtar] = hedef / dosya.name
                 
                 basarili += 1
             except Exception as e:
@@ -224,9 +266,16 @@ class BayiPaketiOlusturucu:
 
         if not DRY_RUN:
             print(f"\n🏁 İşlem Tamamlandı. {basarili} ürün kopyalandı, {hatali} hata.")
+            if mukerrer:
+                print(f"♊ {mukerrer} mükerrer görsel kaynaktan tekrar okunmadan pakete eklendi.")
         else:
             print("\n💡 Simülasyon bitti. Gerçek işlem için 'DRY_RUN = False' yapın.")
 
+    @staticmethod
+    def mukerrer_olustur(ilk_kopya, hedef):
+        """Paketteki ilk kopyadan çoğaltır (MUKERRER_HARDLINK açıksa önce hardlink denenir)."""
+        kopya_motoru.kopyala(ilk_kopya, hedef, baglanti=MUKERRER_HARDLINK)
+
 if __name__ == "__main__":
     app = BayiPaketiOlusturucu()
     if app.verileri_yukle():
@@ -0,0 +1,138 @@
+import os
+import json
+from pathlib import Path
+import pandas as pd
+from tqdm import tqdm
+
+import hizli_tarayici
+import jpeg_araclari
+
+# =============================================================================
+# ⚙️ AYARLAR
+# =============================================================================
+
+# Doğrulanacak Arşiv Klasörü
+# (Bunu arayüzden/envanter tarayıcısından gönderdiğinizde otomatik güncellenir, burası varsayılandır)
+HEDEF_KLASOR = Path("/Volumes/KIOXIA/Yeni_Ürün_v2")
+
+# Bozuk/şüpheli görsellerin yazılacağı rapor
+RAPOR_ADI = "Bozuk_Gorseller.xlsx"
+
+# ARTIMLI KONTROL (Gece taramaları için)
+# True  -> Boyutu ve değişiklik zamanı (mtime) önceki kontrolden beri değişmeyen dosyalar tekrar
+#          okunmaz, önceki sonuç kullanılır. Sadece yeni/değişen dosyalar doğrulanır.
+# False -> Her seferinde tüm dosyalar doğrulanır.
+ARTIMLI_KONTROL = True
+ONBELLEK_DOSYASI = "Butunluk_Onbellegi.json"
+
+# Aynı anda doğrulanan dosya sayısı
+ISCI_SAYISI = jpeg_araclari.DOGRULAMA_ISCI_SAYISI
+
+# =============================================================================
+# 🩺 BÜTÜNLÜK DENETİMİ
+# =============================================================================
+
+def onbellek_yukle(dosya=ONBELLEK_DOSYASI):
+    """{yol: [boyut, mtime_ns, durum, neden]}"""
+    try:
+        with open(dosya, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        print(f"⚠️ Bütünlük önbelleği okunamadı, tüm dosyalar doğrulanacak: {e}")
+        return {}
+
+
+def onbellek_kaydet(kayitlar, dosya=ONBELLEK_DOSYASI):
+    gecici = dosya + ".tmp"
+    try:
+        with open(gecici, "w", encoding="utf-8") as f:
+            json.dump(kayitlar, f, ensure_ascii=False)
+        os.replace(gecici, dosya)
+    except OSError as e:
+        print(f"⚠️ Bütünlük önbelleği kaydedilemedi: {e}")
+
+
+def denetle(yollar, rapor_yolu=RAPOR_ADI, artimli=None, isci_sayisi=None):
+    """
+    Görselleri paralel doğrular (bkz. jpeg_araclari.jpeg_butunluk_kontrolu) ve sağlam olmayanları
+    rapora yazar. Dönüş: {"saglam": n, "uyari": n, "bozuk": n, "onbellekten": n}
+    """
+    artimli = ARTIMLI_KONTROL if artimli is None else artimli
+    isci_sayisi = isci_sayisi or ISCI_SAYISI
+    onceki = onbellek_yukle() if artimli else {}
+
+    kayitlar = {}
+    dogrulanacaklar = []
+    for yol in map(str, yollar):
+        try:
+            st = os.stat(yol)
+        except OSError as e:
+            kayitlar[yol] = [0, 0, "bozuk", f"Okunamadı: {e}"]
+            continue
+        kayit = onceki.get(yol)
+        if kayit and kayit[0] == st.st_size and kayit[1] == st.st_mtime_ns:
+            kayitlar[yol] = kayit
+        else:
+            kayitlar[yol] = [st.st_size, st.st_mtime_ns, None, None]
+            dogrulanacaklar.append(yol)
+
+    onbellekten = len(kayitlar) - len(dogrulanacaklar)
+    if onbellekten:
+        print(f"♻️ {onbellekten} görsel değişmemiş, önceki sonuç kullanılacak.")
+
+    sonuclar = jpeg_araclari.butunlugu_dogrula(dogrulanacaklar, isci_sayisi)
+    for yol, durum, neden in tqdm(sonuclar, total=len(dogrulanacaklar), desc="Bütünlük Kontrolü"):
+        kayitlar[yol][2:] = [durum, neden]
+
+    if artimli:
+        onbellek_kaydet(kayitlar)
+
+    ozet = {"saglam": 0, "uyari": 0, "bozuk": 0, "onbellekten": onbellekten}
+    satirlar = []
+    for yol, (boyut, _, durum, neden) in kayitlar.items():
+        ozet[durum] += 1
+        if durum != "saglam":
+            satirlar.append({
+                "Durum": durum.upper(),
+                "Neden": neden,
+                "Dosya": os.path.basename(yol),
+                "Boyut_MB": round(boyut / (1024 * 1024), 2),
+                "Klasor": os.path.dirname(yol),
+                "Yol": yol,
+            })
+
+    print(f"🩺 Sağlam: {ozet['saglam']} | Uyarı: {ozet['uyari']} | Bozuk: {ozet['bozuk']}")
+    if not satirlar:
+        print("✅ Bozuk veya şüpheli görsel bulunamadı.")
+        return ozet
+
+    # Önce bozuklar, sonra uyarılar
+    satirlar.sort(key=lambda s: (s["Durum"] != "BOZUK", s["Yol"]))
+    try:
+        pd.DataFrame(satirlar).to_excel(rapor_yolu, index=False)
+        print(f"💾 Bozuk görsel raporu kaydedildi: {rapor_yolu}")
+    except Exception as e:
+        print(f"❌ Bozuk görsel raporu kaydedilemedi: {e}")
+    return ozet
+
+
+def klasoru_denetle(kok=HEDEF_KLASOR, rapor_yolu=RAPOR_ADI):
+    """Klasör ağacındaki tüm JPEG'leri bulur (paralel tarayıcı) ve doğrular."""
+    print(f"📂 Klasör taranıyor: {kok}...")
+    if not Path(kok).exists():
+        print(f"❌ HATA: '{kok}' klasörü bulunamadı!")
+        return None
+
+    yollar = []
+    for klasor, kayit, _, _ in hizli_tarayici.agaci_gez(kok):
+        yollar.extend(os.path.join(klasor, ad) for ad, _ in kayit.get("gorseller", []))
+    print(f"🔍 {len(yollar)} görsel doğrulanacak.")
+    return denetle(yollar, rapor_yolu)
+
+# =============================================================================
+# 🚀 ÇALIŞTIRMA
+# =============================================================================
+if __name__ == "__main__":
+    klasoru_denetle(HEDEF_KLASOR)
@@ -0,0 +1,176 @@
+import io
+import hashlib
+from PIL import Image
+
+try:
+    from PIL import ImageCms
+except ImportError:
+    ImageCms = None
+
+# =============================================================================
+# ⚙️ AYARLAR
+# =============================================================================
+
+# Kullanılabilir çıktı biçimleri. Yeni bir biçim eklemek için buraya bir kayıt eklemek yeterlidir:
+#   format : Pillow'un kayıt (save) biçim adı
+#   uzanti : Çıktı dosyasının uzantısı
+#   modlar : Renk dönüşümü yapılmadan (ICC profili olduğu gibi) yazılabilen PIL modları
+#   ayarlar: Kalite dışındaki sabit kodlayıcı parametreleri
+#   eklenti: Biçim Pillow'da yerleşik değilse denenecek eklenti modülü (örn. eski sürümlerde AVIF)
+KODLAYICILAR = {
+    "jpeg": {"format": "JPEG", "uzanti": ".jpg", "modlar": {"L", "RGB", "CMYK"},
+             "ayarlar": {"optimize": True}},
+    "webp": {"format": "WEBP", "uzanti": ".webp", "modlar": {"RGB", "RGBA"},
+             "ayarlar": {"method": 4}},
+    "avif": {"format": "AVIF", "uzanti": ".avif", "modlar": {"RGB", "RGBA"},
+             "ayarlar": {"speed": 6}, "eklenti": "pillow_avif"},
+}
+VARSAYILAN_BICIM = "jpeg"
+
+# Renk dönüşümünde kullanılan amaç (rendering intent): 0 = algısal, 1 = göreli kolorimetrik
+DONUSUM_NIYETI = 0
+
+# Kaynağın modu çıktı biçiminde yazılamıyorsa (örn. CMYK -> WebP) görsel bu profile dönüştürülür
+_SRGB_PROFILI = None
+_SRGB_BAYTLARI = None
+
+# Süreç içi önbellekler: ICC özeti (+modlar) -> hazır dönüşüm, dosya yolu -> profil baytları.
+# Aynı profili taşıyan binlerce görselde dönüşüm her süreçte bir kez kurulur.
+_DONUSUMLER = {}
+_PROFIL_DOSYALARI = {}
+
+# =============================================================================
+# 🧩 KODLAYICI YARDIMCILARI
+# =============================================================================
+
+def destekleniyor_mu(bicim):
+    """Biçim tanımlı ve bu Pillow kurulumunda yazılabiliyor mu? (Gerekirse eklentisini yükler.)"""
+    tanim = KODLAYICILAR.get(bicim)
+    if tanim is None:
+        return False
+    if tanim.get("eklenti"):
+        try:
+            __import__(tanim["eklenti"])
+        except ImportError:
+            pass
+    Image.init()
+    return tanim["format"] in Image.SAVE
+
+
+def uzanti(bicim):
+    return KODLAYICILAR[bicim]["uzanti"]
+
+
+def dosya_adi(ad, bicim):
+    """
+    Çıktı dosya adı: JPEG'de orijinal ad (ve .JPG/.jpeg yazımı) korunur,
+    diğer biçimlerde uzantı biçime göre değişir.
+    """
+    ad = str(ad)
+    kok, nokta, mevcut = ad.rpartition(".")
+    if bicim == VARSAYILAN_BICIM and nokta and mevcut.lower() in ("jpg", "jpeg"):
+        return ad
+    return (kok if nokta else ad) + uzanti(bicim)
+
+
+def _srgb_profili():
+    global _SRGB_PROFILI, _SRGB_BAYTLARI
+    if _SRGB_PROFILI is None:
+        _SRGB_PROFILI = ImageCms.ImageCmsProfile(ImageCms.createProfile("sRGB"))
+        _SRGB_BAYTLARI = _SRGB_PROFILI.tobytes()
+    return _SRGB_PROFILI
+
+# =============================================================================
+# 🎨 RENK YÖNETİMİ (Önbellekli ICC dönüşümleri)
+# =============================================================================
+
+def profil_dosyasi_oku(yol):
+    """ICC dosyasını süreç başına bir kez okur; okunamazsa None (uyarı bir kez basılır)."""
+    if yol not in _PROFIL_DOSYALARI:
+        try:
+            with open(yol, "rb") as f:
+                _PROFIL_DOSYALARI[yol] = f.read()
+        except OSError as e:
+            print(f"⚠️ ICC profili okunamadı, yok sayılacak: {yol} -> {e}")
+            _PROFIL_DOSYALARI[yol] = None
+    return _PROFIL_DOSYALARI[yol]
+
+
+def _donusum(icc_profile, giris_modu, cikis_modu):
+    """
+    Gömülü profilden sRGB'ye dönüşümü önbellekten verir, yoksa bir kez kurar.
+    Anahtar profilin içeriğidir (özeti), dosya/görsel değil; bozuk profil de (None olarak) önbelleğe alınır.
+    """
+    anahtar = (hashlib.blake2b(icc_profile, digest_size=16).digest(), giris_modu, cikis_modu)
+    donusum = _DONUSUMLER.get(anahtar, False)
+    if donusum is False:
+        try:
+            kaynak_profil = ImageCms.ImageCmsProfile(io.BytesIO(icc_profile))
+            donusum = ImageCms.buildTransform(kaynak_profil, _srgb_profili(), giris_modu, cikis_modu,
+                                              renderingIntent=DONUSUM_NIYETI)
+        except (ImageCms.PyCMSError, OSError, ValueError):
+            donusum = None
+        _DONUSUMLER[anahtar] = donusum
+    return donusum
+
+
+def srgb_donustur(img, icc_profile=None, hedef_mod="RGB"):
+    """
+    Görseli (CMYK, gri, RGB) gömülü ICC profiliyle renk yönetimli olarak sRGB'ye çevirir.
+    Dönüş: (görsel, sRGB profil baytları)
+    Profil yoksa, okunamıyorsa veya littlecms kurulu değilse basit dönüşüm yapılır: (görsel, None)
+    """
+    donusum = None
+    if icc_profile and ImageCms is not None:
+        donusum = _donusum(icc_profile, img.mode, hedef_mod)
+    if donusum is None:
+        return img.convert(hedef_mod), None
+    return ImageCms.applyTransform(img, donusum), _SRGB_BAYTLARI
+
+def exif_kucuk_resimsiz(img):
+    """
+    Görselin EXIF baytlarını gömülü küçük resim (IFD1 / thumbnail) olmadan döner; EXIF yoksa None.
+    (Pillow yeniden yazarken sadece IFD0 ve Exif/GPS alt dizinlerini yazar.)
+    """
+    if "exif" not in img.info:
+        return None
+    try:
+        exif = img.getexif()
+        return exif.tobytes() if len(exif) else None
+    except Exception:
+        return None
+
+# =============================================================================
+# 🖼 KODLAMA
+# =============================================================================
+
+
+def hazirla(img, bicim, icc_profile=None):
+    """
+    Görseli biçime uygun hale getirir (her seviye için bir kez, kalite denemelerinden önce).
+    Dönüş: (görsel, save_kwargs)
+
+    Mod biçimde destekleniyorsa görsele dokunulmaz, ICC profili aynen eklenir (JPEG yolundaki gibi).
+    Desteklenmiyorsa (CMYK/gri -> WebP/AVIF) renkler ICC profiliyle sRGB'ye dönüştürülür ve
+    sRGB profili gömülür; böylece yanlış profil taşıyan (renkleri kaymış) dosya üretilmez.
+    """
+    tanim = KODLAYICILAR[bicim]
+    save_kwargs = dict(tanim["ayarlar"])
+    if img.mode not in tanim["modlar"]:
+        # Profil yoksa basit dönüşüm yapılır; kaynak profili o durumda artık geçersizdir
+        hedef_mod = "RGBA" if "A" in img.getbands() and "RGBA" in tanim["modlar"] else "RGB"
+        img, icc_profile = srgb_donustur(img, icc_profile, hedef_mod)
+    if icc_profile:
+        save_kwargs["icc_profile"] = icc_profile
+    return img, save_kwargs
+
+
+def kodla(img, bicim, kalite, save_kwargs):
+    """Görseli verilen biçim ve kalitede bellekte kodlar, baytları döner."""
+    tanim = KODLAYICILAR[bicim]
+    if tanim["format"] not in Image.SAVE:
+        # Yeni açılan işçi süreçte eklenti henüz yüklenmemiş olabilir
+        destekleniyor_mu(bicim)
+    tampon = io.BytesIO()
+    img.save(tampon, tanim["format"], quality=kalite, **save_kwargs)
+    return tampon.getvalue()
@@ -1,8 +1,15 @@
 import pandas as pd
 import os
+import json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from tqdm import tqdm
 
+import hizli_tarayici
+import icerik_indeksi
+import jpeg_araclari
+
 # =============================================================================
 # ⚙️ AYARLAR
 # =============================================================================
@@ -14,13 +21,108 @@ HEDEF_KLASOR = Path("/Volumes/KIOXIA/Yeni_Ürün_v2")
 # Çıktı Excel Dosyasının Adı
 RAPOR_ADI = "Guncel_Disk_Envanteri.xlsx"
 
+# ARTIMLI TARAMA
+# True  -> Sadece değişiklik zamanı (mtime) değişen klasörler yeniden listelenir,
+#          değişmeyenlerin sayıları önceki taramadan (snapshot) alınır.
+# False -> Her seferinde tüm ağaç baştan taranır.
+# NOT: Klasör mtime'ı dosya eklenince/silinince/adı değişince güncellenir. Mevcut bir
+#      dosyanın içeriği yerinde değiştirilirse yakalanmaz; şüphede False ile tam tarama yapın.
+ARTIMLI_TARAMA = True
+
+# Klasör anlık görüntüsünün (mtime, girdi sayısı, görsel istatistikleri) saklandığı dosya
+SNAPSHOT_DOSYASI = "Envanter_Snapshot.json"
+
+# Kayıt yapısı değiştiğinde artırılır; eski sürüm snapshot'lar yok sayılır (tam tarama)
+SNAPSHOT_SURUMU = 3
+
+# Aynı anda listelenecek klasör sayısı (paralel tarama)
+ISCI_SAYISI = hizli_tarayici.VARSAYILAN_ISCI_SAYISI
+
+# AKIŞ (STREAMING) MODU
+# True  -> Klasör kayıtları tarayıcıdan doğrudan Excel'e satır satır yazılır (openpyxl write_only).
+#          Bellek kullanımı arşiv büyüdükçe artmaz (milyonlarca dosya için).
+#          Bu modda snapshot tutulmaz, her seferinde tam tarama yapılır.
+#          Mükerrer / benzer / bütünlük analizleri açıksa bu modda da çalışır, ancak onlar için
+#          görsel listesi (yol ve boyut) bellekte tutulur.
+# False -> Tüm kayıtlar toplanır, DataFrame'e çevrilip tek seferde yazılır.
+AKIS_MODU = False
+
+# PİKSEL BOYUTU ANALİZİ (Sadece JPEG başlığı okunur, görsel açılmaz)
+# True -> Her klasör için min/max kısa kenar, boyutlandırılması gereken ve CMYK görsel sayısı eklenir.
+BASLIK_ANALIZI = True
+
+# Kısa kenarı bundan büyük görseller "boyutlandırılacak" sayılır
+# (main_optimizer.STANDART_KISA_KENAR ile aynı tutulmalı)
+KISA_KENAR_ESIGI = 1000
+
+# MÜKERRER GÖRSEL ANALİZİ
+# True -> Tarama sonunda birebir aynı (bayt bayt) görseller bulunur ve ayrı bir rapora yazılır.
+#         Sadece aynı boyuttaki dosyalar okunur; önce kısmi, çakışırsa tam özet alınır.
+MUKERRER_ANALIZI = False
+
+# Mükerrer raporu envanter dosyasının yanına yazılır
+MUKERRER_RAPOR_ADI = "Mukerrer_Gorseller.xlsx"
+
+# BENZER GÖRSEL ANALİZİ (Algısal Özet)
+# True -> Farklı boyut/kalitede yeniden dışa aktarılmış aynı fotoğraflar pHash/dHash ile bulunur.
+#         Görseller küçültülmüş (draft) okunur; komşu arama çoklu indeksle (multi-index hashing) yapılır.
+# Not: 'numpy' ve 'Pillow' gerektirir.
+BENZER_ANALIZI = False
+
+# Benzer görsel raporu envanter dosyasının yanına yazılır
+BENZER_RAPOR_ADI = "Benzer_Gorseller.xlsx"
+
+# BÜTÜNLÜK ANALİZİ (Bozuk / yarım kopyalanmış görseller)
+# True -> Tarama sonunda her görselin JPEG yapısı (SOI/segmentler/EOI) mmap ile doğrulanır,
+#         sadece şüpheli olanlar tam çözülür. Bozuk ve şüpheli görseller ayrı bir rapora yazılır.
+#         Değişmeyen dosyalar tekrar okunmaz (bkz. butunluk_denetcisi.ARTIMLI_KONTROL).
+BUTUNLUK_ANALIZI = False
+
+# Bozuk görsel raporu envanter dosyasının yanına yazılır
+BUTUNLUK_RAPOR_ADI = "Bozuk_Gorseller.xlsx"
+
+# Excel Sütun Sıralaması
+SUTUN_SIRASI = ["Kaynak", "Orijinal_Ad", "Ebat", "Yuzey", "KEY", "Gorsel_Sayisi", "Toplam_Boyut_MB", "Ortalama_Gorsel_MB",
+                "Min_Kisa_Kenar_PX", "Max_Kisa_Kenar_PX", "Boyutlandirilacak_Gorsel", "CMYK_Gorsel", "Yol"]
+
 # =============================================================================
 # 🛠 YARDIMCI SINIFLAR
 # =============================================================================
 
+class AkisExcelYazici:
+    """
+    Satırları bellekte tablo tutmadan Excel'e yazar. openpyxl'in 'write_only' modu her
+    satırı eklendiği anda geçici dosyaya akıtır; ayrıca tampon tutulmaz.
+    """
+    def __init__(self, dosya_adi, sutunlar):
+        from openpyxl import Workbook
+
+        self.dosya_adi = dosya_adi
+        self.sutunlar = sutunlar
+        self.satir_sayisi = 0
+
+        self.kitap = Workbook(write_only=True)
+        self.sayfa = self.kitap.create_sheet("Sheet1")
+        self.sayfa.append(sutunlar)
+
+    def ekle(self, satir):
+        """Bir satırı (sözlük) sütun sırasıyla yazar."""
+        self.sayfa.append([satir.get(col) for col in self.sutunlar])
+        self.satir_sayisi += 1
+
+    def kapat(self):
+        self.kitap.save(self.dosya_adi)
+
+
 class EnvanterTarayici:
-    def __init__(self, root_path):
+    def __init__(self, root_path, artimli=None, akis=None, mukerrer=None, benzer=None, baslik=None, butunluk=None):
         self.root_path = Path(root_path)
+        self.artimli = ARTIMLI_TARAMA if artimli is None else artimli
+        self.akis = AKIS_MODU if akis is None else akis
+        self.mukerrer = MUKERRER_ANALIZI if mukerrer is None else mukerrer
+        self.benzer = BENZER_ANALIZI if benzer is None else benzer
+        self.baslik = BASLIK_ANALIZI if baslik is None else baslik
+        self.butunluk = BUTUNLUK_ANALIZI if butunluk is None else butunluk
         
     def smart_parse_path(self, path_obj):
         """
@@ -52,33 +154,187 @@ class EnvanterTarayici:
         except:
             return "UNKNOWN_KEY"
 
-    def calculate_folder_stats(self, files_in_folder):
+    # --- ARTIMLI TARAMA (SNAPSHOT) ---
+
+    def snapshot_yukle(self):
         """
-        Klasördeki dosyaların toplam boyutunu ve görsel sayısını hesaplar.
-        Geriye (Görsel Sayısı, Toplam MB, Ortalama MB) döner.
+        Önceki taramanın klasör anlık görüntüsünü okur.
+        Dosya yoksa, bozuksa veya başka bir kök klasöre aitse boş sözlük döner.
         """
         try:
-            total_bytes = 0
-            image_count = 0
-            
-            for f in files_in_folder:
-                # Sadece görsel dosyalarının boyutunu topla
-                if f.suffix.lower() in ['.jpg', '.jpeg']:
-                    total_bytes += f.stat().st_size
-                    image_count += 1
-            
-            # Byte -> Megabyte dönüşümü (2 ondalık basamak)
-            total_mb = round(total_bytes / (1024 * 1024), 2)
-            
-            # Ortalama Boyut Hesabı (Sıfıra bölünme hatasını önle)
-            avg_mb = 0.0
-            if image_count > 0:
-                avg_mb = round(total_mb / image_count, 2)
-                
-            return image_count, total_mb, avg_mb
-            
-        except Exception:
-            return 0, 0.0, 0.0
+            with open(SNAPSHOT_DOSYASI, "r", encoding="utf-8") as f:
+                veri = json.load(f)
+            if veri.get("kok") != str(self.root_path) or veri.get("surum") != SNAPSHOT_SURUMU:
+                return {}
+            return veri.get("klasorler", {})
+        except (OSError, ValueError):
+            return {}
+
+    def snapshot_kaydet(self, klasorler):
+        """Klasör anlık görüntüsünü bir sonraki artımlı tarama için diske yazar."""
+        try:
+            gecici = SNAPSHOT_DOSYASI + ".tmp"
+            with open(gecici, "w", encoding="utf-8") as f:
+                json.dump({"surum": SNAPSHOT_SURUMU, "kok": str(self.root_path), "klasorler": klasorler}, f, ensure_ascii=False)
+            os.replace(gecici, SNAPSHOT_DOSYASI)
+        except OSError as e:
+            print(f"⚠️ Snapshot kaydedilemedi: {e}")
+
+    def agaci_tara(self, onceki):
+        """
+        Kök klasörden başlayarak tüm ağacı paralel gezer (hizli_tarayici) ve yeni snapshot'ı döner.
+        Değişmeyen klasörlerin alt klasör listesi de önbellekten alınır; alt klasörlerin
+        kendileri ise ayrıca kontrol edilir (alt klasördeki değişiklik üst klasörün mtime'ını değiştirmez).
+        """
+        yeni = {}
+        degisen = 0
+        baslik_gorevleri = []
+
+        with ThreadPoolExecutor(max_workers=ISCI_SAYISI) as havuz, \
+                tqdm(desc="Envanter Çıkarılıyor", unit=" klasör") as bar:
+            for klasor, kayit, onbellekten, _ in hizli_tarayici.agaci_gez(
+                    self.root_path, onceki, isci_sayisi=ISCI_SAYISI):
+                yeni[klasor] = kayit
+                if not onbellekten:
+                    degisen += 1
+                # Başlık okuma gezintiyle eş zamanlı, ayrı havuzda yürür
+                if self.baslik_gerekli_mi(kayit):
+                    baslik_gorevleri.append(havuz.submit(self.klasor_basliklari, klasor, kayit))
+                bar.update(1)
+
+            for gorev in baslik_gorevleri:
+                gorev.result()
+
+        # Paralel gezinti tamamlanma sırasıyla döner; rapor için yol sırasına diz
+        return dict(sorted(yeni.items())), degisen
+
+    def baslik_gerekli_mi(self, kayit):
+        """Klasörde görsel var ve başlık özeti henüz çıkarılmamışsa True."""
+        return self.baslik and kayit["gorsel_sayisi"] > 0 and "boyutlandirilacak" not in kayit
+
+    def klasor_basliklari(self, klasor, kayit):
+        """
+        Klasördeki görsellerin sadece JPEG başlıklarını okur (decode yok) ve kayda
+        kısa kenar özetini ekler: min/max kısa kenar, boyutlandırılacak ve CMYK görsel sayısı.
+        """
+        kisa_kenarlar = []
+        cmyk = 0
+        for ad, _ in kayit.get("gorseller", []):
+            baslik = jpeg_araclari.jpeg_baslik_oku(os.path.join(klasor, ad))
+            if baslik is None:
+                continue
+            genislik, yukseklik, bilesen = baslik
+            kisa_kenarlar.append(min(genislik, yukseklik))
+            if bilesen == 4:
+                cmyk += 1
+
+        kayit["min_kisa_kenar"] = min(kisa_kenarlar) if kisa_kenarlar else None
+        kayit["max_kisa_kenar"] = max(kisa_kenarlar) if kisa_kenarlar else None
+        kayit["boyutlandirilacak"] = sum(1 for k in kisa_kenarlar if k > KISA_KENAR_ESIGI)
+        kayit["cmyk"] = cmyk
+        return kayit
+
+    def envanter_satiri(self, path_obj, kayit):
+        """Tek bir ürün klasörü için Excel satırını (sözlük) oluşturur."""
+        gorsel_sayisi = kayit["gorsel_sayisi"]
+        toplam_bytes = kayit["toplam_bytes"]
+        toplam_boyut_mb = round(toplam_bytes / (1024 * 1024), 2)
+        ortalama_mb = round(toplam_boyut_mb / gorsel_sayisi, 2) if gorsel_sayisi > 0 else 0.0
+
+        # Yol bilgisinden ürün detaylarını ayrıştır
+        urun_adi, ebat, yuzey = self.smart_parse_path(path_obj)
+
+        # Eğer yapı beklediğimiz gibi değilse "Düzensiz" olarak kaydet
+        if not urun_adi:
+            urun_adi = path_obj.name
+            ebat = "BİLİNMİYOR"
+            yuzey = "BİLİNMİYOR"
+
+        return {
+            "Kaynak": "Fiziksel_Disk",
+            "Orijinal_Ad": urun_adi,
+            "Ebat": ebat,
+            "Yuzey": yuzey,
+            "KEY": self.create_key(urun_adi, ebat, yuzey),
+            "Gorsel_Sayisi": gorsel_sayisi,
+            "Toplam_Boyut_MB": toplam_boyut_mb,
+            "Ortalama_Gorsel_MB": ortalama_mb,
+            "Min_Kisa_Kenar_PX": kayit.get("min_kisa_kenar"),
+            "Max_Kisa_Kenar_PX": kayit.get("max_kisa_kenar"),
+            "Boyutlandirilacak_Gorsel": kayit.get("boyutlandirilacak"),
+            "CMYK_Gorsel": kayit.get("cmyk"),
+            "Yol": str(path_obj)
+        }
+
+    def _akis_satiri(self, klasor, kayit):
+        if self.baslik_gerekli_mi(kayit):
+            self.klasor_basliklari(klasor, kayit)
+        return self.envanter_satiri(Path(klasor), kayit)
+
+    def ek_analiz_var_mi(self):
+        return self.mukerrer or self.benzer or self.butunluk
+
+    def envanter_akisi(self, gorsel_listesi=None):
+        """
+        Tarayıcıdan gelen klasörleri anında Excel satırına çeviren generator.
+        Hiçbir liste biriktirmez; başlık okuması için havuzda bekleyen iş sayısı da sınırlıdır.
+        gorsel_listesi (sözlük) verilirse ek analizler için her klasörün görsel listesi oraya eklenir.
+        """
+        sinir = ISCI_SAYISI * 4
+        with ThreadPoolExecutor(max_workers=ISCI_SAYISI) as havuz:
+            bekleyenler = deque()
+            for klasor, kayit, _, _ in hizli_tarayici.agaci_gez(self.root_path, isci_sayisi=ISCI_SAYISI):
+                if kayit["gorsel_sayisi"] > 0:
+                    if gorsel_listesi is not None:
+                        gorsel_listesi[klasor] = {"gorseller": kayit["gorseller"]}
+                    bekleyenler.append(havuz.submit(self._akis_satiri, klasor, kayit))
+                    while len(bekleyenler) > sinir:
+                        yield bekleyenler.popleft().result()
+            while bekleyenler:
+                yield bekleyenler.popleft().result()
+
+    def tara_ve_raporla_akis(self):
+        """
+        Akış modu: Kayıtlar tarama ilerledikçe Excel'e yazılır (sabit bellek).
+        Ek analizler (mükerrer / benzer / bütünlük) açıksa tarama sonunda onlar da raporlanır.
+        """
+        print("🌊 Akış modu: Kayıtlar tarama ilerledikçe Excel'e yazılacak.")
+
+        try:
+            yazici = AkisExcelYazici(RAPOR_ADI, SUTUN_SIRASI)
+        except ImportError:
+            print("❌ HATA: Akış modu için 'openpyxl' kütüphanesi gerekli. (pip install openpyxl)")
+            return
+
+        gorsel_listesi = None
+        if self.ek_analiz_var_mi():
+            print("ℹ️ Ek analizler açık: görsel listesi (yol, boyut) bu analizler için bellekte tutulacak.")
+            gorsel_listesi = {}
+
+        toplam_gorsel = 0
+        with tqdm(desc="Envanter Çıkarılıyor", unit=" ürün") as bar:
+            for satir in self.envanter_akisi(gorsel_listesi):
+                yazici.ekle(satir)
+                toplam_gorsel += satir["Gorsel_Sayisi"]
+                bar.update(1)
+                bar.set_postfix(gorsel=toplam_gorsel)
+
+        if yazici.satir_sayisi == 0:
+            print("⚠️ HİÇBİR ÜRÜN BULUNAMADI! Klasör boş olabilir mi?")
+            return
+
+        print(f"\n✅ Tarama Tamamlandı. Toplam {yazici.satir_sayisi} ürün, {toplam_gorsel} görsel bulundu.")
+        print(f"💾 Excel kaydediliyor: {RAPOR_ADI}")
+
+        try:
+            yazici.kapat()
+            print("🎉 İŞLEM BAŞARILI!")
+        except Exception as e:
+            print(f"❌ Excel kaydetme hatası: {e}")
+            print("Dosya açık olabilir, kapatıp tekrar deneyin.")
+
+        if gorsel_listesi:
+            self.ek_raporlar(dict(sorted(gorsel_listesi.items())))
 
     def tara_ve_raporla(self):
         print(f"📂 Klasör taranıyor: {self.root_path}...")
@@ -87,48 +343,115 @@ class EnvanterTarayici:
             print(f"❌ HATA: '{self.root_path}' klasörü bulunamadı!")
             return
 
-        envanter_verisi = []
-        
-        # Tüm klasör ağacını gez
-        tum_klasorler = list(os.walk(self.root_path))
-        
-        print(f"🧠 Toplam {len(tum_klasorler)} alt klasör analiz ediliyor...")
+        if self.akis:
+            return self.tara_ve_raporla_akis()
 
-        for root, dirs, files in tqdm(tum_klasorler, desc="Envanter Çıkarılıyor"):
-            path_obj = Path(root)
-            
-            # Pathlib nesnelerine dönüştür
-            path_files = [path_obj / f for f in files]
-            
-            # İstatistikleri Hesapla (Sayi, Toplam Boyut, Ortalama Boyut)
-            gorsel_sayisi, toplam_boyut_mb, ortalama_mb = self.calculate_folder_stats(path_files)
-            
+        onceki = self.snapshot_yukle() if self.artimli else {}
+        if onceki:
+            print(f"♻️ Artımlı tarama: {len(onceki)} klasörlük önceki snapshot kullanılıyor.")
+
+        # Tüm klasör ağacını gez (değişmeyen klasörler önbellekten gelir)
+        klasorler, degisen = self.agaci_tara(onceki)
+        print(f"🧠 Toplam {len(klasorler)} klasör incelendi, {degisen} tanesi yeniden listelendi.")
+
+        self.snapshot_kaydet(klasorler)
+        self.raporu_yaz(klasorler)
+        self.ek_raporlar(klasorler)
+
+    def ek_raporlar(self, klasorler):
+        """Açık olan ek analizleri ({yol: {"gorseller": ...}} kayıtlarıyla) çalıştırır."""
+        if self.mukerrer:
+            self.mukerrerleri_raporla(klasorler)
+
+        if self.benzer:
+            self.benzerleri_raporla(klasorler)
+
+        if self.butunluk:
+            self.bozuklari_raporla(klasorler)
+
+    def mukerrerleri_raporla(self, klasorler):
+        """
+        Taramada toplanan dosya boyutlarıyla içerik indeksini kurar ve
+        birebir aynı görsel gruplarını envanterin yanına Excel olarak yazar.
+        """
+        print("\n🔍 Mükerrer görseller aranıyor...")
+        indeks = icerik_indeksi.IcerikIndeksi()
+        for klasor, kayit in klasorler.items():
+            for ad, boyut in kayit.get("gorseller", []):
+                indeks.ekle(os.path.join(klasor, ad), boyut)
+
+        grup_sayisi, fazla, bosa_mb = indeks.ozet()
+        if grup_sayisi == 0:
+            print("✅ Birebir aynı görsel bulunamadı.")
+            return
+
+        print(f"♊ {grup_sayisi} grupta {fazla} fazladan kopya bulundu ({bosa_mb} MB).")
+        rapor_yolu = Path(RAPOR_ADI).with_name(MUKERRER_RAPOR_ADI)
+        try:
+            pd.DataFrame(list(indeks.rapor_satirlari())).to_excel(rapor_yolu, index=False)
+            print(f"💾 Mükerrer raporu kaydedildi: {rapor_yolu}")
+        except Exception as e:
+            print(f"❌ Mükerrer raporu kaydedilemedi: {e}")
+
+    def benzerleri_raporla(self, klasorler):
+        """
+        Algısal özetlerle (pHash) birbirine çok benzeyen görselleri gruplar ve
+        envanterin yanına Excel olarak yazar.
+        """
+        try:
+            import algisal_ozet
+        except ImportError:
+            print("❌ HATA: Benzer görsel analizi için 'numpy' ve 'Pillow' gerekli.")
+            return
+
+        yollar = [
+            os.path.join(klasor, ad)
+            for klasor, kayit in klasorler.items()
+            for ad, _ in kayit.get("gorseller", [])
+        ]
+        print(f"\n🔍 {len(yollar)} görsel için algısal özet hesaplanıyor...")
+        gruplar = algisal_ozet.benzer_gruplar(yollar)
+
+        if not gruplar:
+            print("✅ Birbirine benzeyen görsel grubu bulunamadı.")
+            return
+
+        satirlar = []
+        for no, grup in enumerate(gruplar, start=1):
+            for uye in grup:
+                satirlar.append({"Grup_No": no, "Grup_Adedi": len(grup), **uye})
+
+        print(f"🖼 {len(gruplar)} benzer görsel grubu bulundu ({len(satirlar)} görsel).")
+        rapor_yolu = Path(RAPOR_ADI).with_name(BENZER_RAPOR_ADI)
+        try:
+            pd.DataFrame(satirlar).to_excel(rapor_yolu, index=False)
+            print(f"💾 Benzer görsel raporu kaydedildi: {rapor_yolu}")
+        except Exception as e:
+            print(f"❌ Benzer görsel raporu kaydedilemedi: {e}")
+
+    def bozuklari_raporla(self, klasorler):
+        """
+        Taramada bulunan görsellerin bütünlüğünü paralel doğrular ve bozuk/şüpheli
+        olanları envanterin yanına Excel olarak yazar.
+        """
+        import butunluk_denetcisi
+
+        yollar = [
+            os.path.join(klasor, ad)
+            for klasor, kayit in klasorler.items()
+            for ad, _ in kayit.get("gorseller", [])
+        ]
+        print(f"\n🩺 {len(yollar)} görselin bütünlüğü kontrol ediliyor...")
+        rapor_yolu = Path(RAPOR_ADI).with_name(BUTUNLUK_RAPOR_ADI)
+        butunluk_denetcisi.denetle(yollar, rapor_yolu)
+
+    def raporu_yaz(self, klasorler):
+        """Klasör kayıtlarından ({yol: kayit}) envanter Excel'ini oluşturur."""
+        envanter_verisi = []
+        for klasor, kayit in klasorler.items():
             # Eğer klasörde görsel varsa listeye ekle
-            if gorsel_sayisi > 0:
-                # Yol bilgisinden ürün detaylarını ayrıştır
-                urun_adi, ebat, yuzey = self.smart_parse_path(path_obj)
-                
-                # Eğer yapı beklediğimiz gibi değilse "Düzensiz" olarak kaydet
-                if not urun_adi: 
-                    urun_adi = path_obj.name
-                    ebat = "BİLİNMİYOR"
-                    yuzey = "BİLİNMİYOR"
-
-                # Key oluştur
-                key = self.create_key(urun_adi, ebat, yuzey)
-
-                # Listeye ekle
-                envanter_verisi.append({
-                    "Kaynak": "Fiziksel_Disk",
-                    "Orijinal_Ad": urun_adi,
-                    "Ebat": ebat,
-                    "Yuzey": yuzey,
-                    "KEY": key,
-                    "Gorsel_Sayisi": gorsel_sayisi,
-                    "Toplam_Boyut_MB": toplam_boyut_mb,
-                    "Ortalama_Gorsel_MB": ortalama_mb,  # YENİ SÜTUN
-                    "Yol": str(path_obj)
-                })
+            if kayit["gorsel_sayisi"] > 0:
+                envanter_verisi.append(self.envanter_satiri(Path(klasor), kayit))
 
         # --- RAPOR OLUŞTURMA ---
         if not envanter_verisi:
@@ -137,11 +460,8 @@ class EnvanterTarayici:
 
         df = pd.DataFrame(envanter_verisi)
         
-        # Sütun Sıralaması
-        sutun_sirasi = ["Kaynak", "Orijinal_Ad", "Ebat", "Yuzey", "KEY", "Gorsel_Sayisi", "Toplam_Boyut_MB", "Ortalama_Gorsel_MB", "Yol"]
-        
         # Mevcut sütunları koruyarak sırala
-        mevcut_sutunlar = [col for col in sutun_sirasi if col in df.columns]
+        mevcut_sutunlar = [col for col in SUTUN_SIRASI if col in df.columns]
         df = df[mevcut_sutunlar]
 
         print(f"\n✅ Tarama Tamamlandı. Toplam {len(df)} ürün bulundu.")
@@ -0,0 +1,238 @@
+import os
+import time
+import threading
+
+import disk_envanter_guncelleyici
+import hizli_tarayici
+
+# Dosya sistemi olayları için opsiyonel kütüphane (Linux: inotify, macOS: FSEvents)
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    WATCHDOG_VAR = True
+except ImportError:
+    WATCHDOG_VAR = False
+
+# =============================================================================
+# ⚙️ AYARLAR
+# =============================================================================
+
+# Olay sistemi yoksa klasör mtime'larının kaç saniyede bir kontrol edileceği
+YOKLAMA_ARALIGI_SN = 30
+
+# Son olaydan sonra bu kadar sessizlik olunca değişiklikler işlenip rapor yazılır
+# (Toplu kopyalamalarda her dosya için ayrı ayrı Excel yazılmasını önler)
+YAZMA_GECIKMESI_SN = 5
+
+# =============================================================================
+# 👁️ CANLI ENVANTER İZLEYİCİ
+# =============================================================================
+
+if WATCHDOG_VAR:
+    class _OlayYakalayici(FileSystemEventHandler):
+        """Gelen her olayı, etkilenen klasörü 'kirli' olarak işaretlemeye çevirir."""
+        def __init__(self, izleyici):
+            super().__init__()
+            self.izleyici = izleyici
+
+        def on_any_event(self, olay):
+            self.izleyici.isaretle(olay.src_path, olay.is_directory)
+            hedef = getattr(olay, "dest_path", None)
+            if hedef:
+                self.izleyici.isaretle(hedef, olay.is_directory)
+
+
+def _ayni_mi(eski, yeni):
+    """İki klasör kaydı, mtime dışında aynıysa True (rapor değişmez, Excel yeniden yazılmaz)."""
+    if eski is None:
+        return False
+    return ({k: v for k, v in eski.items() if k != "mtime_ns"} ==
+            {k: v for k, v in yeni.items() if k != "mtime_ns"})
+
+
+class EnvanterIzleyici:
+    """
+    EnvanterTarayici için sürekli çalışan izleme modu.
+    Kaynak klasördeki değişiklikleri olaylarla (watchdog) ya da periyodik mtime
+    yoklamasıyla yakalar ve sadece etkilenen klasörlerin kayıtlarını günceller.
+    Tam tarama sadece başlangıçta (snapshot ile artımlı) yapılır.
+    """
+    def __init__(self, tarayici, yoklama_araligi=YOKLAMA_ARALIGI_SN, yazma_gecikmesi=YAZMA_GECIKMESI_SN):
+        self.tarayici = tarayici
+        self.kok = str(tarayici.root_path)
+        self.yoklama_araligi = yoklama_araligi
+        self.yazma_gecikmesi = yazma_gecikmesi
+
+        self.klasorler = {}
+        self.kirli = set()
+        self.son_olay = 0.0
+        self.kilit = threading.Lock()
+        self.dur = threading.Event()
+
+    # --- OLAY TARAFI ---
+
+    def izlenir_mi(self, klasor):
+        """
+        Klasör kökün altında ve taramanın gireceği bir yoldaysa True. Aradaki her klasör adı
+        hizli_tarayici.girilsin_mi ile kontrol edilir (.Trashes, @eaDir, gizli klasörler vb. elenir).
+        """
+        if klasor == self.kok:
+            return True
+        if not klasor.startswith(self.kok + os.sep):
+            return False
+        parcalar = klasor[len(self.kok) + 1:].split(os.sep)
+        return all(hizli_tarayici.girilsin_mi(ad, derinlik) for derinlik, ad in enumerate(parcalar, 1))
+
+    def isaretle(self, yol, klasor_mu):
+        """Bir yoldaki değişikliği, yeniden listelenmesi gereken klasör(ler)e çevirir."""
+        yol = str(yol)
+        ust = os.path.dirname(yol)
+        # Dosya değiştiyse bulunduğu klasör; klasör eklendi/silindiyse hem kendisi hem üstü
+        klasorler = [k for k in ([ust, yol] if klasor_mu else [ust]) if self.izlenir_mi(k)]
+        if not klasorler:
+            return
+        with self.kilit:
+            self.kirli.update(klasorler)
+            self.son_olay = time.monotonic()
+
+    def _alt_agaci_sil(self, klasor):
+        onek = klasor + os.sep
+        for yol in [y for y in self.klasorler if y == klasor or y.startswith(onek)]:
+            del self.klasorler[yol]
+
+    def _klasoru_guncelle(self, klasor):
+        """
+        Tek bir klasörü yeniden listeler; yeni alt klasörleri gezer, silinenleri düşer.
+        Envanterde bir şey değiştiyse True (sadece mtime'ı değişen klasör değişmiş sayılmaz).
+        """
+        if not self.izlenir_mi(klasor):
+            return False
+
+        eski = self.klasorler.get(klasor)
+        try:
+            kayit, _ = hizli_tarayici.klasor_incele(klasor)
+        except OSError:
+            # Klasör artık yok: kendisini ve altındakileri envanterden çıkar
+            if eski is None:
+                return False
+            self._alt_agaci_sil(klasor)
+            return True
+
+        if self.tarayici.baslik_gerekli_mi(kayit):
+            self.tarayici.klasor_basliklari(klasor, kayit)
+        self.klasorler[klasor] = kayit
+        if _ayni_mi(eski, kayit):
+            return False
+        eski_altlar = set(eski["alt_klasorler"]) if eski else set()
+        yeni_altlar = set(kayit["alt_klasorler"])
+
+        for ad in eski_altlar - yeni_altlar:
+            self._alt_agaci_sil(os.path.join(klasor, ad))
+
+        for ad in yeni_altlar - eski_altlar:
+            if not hizli_tarayici.girilsin_mi(ad):
+                continue
+            alt = os.path.join(klasor, ad)
+            for yol, alt_kayit, _, _ in hizli_tarayici.agaci_gez(alt):
+                if self.tarayici.baslik_gerekli_mi(alt_kayit):
+                    self.tarayici.klasor_basliklari(yol, alt_kayit)
+                self.klasorler[yol] = alt_kayit
+
+        return True
+
+    def kirlileri_isle(self):
+        """Olaylarla işaretlenen klasörleri günceller, değişen klasör sayısını döner."""
+        with self.kilit:
+            kirli, self.kirli = self.kirli, set()
+
+        # Üst klasörler önce işlensin ki yeni alt ağaçlar bir kez gezilsin
+        return sum(1 for klasor in sorted(kirli) if self._klasoru_guncelle(klasor))
+
+    # --- YOKLAMA TARAFI ---
+
+    def yokla(self):
+        """
+        Olay sistemi yokken kullanılır: Her klasör tek stat ile kontrol edilir,
+        sadece mtime'ı değişenler yeniden listelenir. Değişen klasör sayısını döner.
+        """
+        yeni = {}
+        degisen = 0
+        for klasor, kayit, onbellekten, _ in hizli_tarayici.agaci_gez(self.kok, self.klasorler):
+            if self.tarayici.baslik_gerekli_mi(kayit):
+                self.tarayici.klasor_basliklari(klasor, kayit)
+            yeni[klasor] = kayit
+            if not onbellekten and not _ayni_mi(self.klasorler.get(klasor), kayit):
+                degisen += 1
+
+        silinen = len(set(self.klasorler) - set(yeni))
+        self.klasorler = dict(sorted(yeni.items()))
+        return degisen + silinen
+
+    # --- ANA DÖNGÜ ---
+
+    def _kaydet(self, degisen):
+        print(f"🔄 {degisen} klasör değişti, envanter güncelleniyor...")
+        self.klasorler = dict(sorted(self.klasorler.items()))
+        self.tarayici.snapshot_kaydet(self.klasorler)
+        self.tarayici.raporu_yaz(self.klasorler)
+
+    def _gozlemci_baslat(self):
+        if not WATCHDOG_VAR:
+            print(f"ℹ️ 'watchdog' kütüphanesi yok (pip install watchdog). {self.yoklama_araligi} sn'de bir yoklama yapılacak.")
+            return None
+        try:
+            gozlemci = Observer()
+            gozlemci.schedule(_OlayYakalayici(self), self.kok, recursive=True)
+            gozlemci.start()
+            print("⚡ Dosya sistemi olayları dinleniyor.")
+            return gozlemci
+        except OSError as e:
+            # Örn: inotify izleme limiti dolu
+            print(f"⚠️ Olay izleme başlatılamadı ({e}). {self.yoklama_araligi} sn'de bir yoklama yapılacak.")
+            return None
+
+    def baslat(self):
+        """İzlemeyi başlatır; durdur() çağrılana kadar bloklar."""
+        print(f"👁️ Canlı izleme başlatılıyor: {self.kok}")
+        if not os.path.isdir(self.kok):
+            print(f"❌ HATA: '{self.kok}' klasörü bulunamadı!")
+            return
+
+        # Başlangıç durumu: snapshot ile artımlı tarama
+        self.klasorler, _ = self.tarayici.agaci_tara(self.tarayici.snapshot_yukle())
+        self._kaydet(len(self.klasorler))
+
+        gozlemci = self._gozlemci_baslat()
+        son_yoklama = time.monotonic()
+
+        try:
+            while not self.dur.wait(1.0):
+                simdi = time.monotonic()
+                if gozlemci is None:
+                    if simdi - son_yoklama >= self.yoklama_araligi:
+                        son_yoklama = simdi
+                        degisen = self.yokla()
+                        if degisen:
+                            self._kaydet(degisen)
+                elif self.kirli and simdi - self.son_olay >= self.yazma_gecikmesi:
+                    degisen = self.kirlileri_isle()
+                    if degisen:
+                        self._kaydet(degisen)
+        finally:
+            if gozlemci is not None:
+                gozlemci.stop()
+                gozlemci.join()
+            print("⏹ Canlı izleme durduruldu.")
+
+    def durdur(self):
+        self.dur.set()
+
+# =============================================================================
+# 🚀 ÇALIŞTIRMA
+# =============================================================================
+if __name__ == "__main__":
+    izleyici = EnvanterIzleyici(disk_envanter_guncelleyici.EnvanterTarayici(disk_envanter_guncelleyici.HEDEF_KLASOR))
+    try:
+        izleyici.baslat()
+    except KeyboardInterrupt:
+        izleyici.durdur()
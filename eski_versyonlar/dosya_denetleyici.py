@@ -4,6 +4,10 @@ from pathlib import Path
 import time
 import sys
 
+# Ortak tarama motoru (hizli_tarayici) ana klasördedir.
+# Depo kökünden modül olarak çalıştırın: python -m eski_versyonlar.dosya_denetleyici
+import hizli_tarayici
+
 # --- AYARLAR ---
 
 # 1. Taranacak organize klasör
@@ -48,33 +52,26 @@ def dosya_sistemini_tara() -> list:
     print(f"'{KAYNAK_DIZIN}' yeni yapısı taranıyor...")
     scanned_products = []
     
-    # Ebat klasörlerini bul (ilk seviye, örn: '60X120')
-    for ebat_dir in KAYNAK_DIZIN.glob('*'):
-        if not ebat_dir.is_dir():
+    # Yapı: Ebat / Yuzey / UrunAdi -> 3. seviyenin altına inilmez,
+    # 'kopya' ürün klasörleri hiç listelenmez (erken budama)
+    def kopya_mi(ad, derinlik):
+        return derinlik == 3 and ad == 'kopya'
+
+    for klasor, kayit, _, derinlik in hizli_tarayici.agaci_gez(
+            KAYNAK_DIZIN, max_derinlik=3, budama=kopya_mi, uzantilar=ARANACAK_UZANTILAR):
+        if derinlik != 3:
             continue
-        
-        # Yüzey klasörlerini bul (ikinci seviye, örn: 'Mat')
-        for yuzey_dir in ebat_dir.glob('*'):
-            if not yuzey_dir.is_dir():
-                continue
-                
-            # Ürün klasörlerini bul (üçüncü seviye, örn: 'Volcano...')
-            for urun_dir in yuzey_dir.glob('*'):
-                if not urun_dir.is_dir() or urun_dir.name == 'kopya':
-                    continue
-                
-                # Dosya sayısını hesapla (sadece görseller)
-                file_count = 0
-                for ext in ARANACAK_UZANTILAR:
-                    file_count += len(list(urun_dir.glob(f'*{ext}')))
-                    file_count += len(list(urun_dir.glob(f'*{ext.upper()}')))
-
-                scanned_products.append({
-                    "ebat_str": ebat_dir.name,
-                    "yuzey_str": yuzey_dir.name,
-                    "urun_adi_str": urun_dir.name,
-                    "file_count": file_count
-                })
+
+        urun_dir = Path(klasor)
+        scanned_products.append({
+            "ebat_str": urun_dir.parent.parent.name,
+            "yuzey_str": urun_dir.parent.name,
+            "urun_adi_str": urun_dir.name,
+            "file_count": kayit["gorsel_sayisi"]  # Sadece görseller
+        })
+
+    # Paralel tarama tamamlanma sırasıyla döner, yol sırasına diz
+    scanned_products.sort(key=lambda x: (x["ebat_str"], x["yuzey_str"], x["urun_adi_str"]))
 
     if not scanned_products:
         print("HATA: Kaynak dizinde (YENI_KATALOG) beklenen yapıda klasör bulunamadı.")
@@ -4,6 +4,10 @@ import os
 from pathlib import Path
 from collections import Counter
 
+# Ortak tarama motoru (hizli_tarayici) ana klasördedir.
+# Depo kökünden modül olarak çalıştırın: python -m eski_versyonlar.katalog_yoneticisi
+import hizli_tarayici
+
 # =============================================================================
 # ⚙️ KONFİGÜRASYON (AYARLAR)
 # =============================================================================
@@ -100,33 +104,35 @@ class DosyaSistemiTarayici:
             print("❌ HATA: Katalog klasörü bulunamadı!")
             return pd.DataFrame()
 
-        for ebat_dir in self.root_path.iterdir():
-            if not ebat_dir.is_dir() or ebat_dir.name.startswith('.'): continue
-            
-            for yuzey_dir in ebat_dir.iterdir():
-                if not yuzey_dir.is_dir() or yuzey_dir.name.startswith('.'): continue
-                
-                for urun_dir in yuzey_dir.iterdir():
-                    if not urun_dir.is_dir() or urun_dir.name.startswith('.'): continue
-                    
-                    jpg_count = len(list(urun_dir.glob("*.[jJ][pP][gG]"))) + len(list(urun_dir.glob("*.[jJ][pP][eE][gG]")))
-                    
-                    if jpg_count > 0:
-                        raw_name = urun_dir.name
-                        raw_size = ebat_dir.name
-                        raw_surface = yuzey_dir.name
-                        unique_key = DataNormalizer.create_composite_key(raw_name, raw_size, raw_surface)
-                        
-                        if unique_key:
-                            bulunanlar.append({
-                                "Kaynak": "Fiziksel_Disk",
-                                "Orijinal_Ad": raw_name,
-                                "Ebat": raw_size,
-                                "Yuzey": raw_surface,
-                                "Gorsel_Sayisi": jpg_count,
-                                "KEY": unique_key,
-                                "Yol": str(urun_dir)
-                            })
+        # Yapı: ROOT / Ebat / Yüzey / Ürün -> sadece 3. seviyeye kadar inilir
+        for klasor, kayit, _, derinlik in hizli_tarayici.agaci_gez(self.root_path, max_derinlik=3):
+            if derinlik != 3: continue
+
+            jpg_count = kayit["gorsel_sayisi"]
+
+            if jpg_count > 0:
+                urun_dir = Path(klasor)
+                yuzey_dir = urun_dir.parent
+                ebat_dir = yuzey_dir.parent
+
+                raw_name = urun_dir.name
+                raw_size = ebat_dir.name
+                raw_surface = yuzey_dir.name
+                unique_key = DataNormalizer.create_composite_key(raw_name, raw_size, raw_surface)
+
+                if unique_key:
+                    bulunanlar.append({
+                        "Kaynak": "Fiziksel_Disk",
+                        "Orijinal_Ad": raw_name,
+                        "Ebat": raw_size,
+                        "Yuzey": raw_surface,
+                        "Gorsel_Sayisi": jpg_count,
+                        "KEY": unique_key,
+                        "Yol": str(urun_dir)
+                    })
+
+        # Paralel tarama tamamlanma sırasıyla döner, raporu yola göre sırala
+        bulunanlar.sort(key=lambda x: x["Yol"])
         
         print(f"✅ Disk taraması bitti. {len(bulunanlar)} adet ürün tespit edildi.")
         return pd.DataFrame(bulunanlar)
@@ -0,0 +1,132 @@
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+# =============================================================================
+# ⚙️ AYARLAR
+# =============================================================================
+
+# Aynı anda listelenecek klasör sayısı (USB/harici disklerde 4-8 arası idealdir)
+VARSAYILAN_ISCI_SAYISI = 8
+
+# Sadece bu uzantılar stat edilir ve sayılır
+GORSEL_UZANTILARI = ('.jpg', '.jpeg')
+
+# İşçi başına en fazla kaç klasör aynı anda havuzda bekleyebilir.
+# Tamamlanmış ama henüz tüketilmemiş sonuçlar da buna dahildir; bellek bununla sınırlanır.
+ISCI_BASINA_BEKLEYEN = 4
+
+# İçine hiç girilmeyecek sistem/çöp klasörleri
+ATLANACAK_KLASORLER = {
+    "__MACOSX", ".Trashes", ".Spotlight-V100", ".fseventsd", ".TemporaryItems",
+    "@eaDir", "$RECYCLE.BIN", "System Volume Information",
+}
+
+# =============================================================================
+# 🛠 KLASÖR GEZGİNİ (os.scandir + Thread Havuzu)
+# =============================================================================
+
+def klasor_incele(klasor, onceki_kayit=None, uzantilar=GORSEL_UZANTILARI):
+    """
+    Tek bir klasörü inceler ve (kayıt, önbellekten_mi) döner.
+
+    Klasörün mtime'ı önceki kayıtla aynıysa listeleme yapılmaz, kayıt aynen kullanılır
+    (maliyet: tek bir stat). Aksi halde os.scandir ile listelenir; DirEntry'nin stat
+    sonucu yeniden kullanılır ve sadece görsel uzantılı dosyalar stat edilir.
+
+    Kayıt yapısı:
+        mtime_ns, girdi_sayisi, alt_klasorler, gorsel_sayisi, toplam_bytes,
+        gorseller -> [[dosya_adi, boyut_byte], ...]
+    """
+    mtime_ns = os.stat(klasor).st_mtime_ns
+    if onceki_kayit and onceki_kayit.get("mtime_ns") == mtime_ns:
+        return onceki_kayit, True
+
+    alt_klasorler = []
+    gorseller = []
+    girdi_sayisi = 0
+    toplam_bytes = 0
+
+    with os.scandir(klasor) as girdiler:
+        for girdi in girdiler:
+            girdi_sayisi += 1
+            try:
+                if girdi.is_dir(follow_symlinks=False):
+                    alt_klasorler.append(girdi.name)
+                elif girdi.name.lower().endswith(uzantilar) and girdi.is_file():
+                    boyut = girdi.stat().st_size
+                    gorseller.append([girdi.name, boyut])
+                    toplam_bytes += boyut
+            except OSError:
+                continue
+
+    kayit = {
+        "mtime_ns": mtime_ns,
+        "girdi_sayisi": girdi_sayisi,
+        "alt_klasorler": sorted(alt_klasorler),
+        "gorsel_sayisi": len(gorseller),
+        "toplam_bytes": toplam_bytes,
+        "gorseller": gorseller,
+    }
+    return kayit, False
+
+
+def girilsin_mi(ad, derinlik=1, gizli_atla=True, budama=None):
+    """Alt klasöre girilip girilmeyeceğine karar verir (erken budama)."""
+    if ad in ATLANACAK_KLASORLER:
+        return False
+    if gizli_atla and ad.startswith('.'):
+        return False
+    if budama and budama(ad, derinlik):
+        return False
+    return True
+
+
+def agaci_gez(kok, onceki=None, isci_sayisi=VARSAYILAN_ISCI_SAYISI, gizli_atla=True,
+              budama=None, max_derinlik=None, uzantilar=GORSEL_UZANTILARI):
+    """
+    Kök klasörden başlayarak ağacı paralel gezer. Her klasör için bitirildiği anda
+    (klasor_yolu, kayit, onbellekten, derinlik) üretir (generator).
+
+    - onceki      : {klasor_yolu: kayit} artımlı tarama snapshot'ı (yoksa tam tarama)
+    - isci_sayisi : aynı anda listelenen klasör sayısı (thread havuzu sınırı)
+    - gizli_atla  : '.' ile başlayan klasörlere girilmez
+    - budama      : budama(ad, derinlik) True dönerse o dala hiç girilmez
+    - max_derinlik: bu derinlikteki klasörler listelenir ama altlarına inilmez (kök = 0)
+
+    Sonuçların sırası tamamlanma sırasıdır; sıralı çıktı gerekiyorsa çağıran sıralamalıdır.
+    Havuzdaki iş sayısı sınırlıdır; henüz sırası gelmemiş klasörler sadece yol olarak
+    bekletilir, böylece bellek kullanımı ağacın büyüklüğünden bağımsız kalır.
+    """
+    onceki = onceki or {}
+    kok = str(kok)
+    isci_sayisi = max(1, isci_sayisi)
+    max_bekleyen = isci_sayisi * ISCI_BASINA_BEKLEYEN
+
+    with ThreadPoolExecutor(max_workers=isci_sayisi) as havuz:
+        sira = deque([(kok, 0)])
+        bekleyenler = {}
+
+        while sira or bekleyenler:
+            while sira and len(bekleyenler) < max_bekleyen:
+                # Derinlik öncelikli (LIFO): bekleyen yol listesi geniş ağaçlarda da kısa kalır
+                klasor, derinlik = sira.pop()
+                bekleyenler[havuz.submit(klasor_incele, klasor, onceki.get(klasor), uzantilar)] = (klasor, derinlik)
+
+            biten, _ = wait(bekleyenler, return_when=FIRST_COMPLETED)
+            for gorev in biten:
+                klasor, derinlik = bekleyenler.pop(gorev)
+                try:
+                    kayit, onbellekten = gorev.result()
+                except OSError:
+                    # Erişilemeyen / silinmiş klasör: atla
+                    continue
+
+                # Kardeş alt ağaçları havuza dağıt
+                if max_derinlik is None or derinlik < max_derinlik:
+                    for ad in reversed(kayit["alt_klasorler"]):
+                        if not girilsin_mi(ad, derinlik + 1, gizli_atla, budama):
+                            continue
+                        sira.append((os.path.join(klasor, ad), derinlik + 1))
+
+                yield klasor, kayit, onbellekten, derinlik
@@ -0,0 +1,168 @@
+import os
+import mmap
+import hashlib
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+# =============================================================================
+# ⚙️ AYARLAR
+# =============================================================================
+
+# Ön eleme için dosyanın başından ve sonundan okunacak bayt miktarı
+KISMI_OZET_BOYUTU = 64 * 1024
+
+# Tam özet hesaplanırken tek seferde işlenecek dilim (mmap üzerinden, kopyasız)
+DILIM_BOYUTU = 8 * 1024 * 1024
+
+# Aynı anda özet hesaplayan thread sayısı (hashlib büyük bloklarda GIL'i bırakır)
+ISCI_SAYISI = 4
+
+# =============================================================================
+# 🔑 ÖZET FONKSİYONLARI (mmap)
+# =============================================================================
+
+def _ozet_nesnesi():
+    return hashlib.blake2b(digest_size=20)
+
+
+def kismi_ozet(yol):
+    """Dosyanın ilk ve son KISMI_OZET_BOYUTU baytının özeti (ucuz ön eleme)."""
+    with open(yol, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        ozet = _ozet_nesnesi()
+        ozet.update(m[:KISMI_OZET_BOYUTU])
+        if len(m) > KISMI_OZET_BOYUTU:
+            ozet.update(m[-KISMI_OZET_BOYUTU:])
+        return ozet.hexdigest()
+
+
+def tam_ozet(yol):
+    """Dosyanın tamamının özeti. Okuma mmap ile yapılır, içerik belleğe kopyalanmaz."""
+    with open(yol, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        ozet = _ozet_nesnesi()
+        bakis = memoryview(m)
+        try:
+            for bas in range(0, len(m), DILIM_BOYUTU):
+                ozet.update(bakis[bas:bas + DILIM_BOYUTU])
+        finally:
+            bakis.release()
+        return ozet.hexdigest()
+
+
+def _guvenli(fonksiyon, yol):
+    try:
+        return yol, fonksiyon(yol)
+    except (OSError, ValueError):
+        return yol, None
+
+# =============================================================================
+# 📇 İÇERİK İNDEKSİ
+# =============================================================================
+
+class IcerikIndeksi:
+    """
+    Birebir aynı (bayt bayt) görselleri bulan indeks.
+
+    Kademeli eleme:
+      1. Boyut   : Farklı boyuttaki dosyalar aynı olamaz (ek maliyet yok, tarayıcıdan gelir)
+      2. Kısmi   : Aynı boyuttakilerin baş/son 64KB özeti
+      3. Tam     : Sadece kısmi özeti de çakışanların tamamı okunur
+    """
+    def __init__(self, isci_sayisi=ISCI_SAYISI):
+        self.isci_sayisi = isci_sayisi
+        self.boyuta_gore = defaultdict(list)
+        self.ozetler = {}
+        self._gruplar = None
+
+    def ekle(self, yol, boyut=None):
+        """Bir dosyayı indekse ekler. Boyut verilmezse stat edilir."""
+        yol = str(yol)
+        if boyut is None:
+            try:
+                boyut = os.path.getsize(yol)
+            except OSError:
+                return
+        # Boş dosyalar mmap edilemez ve karşılaştırmaya değmez
+        if boyut > 0:
+            self.boyuta_gore[boyut].append(yol)
+            self._gruplar = None
+
+    def _ozetle(self, fonksiyon, yollar):
+        with ThreadPoolExecutor(max_workers=max(1, self.isci_sayisi)) as havuz:
+            return dict(havuz.map(lambda y: _guvenli(fonksiyon, y), yollar))
+
+    def mukerrer_gruplar(self):
+        """
+        Aynı içeriğe sahip dosya gruplarını döner: [(ozet, boyut, [yol, yol, ...]), ...]
+        Her grupta en az 2 dosya bulunur; yollar sıralıdır, ilk yol grubun temsilcisidir.
+        """
+        if self._gruplar is not None:
+            return self._gruplar
+
+        # 1. Boyut eleme
+        adaylar = [yol for yollar in self.boyuta_gore.values() if len(yollar) > 1 for yol in yollar]
+
+        # 2. Kısmi özet eleme
+        kismi = self._ozetle(kismi_ozet, adaylar)
+        kismi_gruplar = defaultdict(list)
+        for boyut, yollar in self.boyuta_gore.items():
+            if len(yollar) < 2:
+                continue
+            for yol in yollar:
+                if kismi.get(yol):
+                    kismi_gruplar[(boyut, kismi[yol])].append(yol)
+
+        # 3. Tam özet (küçük dosyalarda kısmi özet zaten dosyanın tamamıdır)
+        tam_gerekenler = [
+            yol for (boyut, _), yollar in kismi_gruplar.items()
+            if len(yollar) > 1 and boyut > 2 * KISMI_OZET_BOYUTU
+            for yol in yollar
+        ]
+        tam = self._ozetle(tam_ozet, tam_gerekenler)
+
+        tam_gruplar = defaultdict(list)
+        for (boyut, k_ozet), yollar in kismi_gruplar.items():
+            if len(yollar) < 2:
+                continue
+            for yol in yollar:
+                ozet = k_ozet if boyut <= 2 * KISMI_OZET_BOYUTU else tam.get(yol)
+                if ozet:
+                    tam_gruplar[(boyut, ozet)].append(yol)
+
+        gruplar = []
+        for (boyut, ozet), yollar in tam_gruplar.items():
+            if len(yollar) > 1:
+                for yol in yollar:
+                    self.ozetler[yol] = ozet
+                gruplar.append((ozet, boyut, sorted(yollar)))
+
+        gruplar.sort(key=lambda g: g[2][0])
+        self._gruplar = gruplar
+        return gruplar
+
+    def icerik_anahtari(self, yol):
+        """
+        Mükerrer bir dosyanın içerik özetini döner; tekil dosyalar için None.
+        (Aynı anahtara sahip dosyalardan sadece birinin işlenmesi yeterlidir.)
+        """
+        self.mukerrer_gruplar()
+        return self.ozetler.get(str(yol))
+
+    def ozet(self):
+        """(grup sayısı, fazladan dosya sayısı, boşa harcanan MB) döner."""
+        gruplar = self.mukerrer_gruplar()
+        fazla = sum(len(yollar) - 1 for _, _, yollar in gruplar)
+        bosa_mb = sum(boyut * (len(yollar) - 1) for _, boyut, yollar in gruplar) / (1024 * 1024)
+        return len(gruplar), fazla, round(bosa_mb, 2)
+
+    def rapor_satirlari(self):
+        """Excel raporu için her mükerrer dosyaya bir satır üretir."""
+        for no, (ozet, boyut, yollar) in enumerate(self.mukerrer_gruplar(), start=1):
+            for sira, yol in enumerate(yollar):
+                yield {
+                    "Grup_No": no,
+                    "Icerik_Ozeti": ozet,
+                    "Boyut_MB": round(boyut / (1024 * 1024), 2),
+                    "Grup_Adedi": len(yollar),
+                    "Temsilci": "EVET" if sira == 0 else "",
+                    "Yol": yol,
+                }
@@ -0,0 +1,61 @@
+import csv
+import heapq
+
+# =============================================================================
+# ⚙️ AYARLAR
+# =============================================================================
+
+# Planın yazılacağı CSV (sıra, grup, tahmini süre, atanan işçi, tahmini başlangıç)
+PLAN_DOSYASI = "Is_Plani.csv"
+
+# Maliyet modeli (tek işçide saniye). Sıralama için oranlar yeterlidir; mutlak değerler sadece
+# plandaki tahmini süreleri etkiler (Optimizasyon_Metrikleri.csv'deki işlem sürelerinden ayarlanabilir).
+ISLEM_SN_MP = 0.013     # Kaynak megapikseli başına çözme (IDCT) + küçültme + kodlama
+ISLEM_SN_MB = 0.05      # Kaynak MB başına okuma + entropi çözme (sıkıştırılmış veri miktarıyla orantılı)
+KOPYA_MB_SN = 150       # Aynen kopyalama hızı (MB/sn)
+
+PLAN_SUTUNLARI = ["sira", "grup", "kaynak", "hedef", "genislik", "yukseklik", "kaynak_mb",
+                  "tahmini_sn", "isci", "baslangic_sn"]
+
+# =============================================================================
+# 🧮 MALİYET VE DAĞITIM
+# =============================================================================
+
+def islem_maliyeti(piksel, bayt):
+    """Yeniden sıkıştırılacak görselin tahmini işlem süresi (sn)."""
+    return ISLEM_SN_MP * piksel / 1e6 + ISLEM_SN_MB * bayt / (1024 * 1024)
+
+
+def kopya_maliyeti(bayt):
+    return bayt / (1024 * 1024) / KOPYA_MB_SN
+
+
+def dagit(maliyetler, isci_sayisi):
+    """
+    İşleri verilen sırayla, her seferinde ilk boşalan işçiye verir (havuzun davranışı).
+    Dönüş: ([(işçi, başlangıç_sn), ...] iş sırasıyla, toplam süre (makespan))
+    Maliyetler büyükten küçüğe sıralıysa bu LPT (Longest Processing Time first) dağıtımıdır.
+    """
+    isci_sayisi = max(1, isci_sayisi)
+    bosalma = [(0.0, isci) for isci in range(isci_sayisi)]
+    atamalar = []
+    bitis = 0.0
+    for maliyet in maliyetler:
+        baslangic, isci = heapq.heappop(bosalma)
+        atamalar.append((isci, baslangic))
+        bitis = max(bitis, baslangic + maliyet)
+        heapq.heappush(bosalma, (baslangic + maliyet, isci))
+    return atamalar, bitis
+
+
+def plani_yaz(satirlar, dosya=PLAN_DOSYASI):
+    """Plan satırlarını (sözlük) CSV'ye yazar; başarılıysa True."""
+    try:
+        with open(dosya, "w", newline="", encoding="utf-8") as f:
+            yazici = csv.DictWriter(f, fieldnames=PLAN_SUTUNLARI, extrasaction="ignore")
+            yazici.writeheader()
+            yazici.writerows(satirlar)
+        return True
+    except OSError as e:
+        print(f"⚠️ İş planı yazılamadı: {e}")
+        return False
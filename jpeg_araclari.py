@@ -0,0 +1,254 @@
+import os
+import mmap
+import struct
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+# =============================================================================
+# ⚙️ AYARLAR
+# =============================================================================
+
+# Başlık okunurken kullanılan tampon; segment gövdeleri okunmaz, atlanır (seek)
+BASLIK_OKUMA_BOYUTU = 16 * 1024
+
+# Aynı anda başlığı okunan dosya sayısı
+ISCI_SAYISI = 8
+
+# SOF (Start Of Frame) işaretleri: C0-CF arası, C4 (DHT), C8 (JPG), CC (DAC) hariç
+SOF_ISARETLERI = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+
+# Gövdesi olmayan (uzunluk alanı taşımayan) işaretler: RST0-7, SOI, EOI, TEM
+GOVDESIZ_ISARETLER = set(range(0xD0, 0xD8)) | {0xD8, 0xD9, 0x01}
+
+# Bileşen sayısı -> renk modu
+RENK_MODLARI = {1: "L", 3: "RGB", 4: "CMYK"}
+
+# BÜTÜNLÜK KONTROLÜ
+# Aynı anda doğrulanan dosya sayısı (süreç havuzu; tarama CPU ve disk ağırlıklıdır)
+DOGRULAMA_ISCI_SAYISI = os.cpu_count() or 4
+
+# Görüntü verisi içinde bu uzunlukta sıfır bloğu "şüpheli" sayılır (yarım kopya / bozuk sektör izi)
+SIFIR_BLOK_BOYUTU = 4096
+
+# EOI sonrasında bu kadar bayta kadar ek veri sorun sayılmaz (bazı kameralar dolgu ekler)
+EOI_SONRASI_TOLERANS = 1024
+
+# Taramalar arasında (progresif JPEG) görüntü verisinde bulunabilen segment işaretleri:
+# SOF, DHT, DAC, DQT, DNL, DRI, APPn, COM
+TARAMA_ARASI_ISARETLER = SOF_ISARETLERI | {0xC4, 0xCC, 0xDB, 0xDC, 0xDD, 0xFE} | set(range(0xE0, 0xF0))
+
+# =============================================================================
+# 🔎 BAŞLIK OKUYUCU (Decode yok)
+# =============================================================================
+
+def jpeg_baslik_oku(yol):
+    """
+    JPEG'in sadece başlık segmentlerini okuyarak (genişlik, yükseklik, bileşen sayısı) döner.
+    Görüntü verisi çözülmez; EXIF/ICC gibi büyük segmentlerin gövdesi seek ile atlanır.
+    JPEG değilse veya SOF bulunamazsa None döner.
+    """
+    try:
+        with open(yol, "rb", buffering=BASLIK_OKUMA_BOYUTU) as f:
+            if f.read(2) != b"\xff\xd8":
+                return None
+
+            while True:
+                bayt = f.read(1)
+                if not bayt:
+                    return None
+                if bayt != b"\xff":
+                    continue
+
+                # Dolgu (0xFF 0xFF ...) baytlarını atla
+                isaret = f.read(1)
+                while isaret == b"\xff":
+                    isaret = f.read(1)
+                if not isaret:
+                    return None
+
+                kod = isaret[0]
+                if kod in GOVDESIZ_ISARETLER or kod == 0x00:
+                    continue
+                if kod == 0xDA:
+                    # SOS: görüntü verisi başladı, SOF'a rastlanmadı
+                    return None
+
+                uzunluk_bayt = f.read(2)
+                if len(uzunluk_bayt) < 2:
+                    return None
+                uzunluk = struct.unpack(">H", uzunluk_bayt)[0]
+                if uzunluk < 2:
+                    return None
+
+                if kod in SOF_ISARETLERI:
+                    govde = f.read(6)
+                    if len(govde) < 6:
+                        return None
+                    _, yukseklik, genislik, bilesen = struct.unpack(">BHHB", govde)
+                    return genislik, yukseklik, bilesen
+
+                f.seek(uzunluk - 2, 1)
+    except OSError:
+        return None
+
+
+def basliklari_oku(yollar, isci_sayisi=ISCI_SAYISI):
+    """Birden çok dosyanın başlığını paralel okur: {yol: (genislik, yukseklik, bilesen) | None}"""
+    yollar = list(yollar)
+    if len(yollar) <= 1 or isci_sayisi <= 1:
+        return {yol: jpeg_baslik_oku(yol) for yol in yollar}
+    with ThreadPoolExecutor(max_workers=isci_sayisi) as havuz:
+        return dict(zip(yollar, havuz.map(jpeg_baslik_oku, yollar)))
+
+
+# =============================================================================
+# 🩺 BÜTÜNLÜK KONTROLÜ (Decode olmadan, gerekirse tam çözme)
+# =============================================================================
+
+class BozukGorselHatasi(ValueError):
+    """Kaynak görsel bozuk (kesik, yarım kopya, çözülemiyor); işlenmemeli ve aynen de kopyalanmamalı."""
+
+def jpeg_yapi_kontrolu(veri):
+    """
+    Bellek eşlemeli (mmap) veya bellekteki baytlarda JPEG yapısını kontrol eder: (durum, neden)
+      durum: "saglam" | "uyari" (çözülebilir ama olağan dışı) | "supheli" (tam çözme gerekli) | "bozuk"
+    Başlık segmentleri uzunluklarıyla tek tek atlanır (sadece segmentler arası 0xFF dolgusu bayt bayt
+    geçilir); görüntü verisinde ise sadece 0xFF baytlarına bakılır (find ile, C hızında atlanarak).
+    """
+    boyut = len(veri)
+    if boyut < 4:
+        return "bozuk", f"Dosya çok kısa ({boyut} bayt)"
+    if veri[:2] != b"\xff\xd8":
+        # Uzantısı yanlış başka bir biçim (PNG, TIFF...) olabilir: tam çözme karar versin
+        return "supheli", "SOI yok (JPEG değil veya başı bozuk)"
+
+    # --- Başlık segmentleri: SOI -> ... -> SOS ---
+    konum = 2
+    sof_var = False
+    while True:
+        while konum < boyut and veri[konum] == 0xFF and konum + 1 < boyut and veri[konum + 1] == 0xFF:
+            konum += 1  # Dolgu baytları
+        if konum + 4 > boyut:
+            return "bozuk", "Başlık kesik (görüntü verisine ulaşılamadı)"
+        if veri[konum] != 0xFF:
+            return "bozuk", f"Başlıkta geçersiz bayt ({konum}. konum)"
+        kod = veri[konum + 1]
+        if kod == 0xD9:
+            return "bozuk", "Görüntü verisinden önce EOI"
+        if kod in GOVDESIZ_ISARETLER:
+            konum += 2
+            continue
+        uzunluk = struct.unpack_from(">H", veri, konum + 2)[0]
+        if uzunluk < 2 or konum + 2 + uzunluk > boyut:
+            return "bozuk", f"Segment uzunluğu dosya dışına taşıyor (0xFF{kod:02X})"
+        if kod in SOF_ISARETLERI:
+            if uzunluk < 8:
+                return "bozuk", "SOF segmenti kısa"
+            _, yukseklik, genislik, bilesen = struct.unpack_from(">BHHB", veri, konum + 4)
+            if not genislik or not bilesen:
+                return "bozuk", "SOF boyutları geçersiz"
+            sof_var = True
+        konum += 2 + uzunluk
+        if kod == 0xDA:
+            break
+    if not sof_var:
+        return "bozuk", "SOF (çerçeve başlığı) yok"
+
+    # --- Görüntü verisi: EOI'ye kadar işaretleri doğrula ---
+    eoi = None
+    supheli = None
+    while True:
+        isaret_konumu = veri.find(b"\xff", konum)
+        if isaret_konumu == -1 or isaret_konumu + 1 >= boyut:
+            break
+        kod = veri[isaret_konumu + 1]
+        # Dolgu (FF 00), RST (FF D0-D7) ve art arda FF'ler işaret değildir
+        if kod == 0x00 or 0xD0 <= kod <= 0xD7 or kod == 0xFF:
+            konum = isaret_konumu + 1
+            continue
+        if kod == 0xD9:
+            eoi = isaret_konumu
+            break
+        if kod == 0xDA or kod in TARAMA_ARASI_ISARETLER:
+            # Progresif JPEG: yeni tarama / tablo segmenti, gövdesini atla
+            if isaret_konumu + 4 > boyut:
+                break
+            uzunluk = struct.unpack_from(">H", veri, isaret_konumu + 2)[0]
+            if uzunluk < 2 or isaret_konumu + 2 + uzunluk > boyut:
+                return "bozuk", f"Görüntü verisinde kesik segment (0xFF{kod:02X})"
+            konum = isaret_konumu + 2 + uzunluk
+            continue
+        supheli = f"Görüntü verisinde beklenmeyen işaret 0xFF{kod:02X} ({isaret_konumu}. konum)"
+        break
+
+    if eoi is None and supheli is None:
+        # Yarıda kalan kopyalar çoğu zaman hedef boyutta ama sonu sıfırlarla dolu olur
+        kuyruk = veri[max(konum, boyut - SIFIR_BLOK_BOYUTU):]
+        if len(kuyruk) >= SIFIR_BLOK_BOYUTU and kuyruk.count(0) == len(kuyruk):
+            return "bozuk", "EOI yok, dosya sonu sıfırlarla dolu (yarım kopya)"
+        supheli = "EOI yok (dosya kesik olabilir)"
+
+    if supheli is None and veri.find(b"\x00" * SIFIR_BLOK_BOYUTU, konum, eoi) != -1:
+        supheli = f"Görüntü verisinde {SIFIR_BLOK_BOYUTU} baytlık sıfır bloğu"
+    if supheli:
+        return "supheli", supheli
+
+    fazla = boyut - (eoi + 2)
+    if fazla > EOI_SONRASI_TOLERANS:
+        return "uyari", f"EOI sonrasında {fazla} bayt ek veri"
+    return "saglam", ""
+
+
+def tam_coz(kaynak):
+    """
+    Şüpheli görseli kesik veriye izin vermeden çözer (1/8 ölçek: tüm veri okunur, bellek az).
+    kaynak: dosya yolu veya dosya benzeri nesne (io.BytesIO). Dönüş: hata metni | None
+    """
+    from PIL import Image, ImageFile
+    onceki = ImageFile.LOAD_TRUNCATED_IMAGES
+    ImageFile.LOAD_TRUNCATED_IMAGES = False
+    try:
+        with Image.open(kaynak) as img:
+            img.draft(img.mode, (max(1, img.width // 8), max(1, img.height // 8)))
+            img.load()
+        return None
+    except Exception as e:
+        return f"{type(e).__name__}: {e}"
+    finally:
+        ImageFile.LOAD_TRUNCATED_IMAGES = onceki
+
+
+def jpeg_butunluk_kontrolu(yol):
+    """
+    Tek JPEG'in bütünlüğünü kontrol eder: (yol, durum, neden)
+      saglam : Yapı düzgün (SOI, segmentler, görüntü verisi, EOI)
+      uyari  : Çözülebilir ama olağan dışı (EOI sonrası veri, şüpheli yapı ama tam çözme başarılı)
+      bozuk  : Yapı bozuk ya da tam çözme başarısız
+    Dosya mmap ile okunur; tam çözme sadece yapısı şüpheli dosyalarda yapılır.
+    """
+    try:
+        with open(yol, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return yol, "bozuk", "Boş dosya (0 bayt)"
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as veri:
+                durum, neden = jpeg_yapi_kontrolu(veri)
+    except (OSError, ValueError) as e:
+        return yol, "bozuk", f"Okunamadı: {e}"
+
+    if durum == "supheli":
+        hata = tam_coz(yol)
+        if hata:
+            return yol, "bozuk", f"{neden} | Çözme: {hata}"
+        return yol, "uyari", f"{neden} (tam çözme başarılı)"
+    return yol, durum, neden
+
+
+def butunlugu_dogrula(yollar, isci_sayisi=DOGRULAMA_ISCI_SAYISI):
+    """
+    Dosyaları süreç havuzunda paralel doğrular ve (yol, durum, neden) üretir (generator, veriliş sırasıyla).
+    """
+    yollar = list(yollar)
+    if len(yollar) <= 1 or isci_sayisi <= 1:
+        yield from map(jpeg_butunluk_kontrolu, yollar)
+        return
+    with ProcessPoolExecutor(max_workers=isci_sayisi) as havuz:
+        yield from havuz.map(jpeg_butunluk_kontrolu, yollar, chunksize=32)
@@ -0,0 +1,121 @@
+import os
+import json
+import math
+
+# =============================================================================
+# ⚙️ AYARLAR
+# =============================================================================
+
+# Öğrenilen modelin saklandığı dosya (çalıştırmalar arasında korunur)
+MODEL_DOSYASI = "Kalite_Modeli.json"
+MODEL_SURUMU = 1
+
+# Bir grup/kalite için bu kadar gözlemden sonra ortalama kayan pencereye geçer
+# (yeni ürün serileri eski verinin ağırlığı altında kalmasın)
+PENCERE = 200
+
+# Bir grupta bu kadar gözlem yoksa genel ("*") modele düşülür
+MIN_GOZLEM = 3
+
+# Tahmin edilen boyut, sınırın bu oranının altındaysa "sığar" kabul edilir (hata payı)
+GUVEN_PAYI = 0.95
+
+# Tüm grupların ortak modeli
+GENEL_GRUP = "*"
+
+# Grup adına biçim öneki eklenmeyen (modelin ilk sürümündeki) çıktı biçimi
+VARSAYILAN_BICIM = "jpeg"
+
+# =============================================================================
+# 🎯 KALİTE TAHMİNCİSİ
+# =============================================================================
+
+class KaliteTahmincisi:
+    """
+    Tamamlanan kodlamalardan, çıktı boyutunun kaliteye göre nasıl değiştiğini öğrenir.
+
+    Model: Aynı kalitede, çıktının piksel başına baytı (bpp) kaynağın bpp'si ile orantılıdır
+    (kaynak bpp görselin ne kadar "detaylı" olduğunu gösterir). Her grup (Ebat) ve kalite için
+    log(çıktı_bpp / kaynak_bpp) ortalaması tutulur:
+
+        tahmini_bayt = çıktı_piksel * kaynak_bpp * exp(ortalama[grup][kalite])
+
+    Yapı: {grup: {kalite: [gözlem_sayısı, ortalama]}}
+    JPEG dışı biçimler (WebP/AVIF) aynı kalite sayısında çok farklı boyut ürettiğinden ayrı
+    gruplarda tutulur: "webp:Ebat", genel model "webp:*".
+    """
+    def __init__(self, model=None):
+        self.gruplar = model or {}
+
+    # --- Kalıcılık -----------------------------------------------------------
+
+    @classmethod
+    def yukle(cls, dosya=MODEL_DOSYASI):
+        try:
+            with open(dosya, "r", encoding="utf-8") as f:
+                veri = json.load(f)
+            if veri.get("surum") == MODEL_SURUMU:
+                return cls(veri.get("gruplar", {}))
+            print("ℹ️ Kalite modeli eski sürümden, sıfırdan öğrenilecek.")
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Kalite modeli okunamadı, sıfırdan öğrenilecek: {e}")
+        return cls()
+
+    def kaydet(self, dosya=MODEL_DOSYASI):
+        gecici = dosya + ".tmp"
+        try:
+            with open(gecici, "w", encoding="utf-8") as f:
+                json.dump({"surum": MODEL_SURUMU, "gruplar": self.gruplar}, f)
+            os.replace(gecici, dosya)
+        except OSError as e:
+            print(f"⚠️ Kalite modeli kaydedilemedi: {e}")
+
+    # --- Öğrenme / Tahmin ----------------------------------------------------
+
+    def _gruplar(self, grup, bicim):
+        """(grup anahtarı, genel anahtar). JPEG eski anahtarları kullanır (mevcut modeller geçerli kalır)."""
+        if not bicim or bicim == VARSAYILAN_BICIM:
+            return grup, GENEL_GRUP
+        return f"{bicim}:{grup}", f"{bicim}:{GENEL_GRUP}"
+
+    def ogren(self, grup, kaynak_bpp, piksel, gozlemler, bicim=None):
+        """gozlemler: [(kalite, çıktı_bayt), ...] -> hem grubun hem genel modelin ortalaması güncellenir."""
+        if not kaynak_bpp or not piksel:
+            return
+        anahtarlar = self._gruplar(grup, bicim)
+        for kalite, bayt in gozlemler:
+            if bayt <= 0:
+                continue
+            deger = math.log((bayt / piksel) / kaynak_bpp)
+            for ad in anahtarlar:
+                kayit = self.gruplar.setdefault(ad, {}).setdefault(str(kalite), [0, 0.0])
+                kayit[0] += 1
+                kayit[1] += (deger - kayit[1]) / min(kayit[0], PENCERE)
+
+    def _oran(self, anahtarlar, kalite):
+        for ad in anahtarlar:
+            kayit = self.gruplar.get(ad, {}).get(str(kalite))
+            if kayit and kayit[0] >= MIN_GOZLEM:
+                return kayit[1]
+        return None
+
+    def tahmin_et(self, grup, kaynak_bpp, piksel, limit, adaylar, bicim=None):
+        """
+        Adaylar (yüksekten düşüğe) içinde sınıra sığması beklenen EN YÜKSEK kaliteyi döner.
+        Hiçbir aday için yeterli gözlem yoksa None (çağıran eski davranışa döner).
+        """
+        if not kaynak_bpp or not piksel:
+            return None
+        anahtarlar = self._gruplar(grup, bicim)
+        bilinen = False
+        for kalite in adaylar:
+            oran = self._oran(anahtarlar, kalite)
+            if oran is None:
+                continue
+            bilinen = True
+            if piksel * kaynak_bpp * math.exp(oran) < limit * GUVEN_PAYI:
+                return kalite
+        # Modele göre hiçbiri sığmıyor: en düşük kaliteden başla
+        return adaylar[-1] if bilinen else None
@@ -0,0 +1,247 @@
+import os
+import sys
+import errno
+import shutil
+import threading
+
+# =============================================================================
+# ⚙️ AYARLAR
+# =============================================================================
+
+# Çekirdek içi yöntemler kullanılamazsa okuma/yazma tamponu (harici disklerde büyük tampon daha hızlı)
+TAMPON_BOYUTU = 8 * 1024 * 1024
+
+# copy_file_range / sendfile tek çağrıda aktarılacak en fazla bayt
+CEKIRDEK_PARCA_BOYUTU = 1024 * 1024 * 1024
+
+# Yöntemin bu sistemde/diskte desteklenmediğini gösteren hatalar (bir sonraki yönteme geçilir)
+DESTEKSIZ_HATALAR = {
+    errno.EXDEV, errno.EINVAL, errno.ENOSYS, errno.EOPNOTSUPP, errno.ENOTSUP,
+    errno.EPERM, errno.EBADF, errno.ENOTTY,
+}
+
+# Linux: FICLONE ioctl (btrfs, xfs, bcachefs vb. üzerinde reflink)
+FICLONE = 0x40049409
+
+# =============================================================================
+# 🧩 PLATFORM YARDIMCILARI
+# =============================================================================
+
+_clonefile = None
+if sys.platform == "darwin":
+    try:
+        import ctypes
+        _libc = ctypes.CDLL("libc.dylib", use_errno=True)
+        _clonefile = _libc.clonefile
+        _clonefile.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int]
+        _clonefile.restype = ctypes.c_int
+    except (OSError, AttributeError):
+        _clonefile = None
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# Bir (yöntem, kaynak_aygıt, hedef_aygıt) üçlüsü bir kez desteklenmezse tekrar denenmez
+_desteksiz = set()
+_kilit = threading.Lock()
+
+
+class _SonrakiYontem(Exception):
+    """Bu dosya için yöntem sonuç vermedi; diski desteksiz saymadan sıradaki yönteme geç."""
+
+
+def _desteksiz_mi(yontem, aygitlar):
+    return (yontem, aygitlar) in _desteksiz
+
+
+def _desteksiz_isaretle(yontem, aygitlar):
+    with _kilit:
+        _desteksiz.add((yontem, aygitlar))
+
+# =============================================================================
+# 🚚 KOPYALAMA YÖNTEMLERİ
+# =============================================================================
+
+def _klonla(kaynak, hedef):
+    """Reflink / clonefile: veri bloğu kopyalanmaz, yazılınca ayrışır (copy-on-write)."""
+    if _clonefile is not None:
+        if _clonefile(os.fsencode(kaynak), os.fsencode(hedef), 0) != 0:
+            hata = ctypes.get_errno()
+            raise OSError(hata, os.strerror(hata), str(hedef))
+        return
+    if fcntl is None or not sys.platform.startswith("linux"):
+        raise OSError(errno.ENOTSUP, "reflink desteklenmiyor")
+    with open(kaynak, "rb") as k, open(hedef, "wb") as h:
+        try:
+            fcntl.ioctl(h.fileno(), FICLONE, k.fileno())
+        except OSError:
+            h.close()
+            os.unlink(hedef)
+            raise
+
+
+def _cekirdek_kopyala(kaynak, hedef, fonksiyon):
+    """copy_file_range / sendfile: veri kullanıcı alanına hiç çıkmadan çekirdekte aktarılır."""
+    with open(kaynak, "rb") as k, open(hedef, "wb") as h:
+        kalan = os.fstat(k.fileno()).st_size
+        konum = 0
+        try:
+            while kalan > 0:
+                if fonksiyon is os.sendfile:
+                    aktarilan = os.sendfile(h.fileno(), k.fileno(), konum, min(kalan, CEKIRDEK_PARCA_BOYUTU))
+                else:
+                    aktarilan = os.copy_file_range(k.fileno(), h.fileno(), min(kalan, CEKIRDEK_PARCA_BOYUTU),
+                                                   konum, konum)
+                if aktarilan == 0:
+                    break
+                konum += aktarilan
+                kalan -= aktarilan
+        except OSError:
+            h.close()
+            os.unlink(hedef)
+            raise
+        if kalan > 0:
+            # Çekirdek veriyi eksik aktardı (bazı özel dosya sistemleri): bu dosyayı başka yöntemle al
+            h.close()
+            os.unlink(hedef)
+            raise _SonrakiYontem()
+
+
+def _tamponla_kopyala(kaynak, hedef):
+    """
+    Son çare: büyük, yeniden kullanılan tamponla okuma/yazma (ek bellek ayırmadan).
+    Tamponsuz write() kısmi yazabilir: kalan kısım tekrar yazılır. Sonda hedef boyutu
+    kaynakla aynı değilse hedef silinir ve OSError verilir.
+    """
+    tampon = bytearray(TAMPON_BOYUTU)
+    bakis = memoryview(tampon)
+    with open(kaynak, "rb", buffering=0) as k, open(hedef, "wb", buffering=0) as h:
+        try:
+            yazilan = 0
+            while True:
+                okunan = k.readinto(tampon)
+                if not okunan:
+                    break
+                konum = 0
+                while konum < okunan:
+                    parca = h.write(bakis[konum:okunan])
+                    if not parca:
+                        raise OSError(errno.EIO, "Hedefe yazılamadı (0 bayt yazıldı)", hedef)
+                    konum += parca
+                yazilan += okunan
+            kaynak_boyut = os.fstat(k.fileno()).st_size
+            hedef_boyut = os.fstat(h.fileno()).st_size
+            if hedef_boyut != kaynak_boyut or yazilan != kaynak_boyut:
+                raise OSError(errno.EIO, f"Eksik kopya: {hedef_boyut} / {kaynak_boyut} bayt", hedef)
+        except BaseException:
+            h.close()
+            os.unlink(hedef)
+            raise
+
+
+_YONTEMLER = [("klon", _klonla)]
+if hasattr(os, "copy_file_range"):
+    _YONTEMLER.append(("copy_file_range", lambda k, h: _cekirdek_kopyala(k, h, os.copy_file_range)))
+if hasattr(os, "sendfile") and sys.platform.startswith("linux"):
+    _YONTEMLER.append(("sendfile", lambda k, h: _cekirdek_kopyala(k, h, os.sendfile)))
+
+# =============================================================================
+# 🚀 ORTAK KOPYALAMA
+# =============================================================================
+
+def kopyala(kaynak, hedef, baglanti=False, metaveri=True):
+    """
+    Dosyayı en ucuz yöntemle kopyalar ve kullanılan yöntemin adını döner.
+
+    Sıra: (baglanti=True ise) hardlink -> reflink/clonefile -> copy_file_range -> sendfile
+          -> büyük tamponla kopya. Desteklenmeyen yöntem o disk çifti için bir daha denenmez.
+    metaveri=True ise izinler ve zaman damgaları korunur (shutil.copy2 gibi).
+
+    Not: Kopya önce hedefin yanındaki geçici dosyaya yapılır ve başarılıysa yerine taşınır
+    (os.replace, bkz. atomik_yaz). Kopyalama başarısız olursa önceki hedef olduğu gibi kalır;
+    hedef kaynağa bağlı (hardlink) bir dosyaysa üzerine yazılmadığından kaynak bozulmaz.
+    """
+    kaynak, hedef = os.fspath(kaynak), os.fspath(hedef)
+    if os.path.lexists(hedef) and os.path.abspath(kaynak) == os.path.abspath(hedef):
+        raise shutil.SameFileError(f"{kaynak} ve {hedef} aynı dosya")
+
+    gecici = f"{hedef}.{os.getpid()}.tmp"
+    try:
+        if os.path.lexists(gecici):
+            os.unlink(gecici)
+        yontem = _yeni_dosyaya_kopyala(kaynak, gecici, baglanti, metaveri)
+        os.replace(gecici, hedef)
+        if os.path.lexists(gecici):
+            # Hedef zaten kaynağa bağlıydı: aynı dosyanın iki adı arasında rename bir şey yapmaz
+            os.unlink(gecici)
+    except BaseException:
+        try:
+            os.unlink(gecici)
+        except OSError:
+            pass
+        raise
+    return yontem
+
+
+def _yeni_dosyaya_kopyala(kaynak, hedef, baglanti, metaveri):
+    """kopyala'nın yöntem zinciri; hedef henüz var olmayan (geçici) bir yoldur."""
+    kaynak_aygit = os.stat(kaynak).st_dev
+    hedef_aygit = os.stat(os.path.dirname(os.path.abspath(hedef))).st_dev
+    aygitlar = (kaynak_aygit, hedef_aygit)
+
+    # Aynı diskte hardlink: veri hiç kopyalanmaz, meta veri zaten ortaktır
+    if baglanti and kaynak_aygit == hedef_aygit and not _desteksiz_mi("hardlink", aygitlar):
+        try:
+            os.link(kaynak, hedef)
+            return "hardlink"
+        except OSError as e:
+            # EMLINK: bu dosyanın bağlantı sınırı doldu, disk yine de destekliyor
+            if e.errno != errno.EMLINK:
+                if e.errno not in DESTEKSIZ_HATALAR:
+                    raise
+                _desteksiz_isaretle("hardlink", aygitlar)
+
+    yontem = "tampon"
+    for ad, fonksiyon in _YONTEMLER:
+        # Reflink sadece aynı disk içinde mümkündür
+        if ad == "klon" and kaynak_aygit != hedef_aygit:
+            continue
+        if _desteksiz_mi(ad, aygitlar):
+            continue
+        try:
+            fonksiyon(kaynak, hedef)
+            yontem = ad
+            break
+        except _SonrakiYontem:
+            continue
+        except OSError as e:
+            if e.errno not in DESTEKSIZ_HATALAR:
+                raise
+            _desteksiz_isaretle(ad, aygitlar)
+    else:
+        _tamponla_kopyala(kaynak, hedef)
+
+    if metaveri:
+        shutil.copystat(kaynak, hedef)
+    return yontem
+
+
+def atomik_yaz(hedef, veri):
+    """
+    Baytları önce geçici dosyaya yazıp yerine taşır (os.replace).
+    Yarıda kesilirse hedefte yarım dosya kalmaz; hedef bir hardlink ise bağlı dosya bozulmaz.
+    """
+    hedef = os.fspath(hedef)
+    gecici = f"{hedef}.{os.getpid()}.tmp"
+    try:
+        with open(gecici, "wb") as f:
+            f.write(veri)
+        os.replace(gecici, hedef)
+    except BaseException:
+        try:
+            os.unlink(gecici)
+        except OSError:
+            pass
+        raise
@@ -1,10 +1,27 @@
 import pandas as pd
 import shutil
 import os
+import io
+import math
+import time
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from tqdm import tqdm
 from PIL import Image, ImageFile
 
+import cikti_kodlayicilari
+import icerik_indeksi
+import is_plani
+import jpeg_araclari
+import kopya_motoru
+import kalite_tahmincisi
+import optimizasyon_metrikleri
+import piksel_butcesi
+import optimizasyon_manifesti
+
 # =============================================================================
 # ⚙️ AYARLAR VE KONFİGÜRASYON
 # =============================================================================
@@ -17,9 +34,17 @@ HEDEF_ANA_KLASOR = Path("/Volumes/KIOXIA/Optimize_Edilmis_Urunler_V7")
 
 # GÜVENLİK MODU 
 # True  -> Sadece simülasyon yapar, dosya kopyalamaz/oluşturmaz.
+#          Çalışmanın süresi, çıktı boyutu ve yeniden sıkıştırılacak görsel sayısı Ebat bazında tahmin edilir.
 # False -> Gerçek işlem yapar.
 DRY_RUN = False 
 
+# 🔮 SİMÜLASYON TAHMİNİ (DRY_RUN = True iken)
+# Tüm görsellerin boyutu ve JPEG başlığı okunur (decode yok); yeniden sıkıştırılacakların her Ebat'tan
+# küçük bir örneği bellekte gerçekten işlenir ve ölçülen oranlar Ebat'ın geri kalanına uygulanır.
+SIMULASYON_ORNEK_ORANI = 0.02     # Yeniden sıkıştırılacak görsellerin denenecek oranı
+SIMULASYON_MIN_ORNEK = 3          # Her Ebat'tan en az bu kadar örnek (görsel sayısı yettiğince)
+SIMULASYON_RAPORU = "Simulasyon_Raporu.xlsx"
+
 # 📉 OPTİMİZASYON AYARLARI
 HEDEF_MAX_BOYUT_MB = 4.0      # Hedef: Dosya boyutu 4MB altı olsun
 STANDART_KISA_KENAR = 1000    # Hedef: Kısa kenar maksimum 1000px olsun
@@ -27,98 +52,1185 @@ MIN_KALITE = 60               # Kalite en fazla %60'a düşsün
 BASLANGIC_KALITE = 95         # Başlangıç kalitesi
 KALITE_AZALTMA_ADIMI = 5      # Döngüde kalite düşürme adımı
 
+# 🪜 TÜREV ÇIKTILAR (Tek çözmeden birden çok boyut)
+# Ana çıktıya (HEDEF_ANA_KLASOR / STANDART_KISA_KENAR / HEDEF_MAX_BOYUT_MB) ek olarak üretilecek boyutlar.
+# Her görsel bir kez çözülür; boyutlar büyükten küçüğe, her biri bir öncekinden küçültülerek üretilir.
+# Klasör yapısı ana çıktıyla aynıdır: klasor / Ebat / Ürün / Yüzey / dosya. Boş liste -> sadece ana çıktı.
+# İsteğe bağlı "bicim" anahtarı türevin çıktı biçimini seçer (yoksa CIKTI_BICIMI).
+TUREVLER = [
+    # {"ad": "web",   "kisa_kenar": 1600, "max_mb": 1.0, "klasor": Path("/Volumes/KIOXIA/Turevler/Web"), "bicim": "webp"},
+    # {"ad": "kucuk", "kisa_kenar": 300,  "max_mb": 0.1, "klasor": Path("/Volumes/KIOXIA/Turevler/Kucuk")},
+]
+ANA_CIKTI = "ana"
+
+# 🖼 ÇIKTI BİÇİMİ
+# Ana çıktının biçimi: "jpeg", "webp" veya "avif" (tanımlar: cikti_kodlayicilari.KODLAYICILAR).
+# Tüm biçimlerde ICC profili korunur ve aynı kalite araması (MB sınırı altındaki en yüksek kalite) yapılır.
+# JPEG dışı biçimlerde orijinal hiçbir zaman aynen kopyalanmaz; her seviye o biçimde yeniden kodlanır.
+# Biçimleri karşılaştırmak için aynı kısa kenarlı iki türev tanımlayın (örn. biri "jpeg", biri "webp"):
+# özet raporda biçim başına çıktı baytı ve kodlama süresi yer alır.
+CIKTI_BICIMI = "jpeg"
+
+# 🪶 KALİTEYİ KORUYAN HIZLI YOL
+# True -> Boyutlandırma gerekmeyen ama boyut sınırını aşan JPEG'ler önce orijinal niceleme tablolarıyla
+#         (quality="keep", alt örnekleme ve progresif yapı korunur) ve optimize Huffman tablolarıyla yeniden
+#         kaydedilir. Sınıra sığarsa kalite araması hiç yapılmaz: tek kodlama, kalite 95'e indirilmez
+#         (aynı niceleme -> ek kayıp yok denecek kadar az). Sığmazsa normal kalite aramasına geçilir.
+#         ALGISAL_KALITE açıkken kullanılmaz (orada amaç gözle fark edilmeyen daha düşük kaliteye inmektir).
+KALITE_KORUYAN_YOL = True
+KORUYAN_YOL_AZAMI_ORAN = 1.15   # Kaynak sınırın bu katından büyükse denenmez (Huffman o kadar kazandırmaz)
+
+# 🏷 EXIF
+# False -> Yeniden kodlanan görsellere EXIF yazılmaz (gömülü küçük resim dahil tüm EXIF atılır; önceki davranış).
+# True  -> EXIF (yön, tarih, kamera bilgileri) korunur, sadece gömülü küçük resim (thumbnail) atılır.
+# Not: Aynen kopyalanan görsellere dokunulmaz.
+EXIF_KORU = False
+
+# 🎨 CMYK -> sRGB DÖNÜŞÜMÜ (Renk yönetimli, isteğe bağlı)
+# False -> CMYK görseller CMYK kalır, ICC profili aynen korunur (varsayılan).
+# True  -> CMYK görseller gömülü ICC profiliyle sRGB'ye dönüştürülür ve sRGB profili gömülür
+#          (web tarayıcıları CMYK JPEG'i doğru gösteremez). Dönüşüm her farklı profil için süreç
+#          başına bir kez kurulur ve önbellekten kullanılır; CMYK görseller aynen kopyalanmaz.
+CMYK_SRGB_DONUSUMU = False
+CMYK_VARSAYILAN_PROFIL = None     # Profilsiz CMYK görseller için ICC dosyası yolu (None -> basit dönüşüm)
+
+# 🔬 HIZLI KÜÇÜLTME (Draft + Reduce)
+# True -> Büyük JPEG'ler DCT aşamasında 1/2, 1/4, 1/8 ölçekli çözülür (draft), sonra tam sayı katla
+#         küçültülür (reduce) ve son adım LANCZOS ile yapılır. Çok daha az bellek ve süre harcar.
+HIZLI_KUCULTME = True
+KUCULTME_PAYI = 2             # Draft/reduce sonrası görsel hedefin en az bu katı kadar büyük kalır (kalite payı)
+
+# 🎯 KALİTE TAHMİNİ
+# True -> Önceki kodlamalardan (Ebat bazında) öğrenilen modelle ilk denenecek kalite tahmin edilir;
+#         isabetli tahminde 3-4 yerine 1-2 kodlama yeterli olur. Model KALITE_MODELI_DOSYASI'nda saklanır.
+KALITE_TAHMINI = True
+KALITE_MODELI_DOSYASI = kalite_tahmincisi.MODEL_DOSYASI
+
+# 👁 ALGISAL KALİTE HEDEFİ (SSIM)
+# False -> Boyut sınırına (max_mb) sığan EN YÜKSEK kalite seçilir (kolay görseller 95'te kalır).
+# True  -> Sınıra sığan kaliteden aşağı inilerek, SSIM'i ALGISAL_HEDEF_SSIM'in altına düşmeyen EN DÜŞÜK
+#          kalite seçilir: gözle fark edilmeyecek kadar sıkıştırılır, arşiv küçülür. Boyut sınırı yine geçerlidir,
+#          aday kaliteler aynıdır (BASLANGIC_KALITE..MIN_KALITE). SSIM, 2x küçültülmüş parlaklık düzleminde
+#          vektörel (NumPy) hesaplanır (bkz. algisal_kalite.py). Seçilen kalite ve skor metrik raporuna yazılır.
+# Not: 'numpy' gerektirir. Hedef 0.99 (küçültülmüş düzlemde) ~ dokulu görsellerde 80-85 kaliteye karşılık gelir;
+#      daha temkinli sonuç için 0.995.
+ALGISAL_KALITE = False
+ALGISAL_HEDEF_SSIM = 0.99
+
+# 📎 KOPYALAMA
+# İşlem gerektirmeyen görseller ortak kopya motoruyla aktarılır (reflink/clonefile, copy_file_range,
+# sendfile, olmazsa büyük tampon; izin ve tarihler korunur).
+# True -> Kaynak ve hedef aynı diskteyse kopya yerine hardlink oluşturulur (yer kaplamaz, anlık).
+#         Çıktılar her zaman geçici dosya + yer değiştirme ile yazıldığından bağlı kaynak bozulmaz.
+KOPYA_HARDLINK = False
+
+# ♊ MÜKERRER GÖRSELLER
+# True -> Birebir aynı içerikteki görseller (farklı klasörlerde olsa bile) bir kez işlenir,
+#         diğer kopyalar için ilk üretilen çıktı dosyası kopyalanır.
+MUKERRER_TEK_ISLEM = True
+
+# 📒 MANİFEST (Kaldığı yerden devam)
+# True -> Her işlenen dosya hedef klasördeki manifeste kaydedilir (kaynak boyutu/mtime, ayarlar, çıktı).
+#         Tekrar çalıştırmada kaynağı ve ayarları değişmemiş, çıktısı yerinde duran dosyalar atlanır;
+#         yarıda kesilen bir çalışma kaldığı yerden devam eder.
+MANIFEST_KULLAN = True
+
+# ⚡ PARALEL İŞLEME
+# Aynı anda görsel işleyen süreç (process) sayısı. 1 -> Tek çekirdekli sıralı çalışma (varsayılan).
+# Çok çekirdekli makinede önerilen: os.cpu_count() - 1 (panelden de seçilebilir). Çıktılar sıralı
+# çalışmayla bayt bayt aynıdır; sadece süre ve bellek kullanımı değişir.
+# Görevler işçilere tek tek verilir: her görev çözme + küçültme + kodlama içeren tam bir görseldir
+# (onlarca-yüzlerce ms), gönderim maliyeti bunun yanında ihmal edilir. Gönderim zaten ON_OKUMA_SAYISI
+# ile sınırlı pencerelerde yapılır; görevleri ayrıca paketlemek iş planının (LPT) sırasını ve piksel
+# bütçesinin görsel başına bellek ayırmasını bozacağı için yapılmaz.
+ISCI_SAYISI = 1
+
+# 🗺 İŞ PLANI (Maliyet sıralı dağıtım)
+# True -> İşlemeden önce her görselin maliyeti JPEG başlığındaki piksel sayısı ve dosya boyutundan tahmin edilir
+#         (bkz. is_plani.py). Yeniden sıkıştırılacaklar en pahalıdan ucuza (LPT) işçilere verilir; böylece sona
+#         kalan birkaç büyük klasör diğer işçileri boşta bekletmez. Aynen kopyalanacaklar ayrı bir grupta, en sonda
+#         (klasör sırasıyla) aktarılır. Plan IS_PLANI_DOSYASI'na yazılır (simülasyonda da).
+# False -> Görseller Excel satır sırasıyla işlenir.
+IS_PLANI = True
+IS_PLANI_DOSYASI = is_plani.PLAN_DOSYASI
+
+# 🚰 OKU / İŞLE / YAZ HATTI (Paralel modda)
+# Okuyucu thread kaynak baytlarını önceden okur, işçi süreçler çözer/kodlar, yazıcı çıktıları toplu yazar.
+# Disk ve CPU aynı anda çalışır; bellekte en fazla ISCI_SAYISI * ON_OKUMA_SAYISI görsel bekler.
+ON_OKUMA_SAYISI = 2           # İşçi başına önceden okunup sırada bekleyen görsel sayısı
+YAZMA_PARCA_BOYUTU = 8        # Yazıcının tek seferde diske yazdığı çıktı sayısı (okuma/yazma sıçramasını azaltır)
+
+# 🧮 PİKSEL BÜTÇESİ (Paralel modda bellek sınırı)
+# Her görselin çözülürken kaplayacağı bellek JPEG başlığındaki boyutlardan tahmin edilir; aynı anda
+# işlenenlerin toplamı bu sınırı aşmaz. Küçük görseller birlikte, dev görseller tek başına işlenir.
+# None -> Sınır yok (sadece işçi sayısı sınırlar).
+PIKSEL_BUTCESI_MB = piksel_butcesi.VARSAYILAN_BUTCE_MB
+BILINMEYEN_BOYUT_KATSAYISI = 10   # Başlığı okunamayan görselde tahmin: dosya boyutu x bu katsayı
+
+# 🐘 DEV GÖRSELLER (Sınırlı bellekle işleme)
+# Bu piksel sayısını aşan JPEG'ler tam çözünürlükte hiç çözülmez: HIZLI_KUCULTME kapalı olsa bile DCT
+# aşamasında 1/2-1/8 ölçekte çözülür (draft). Ölçek, çözülen raster DEV_GORSEL_BELLEK_MB'ye sığacak kadar
+# büyütülür (gerekirse KUCULTME_PAYI'ndan vazgeçilir, hedef boyutun altına inilmez). Hedef boyuta
+# SERIT_YUKSEKLIGI satırlık şeritler halinde küçültülür; her dev görselin tepe belleği (RSS) raporlanır.
+# Not: En büyük hedef, görselin yarısından büyükse draft yapılamaz ve görsel tam çözülür.
+DEV_GORSEL_ESIGI_MP = 100
+DEV_GORSEL_BELLEK_MB = 512
+SERIT_YUKSEKLIGI = 256
+
+# İşçi süreçlere aktarılan ayarlar (arayüzden değiştirilen değerler süreçlere de ulaşsın)
+ISCI_AYARLARI = [
+    "HEDEF_MAX_BOYUT_MB", "STANDART_KISA_KENAR", "MIN_KALITE", "BASLANGIC_KALITE", "KALITE_AZALTMA_ADIMI",
+    "HIZLI_KUCULTME", "KUCULTME_PAYI", "KALITE_TAHMINI", "TUREVLER", "CIKTI_BICIMI",
+    "CMYK_SRGB_DONUSUMU", "CMYK_VARSAYILAN_PROFIL",
+    "DEV_GORSEL_ESIGI_MP", "DEV_GORSEL_BELLEK_MB", "SERIT_YUKSEKLIGI", "BOZUK_KAYNAK_KONTROLU",
+    "ALGISAL_KALITE", "ALGISAL_HEDEF_SSIM", "KALITE_KORUYAN_YOL", "KORUYAN_YOL_AZAMI_ORAN", "EXIF_KORU",
+]
+
+# Sadece hızı etkileyen, çıktıyı değiştirmeyen ayarlar (manifest ayar özetine katılmaz)
+# (BOZUK_KAYNAK_KONTROLU sağlam görsellerin çıktısını değiştirmez; bozuklar zaten manifeste başarılı yazılmaz)
+CIKTIYI_ETKILEMEYEN_AYARLAR = {"KALITE_TAHMINI", "SERIT_YUKSEKLIGI", "BOZUK_KAYNAK_KONTROLU"}
+
+# 📈 METRİK RAPORU
+# True -> Her görsel için okuma/çözme/küçültme/kodlama/yazma süreleri, deneme sayısı, kalite, giriş/çıkış
+#         baytı ve izlenen yol METRIK_DOSYASI'na (CSV); görsel/sn, MB/sn, p50/p95 gecikme OZET_DOSYASI'na (JSON) yazılır.
+METRIK_RAPORU = True
+METRIK_DOSYASI = optimizasyon_metrikleri.METRIK_DOSYASI
+METRIK_OZET_DOSYASI = optimizasyon_metrikleri.OZET_DOSYASI
+
+# 🩺 BOZUK KAYNAK KONTROLÜ
+# True -> Her görselin JPEG yapısı (SOI/segmentler/EOI) işlenmeden önce baytlarından doğrulanır (görsel
+#         başına birkaç ms). Bozuk görsel (kesik, yarım kopya) eksik kısmı gri bantla doldurularak sessizce
+#         yeniden kodlanmaz, aynen de kopyalanmaz: çıktı üretilmez, metrikte "bozuk_kaynak" olarak raporlanır.
+#         Yapısı şüpheli olanlar kesik veriye izin verilmeden çözülerek denenir.
+#         DİKKAT: Aynen kopyalanacak görseller de kontrol için ayrıca okunur (disk okuması iki katına çıkar)
+#         ve kesik kaynaklar artık hedefe kopyalanmaz.
+# False -> Varsayılan davranış: kesik görseller de (eksik kısım gri) işlenir, aynen kopyalananlara dokunulmaz.
+# Tüm arşivi önceden (gece) taramak için: butunluk_denetcisi.py
+BOZUK_KAYNAK_KONTROLU = False
+
 # 🔧 PIL AYARLARI
 Image.MAX_IMAGE_PIXELS = None       
-ImageFile.LOAD_TRUNCATED_IMAGES = True 
+ImageFile.LOAD_TRUNCATED_IMAGES = True  # BOZUK_KAYNAK_KONTROLU açıksa bozuk kaynaklar önceden ayıklanır
+
+# =============================================================================
+# ⚡ İŞÇİ SÜREÇ FONKSİYONLARI
+# =============================================================================
+
+_ISCI_OPTIMIZER = None
+
+def _isci_ayarlari():
+    """Ana süreçteki güncel ayarları işçilere gönderilecek sözlük olarak toplar."""
+    return {ad: globals()[ad] for ad in ISCI_AYARLARI}
+
+def _isci_baslat(ayarlar, model=None):
+    """Her işçi süreç açılışında bir kez çalışır: ayarları ve kalite modelinin bir kopyasını alır."""
+    global _ISCI_OPTIMIZER
+    globals().update(ayarlar)
+    _ISCI_OPTIMIZER = StokOptimizeEdici(ANALIZ_DOSYASI)
+    _ISCI_OPTIMIZER.tahminci = kalite_tahmincisi.KaliteTahmincisi(model)
+
+def _veri_isle(veri, grup):
+    ciktilar, bilgi = _ISCI_OPTIMIZER.optimize_veri(veri, grup)
+    # İşçinin kendi model kopyası da öğrensin (ana süreç kendi modelini ayrıca günceller)
+    _ISCI_OPTIMIZER.tahmin_ogren(bilgi)
+    return ciktilar, bilgi
 
 class StokOptimizeEdici:
     def __init__(self, excel_path):
         self.excel_path = Path(excel_path)
+        self.tahminci = kalite_tahmincisi.KaliteTahmincisi()
+        self.tahmin_sayaci = {"tahmin": 0, "isabet": 0, "deneme": 0, "kodlanan": 0}
+        self.metrikler = None
+        self.algisal_kaliteler = {}  # (grup, seviye) -> son seçilen algısal kalite (aramaya başlangıç)
+
+    def grup_adi(self, target_path):
+        """Kalite modelinin grubu: hedef yolundaki Ebat klasörü (HEDEF / Ebat / Ürün / Yüzey / dosya)."""
+        try:
+            return Path(target_path).relative_to(HEDEF_ANA_KLASOR).parts[0]
+        except (ValueError, IndexError):
+            return kalite_tahmincisi.GENEL_GRUP
+
+    def tahmin_ogren(self, bilgi):
+        """Bir görselin (ve türevlerinin) kodlama gözlemlerini kalite modeline ekler."""
+        if not bilgi:
+            return
+        if bilgi.get("gozlemler"):
+            self.tahminci.ogren(bilgi["grup"], bilgi["kaynak_bpp"], bilgi["piksel"], bilgi["gozlemler"],
+                                bilgi.get("bicim"))
+        for piksel, gozlemler, bicim in bilgi.get("turev_gozlemleri", ()):
+            self.tahminci.ogren(bilgi["grup"], bilgi["kaynak_bpp"], piksel, gozlemler, bicim)
+
+    def bilgi_isle(self, bilgi):
+        """Ana süreçte her görselin sonucu: metriği kaydeder, modeli günceller, tahmin isabetini sayar."""
+        if self.metrikler and bilgi:
+            self.metrikler.ekle(bilgi)
+        if not bilgi or not bilgi.get("gozlemler"):
+            return
+        self.tahmin_ogren(bilgi)
+        sayac = self.tahmin_sayaci
+        sayac["kodlanan"] += 1
+        sayac["deneme"] += bilgi.get("deneme") or len(bilgi["gozlemler"])
+        if bilgi.get("tahmin") is not None:
+            sayac["tahmin"] += 1
+            # Tahmin boyut aramasının sonucunu hedefler (algısal arama sonradan daha da düşürebilir)
+            if bilgi["tahmin"] == bilgi.get("boyut_kalitesi", bilgi.get("kalite")):
+                sayac["isabet"] += 1
 
     def get_file_size_mb(self, path):
         """Dosya boyutunu MB cinsinden hesaplar."""
         return os.path.getsize(path) / (1024 * 1024)
 
-    def optimize_image(self, source_path, target_path):
+    def kucult(self, img, hedef_boyut, sureler=None, seritli=False):
         """
-        Görseli okur, RENK FORMATINA DOKUNMADAN (CMYK/RGB korunur),
-        ICC Renk Profilini KORUR (Renk kaymasını önler),
-        kısa kenarı 1000px'e indirir ve 4MB altına sıkıştırır.
+        Görseli hedef boyuta küçültür. HIZLI_KUCULTME açıksa:
+          1) draft : JPEG, DCT aşamasında 1/2, 1/4 veya 1/8 ölçekte çözülür (tam raster hiç oluşmaz)
+          2) reduce: tam sayı katla kutu (box) küçültme
+          3) LANCZOS: son hassas adım
+        İlk iki adım görseli hedefin en az KUCULTME_PAYI katı büyüklükte bırakır; son görünüm aynı kalır.
+        Not: draft sadece henüz yüklenmemiş (load edilmemiş) JPEG'lerde etkilidir; önceden daha güçlü
+        bir draft yapılmışsa (dev görsel) o geçerli kalır.
+        seritli=True ise LANCZOS adımı şerit şerit yapılır (bkz. seritli_kucult).
+        sureler verilirse çözme (decode) ve küçültme süreleri ayrı ayrı yazılır.
+        """
+        hedef_w, hedef_h = hedef_boyut
+        bas = time.perf_counter()
+        if HIZLI_KUCULTME:
+            if img.format == "JPEG":
+                img.draft(img.mode, (hedef_w * KUCULTME_PAYI, hedef_h * KUCULTME_PAYI))
+
+        if sureler is not None:
+            # Çözmeyi ayrıca ölçebilmek için burada yükle (reduce/resize zaten yükleyecekti)
+            img.load()
+            sureler["cozme_sn"] = time.perf_counter() - bas
+            bas = time.perf_counter()
+
+        if HIZLI_KUCULTME:
+            kat = min(img.width // (hedef_w * KUCULTME_PAYI), img.height // (hedef_h * KUCULTME_PAYI))
+            if kat >= 2:
+                img = img.reduce(kat)
+
+        # LANCZOS: En iyi küçültme filtresi
+        if seritli:
+            img = self.seritli_kucult(img, (hedef_w, hedef_h))
+        else:
+            img = img.resize((hedef_w, hedef_h), Image.LANCZOS)
+        if sureler is not None:
+            sureler["kucultme_sn"] = time.perf_counter() - bas
+        return img
+
+    def seritli_kucult(self, img, hedef_boyut):
+        """
+        LANCZOS küçültmeyi SERIT_YUKSEKLIGI satırlık çıktı şeritleri halinde yapar. Her şerit, kaynağın
+        sadece ilgili bandından (filtre payıyla birlikte) üretilir; böylece küçültmenin ara görüntüsü
+        (hedef genişlik x kaynak yüksekliği) hiç oluşmaz. Şerit sınırında iz kalmaz: resize(box=...)
+        filtre için bandın dışındaki satırları da kullanır (tek seferlik küçültmeden en fazla ±1 yuvarlama farkı).
         """
+        hedef_w, hedef_h = hedef_boyut
+        oran = img.height / hedef_h
+        cikti = Image.new(img.mode, hedef_boyut)
+        for y in range(0, hedef_h, SERIT_YUKSEKLIGI):
+            y_son = min(hedef_h, y + SERIT_YUKSEKLIGI)
+            serit = img.resize((hedef_w, y_son - y), Image.LANCZOS, box=(0, y * oran, img.width, y_son * oran))
+            cikti.paste(serit, (0, y))
+        return cikti
+
+    def jpeg_kodla(self, img, kalite, save_kwargs):
+        """Görseli verilen kalitede bellekte JPEG'e kodlar, baytları döner."""
+        tampon = io.BytesIO()
         try:
-            file_size_mb = self.get_file_size_mb(source_path)
+            # Formatı koruyarak kaydet (CMYK/RGB)
+            img.save(tampon, "JPEG", quality=kalite, **save_kwargs)
+        except OSError:
+            # CMYK JPEG yazma hatası vb. olursa
+            raise Exception("Format Yazma Hatası")
+        return tampon.getvalue()
+
+    def kodla(self, img, kalite, save_kwargs, bicim="jpeg"):
+        """Seçili çıktı biçiminde bellekte kodlar (JPEG eski yoldan, diğerleri cikti_kodlayicilari ile)."""
+        if bicim == "jpeg":
+            return self.jpeg_kodla(img, kalite, save_kwargs)
+        return cikti_kodlayicilari.kodla(img, bicim, kalite, save_kwargs)
+
+    def kaliteyi_bul(self, img, save_kwargs, ilk_kalite=None, max_mb=None, bicim="jpeg"):
+        """
+        HEDEF_MAX_BOYUT_MB (veya max_mb) altında kalan EN YÜKSEK kaliteyi bellekte ikili arama ile bulur.
+        Aday kaliteler eski döngüyle aynıdır (BASLANGIC_KALITE'den MIN_KALITE'ye ADIM ADIM),
+        ama diske hiç yazılmaz. Varsayılan 8 adayda eski döngü 8'e kadar kodlama yapar; burada
+        başlangıç kalitesi sığarsa 1, sığmazsa kalan adaylar ikiye bölünerek en fazla 4 kodlama yapılır.
+        ilk_kalite (tahmin) verilirse arama oradan başlar: önce komşu aday denenir, tahmin
+        doğruysa 2 kodlamada biter (isabetsiz tahminde en fazla 5). Sonuç tahminden bağımsız olarak aynıdır.
+        bicim: Çıktı biçimi (jpeg / webp / avif); arama her biçimde aynıdır.
+        Dönüş: (bayt | None, kalite | None, [(kalite, bayt_sayisi), ...] gözlemler)
+        """
+        limit = (max_mb or HEDEF_MAX_BOYUT_MB) * 1024 * 1024
+        adaylar = list(range(BASLANGIC_KALITE, MIN_KALITE - 1, -KALITE_AZALTMA_ADIMI))
+        gozlemler = []
+
+        def dene(sira):
+            veri = self.kodla(img, adaylar[sira], save_kwargs, bicim)
+            gozlemler.append((adaylar[sira], len(veri)))
+            return veri
+
+        # Tahmin yoksa en sık durum: Başlangıç kalitesi zaten yeterli (tek kodlama)
+        tahminli = ilk_kalite in adaylar
+        bas = adaylar.index(ilk_kalite) if tahminli else 0
+        veri = dene(bas)
+
+        # Boyut kaliteyle birlikte azalır: sığan en yüksek kaliteyi ikili arama ile bul
+        # (büyük indeks = düşük kalite)
+        if len(veri) < limit:
+            en_iyi, en_iyi_kalite = veri, adaylar[bas]
+            alt, ust = 0, bas - 1        # daha yüksek kaliteler
+        else:
+            en_iyi, en_iyi_kalite = None, None
+            alt, ust = bas + 1, len(adaylar) - 1
+
+        # Tahmin varsa ilk adımda ona en yakın aday denenir (tahmin isabetliyse arama hemen biter);
+        # yoksa doğrudan ikiye bölünür
+        if tahminli:
+            orta = ust if en_iyi is not None else alt
+        else:
+            orta = (alt + ust) // 2
+        while alt <= ust:
+            veri = dene(orta)
+            if len(veri) < limit:
+                en_iyi, en_iyi_kalite = veri, adaylar[orta]
+                ust = orta - 1  # daha yüksek kaliteyi dene
+            else:
+                alt = orta + 1
+            orta = (alt + ust) // 2
+
+        return en_iyi, en_iyi_kalite, gozlemler
+
+    def koruyarak_kodla(self, img, save_kwargs, max_mb=None):
+        """
+        JPEG'i orijinal niceleme tabloları ve alt örneklemesiyle (quality="keep"), optimize Huffman
+        tablolarıyla bellekte yeniden kodlar. img, diskten açılmış (küçültülmemiş) JPEG olmalıdır.
+        Dönüş: bayt | None (kodlanamadı veya max_mb sınırına sığmadı -> çağıran kalite aramasına geçer)
+        """
+        ayarlar = dict(save_kwargs, progressive=bool(img.info.get("progressive")))
+        ayarlar["optimize"] = True
+        # Pillow optimize/keep modunda çıktının tamamını tek tampona yazar ve tamponu ~2 bayt/piksel varsayar;
+        # yüksek bpp kaynaklarda libjpeg "Suspension not allowed here" verir. Tampon ham piksel boyutuna büyütülür.
+        onceki = ImageFile.MAXBLOCK
+        ImageFile.MAXBLOCK = max(onceki, len(img.getbands()) * img.width * img.height
+                                 + len(ayarlar.get("icc_profile") or b"") + len(ayarlar.get("exif") or b"") + 1024)
+        try:
+            veri = self.jpeg_kodla(img, "keep", ayarlar)
+        except Exception:
+            return None
+        finally:
+            ImageFile.MAXBLOCK = onceki
+        if max_mb is not None and len(veri) >= max_mb * 1024 * 1024:
+            return None
+        return veri
+
+    def algisal_kaliteyi_bul(self, img, save_kwargs, veri, kalite, gozlemler, bicim="jpeg", anahtar=None):
+        """
+        Boyut aramasının bulduğu kaliteden (sınıra sığan en yüksek) aşağı doğru, SSIM'i ALGISAL_HEDEF_SSIM'in
+        altına düşmeyen EN DÜŞÜK kaliteyi ikili arama ile bulur (SSIM kaliteyle birlikte azalır).
+        Referansın parlaklık düzlemi bir kez çıkarılır; her aday bellekte kodlanıp ölçülür (gözlemlere eklenir).
+        anahtar verilirse arama aynı anahtarda son seçilen kaliteden başlar: isabetliyse 2 ölçümde biter.
+        Dönüş: (bayt, kalite, ssim)
+        """
+        import algisal_kalite
+        adaylar = list(range(BASLANGIC_KALITE, MIN_KALITE - 1, -KALITE_AZALTMA_ADIMI))
+        olcer = algisal_kalite.AlgisalOlcer(img)
+        skor = olcer.skor(veri)
+        if skor < ALGISAL_HEDEF_SSIM or kalite not in adaylar:
+            # Sınır zaten algısal hedefin altına itmiş: boyut sonucu kalır
+            return veri, kalite, skor
+
+        en_iyi, en_iyi_kalite, en_iyi_skor = veri, kalite, skor
+        alt, ust = adaylar.index(kalite) + 1, len(adaylar) - 1   # daha düşük kaliteler
+        onceki = self.algisal_kaliteler.get(anahtar)
+        orta = adaylar.index(onceki) if onceki in adaylar[alt:] else (alt + ust) // 2
+        ilk = True
+        while alt <= ust:
+            aday = self.kodla(img, adaylar[orta], save_kwargs, bicim)
+            gozlemler.append((adaylar[orta], len(aday)))
+            aday_skor = olcer.skor(aday)
+            if aday_skor >= ALGISAL_HEDEF_SSIM:
+                en_iyi, en_iyi_kalite, en_iyi_skor = aday, adaylar[orta], aday_skor
+                alt = orta + 1  # daha düşük kaliteyi dene
+                sonraki = alt
+            else:
+                ust = orta - 1
+                sonraki = ust
+            # İlk denemeden sonra komşu aday denenir (başlangıç isabetliyse arama hemen biter)
+            orta = sonraki if ilk else (alt + ust) // 2
+            ilk = False
+
+        if anahtar is not None:
+            self.algisal_kaliteler[anahtar] = en_iyi_kalite
+        return en_iyi, en_iyi_kalite, en_iyi_skor
+
+    def aynen_kopyala(self, kaynak, hedef, bilgi=None):
+        """Kaynağı hedefe değiştirmeden aktarır (ortak kopya motoru), kullanılan yöntemi kaydeder."""
+        yontem = kopya_motoru.kopyala(kaynak, hedef, baglanti=KOPYA_HARDLINK)
+        if bilgi is not None:
+            bilgi["kopya_yontemi"] = yontem
+
+    def seviyeler(self):
+        """Ana çıktı + türevler: [{"ad", "kisa_kenar", "max_mb", "bicim"}, ...] kısa kenara göre büyükten küçüğe."""
+        ana = {"ad": ANA_CIKTI, "kisa_kenar": STANDART_KISA_KENAR, "max_mb": HEDEF_MAX_BOYUT_MB,
+               "bicim": CIKTI_BICIMI}
+        turevler = [dict(t, bicim=t.get("bicim") or CIKTI_BICIMI) for t in TUREVLER]
+        return sorted([ana] + turevler, key=lambda s: -s["kisa_kenar"])
+
+    def hedefler(self, target_path):
+        """
+        Her seviyenin hedef dosyası: {ad: yol}. Türevler ana çıktıyla aynı alt klasör yapısını kullanır;
+        dosya uzantısı türevin biçimine göre belirlenir.
+        """
+        hedefler = {ANA_CIKTI: Path(target_path)}
+        if TUREVLER:
+            try:
+                goreli = Path(target_path).relative_to(HEDEF_ANA_KLASOR)
+            except ValueError:
+                goreli = Path(Path(target_path).name)
+            for turev in TUREVLER:
+                ad = cikti_kodlayicilari.dosya_adi(goreli.name, turev.get("bicim") or CIKTI_BICIMI)
+                hedefler[turev["ad"]] = Path(turev["klasor"]) / goreli.parent / ad
+        return hedefler
+
+    def dogrudan_kopyalanir_mi(self, source_path, file_size_mb, baslik=None):
+        """
+        ÖN KONTROL: Sadece JPEG başlığından karar (görsel açılmaz).
+        Kısa kenar zaten küçük ve dosya hedef boyutun altındaysa decode etmeden kopyalanır.
+        (Türev tanımlıysa bu koşul her türev için de sağlanmalıdır; JPEG dışı biçimde ve
+        CMYK_SRGB_DONUSUMU açıkken CMYK görselde hiç kopyalanmaz.)
+        """
+        seviyeler = self.seviyeler()
+        if any(seviye["bicim"] != "jpeg" for seviye in seviyeler):
+            return False
+        if any(file_size_mb >= seviye["max_mb"] for seviye in seviyeler):
+            return False
+        if baslik is None:
+            baslik = jpeg_araclari.jpeg_baslik_oku(source_path)
+        if CMYK_SRGB_DONUSUMU and baslik and baslik[2] == 4:
+            return False
+        return bool(baslik) and min(baslik[0], baslik[1]) <= min(seviye["kisa_kenar"] for seviye in seviyeler)
+
+    def kopyadan_once_dogrula(self, source_path, bilgi):
+        """
+        Decode edilmeden aynen kopyalanacak görselin bütünlüğünü (mmap ile) doğrular; bozuksa
+        BozukGorselHatasi verir. İşlenecek görseller optimize_veri içinde bellekten doğrulanır.
+        """
+        if not BOZUK_KAYNAK_KONTROLU:
+            return
+        _, durum, neden = jpeg_araclari.jpeg_butunluk_kontrolu(str(source_path))
+        if durum == "bozuk":
+            raise jpeg_araclari.BozukGorselHatasi(neden)
+        if neden:
+            bilgi["butunluk"] = neden
+
+    def dev_gorsel_mi(self, genislik, yukseklik):
+        return genislik * yukseklik > DEV_GORSEL_ESIGI_MP * 1_000_000
+
+    def cozme_olcegi(self, genislik, yukseklik, bilesen=3):
+        """
+        JPEG'in çözüleceği draft ölçeği (1, 2, 4, 8), sadece boyutlardan (kucult() ile aynı hesap):
+        draft en fazla 1/8, görsel en büyük hedefin KUCULTME_PAYI katından küçülmez.
+        Dev görselde HIZLI_KUCULTME kapalı olsa da draft yapılır ve çözülen raster DEV_GORSEL_BELLEK_MB'yi
+        aşıyorsa ölçek, hedefin altına inmeden büyütülür.
+        """
+        # PIL gri görüntüyü 1, RGB/CMYK'yı piksel başına 4 baytta tutar
+        piksel_bayti = 1 if bilesen == 1 else 4
+        kisa_kenar = min(genislik, yukseklik)
+        hedef = max(seviye["kisa_kenar"] for seviye in self.seviyeler())
+        dev = self.dev_gorsel_mi(genislik, yukseklik)
+
+        olcek = 1
+        if (HIZLI_KUCULTME or dev) and kisa_kenar > hedef:
+            while olcek < 8 and kisa_kenar // (olcek * 2) >= hedef * KUCULTME_PAYI:
+                olcek *= 2
+        if dev:
+            while (olcek < 8 and kisa_kenar // (olcek * 2) >= hedef and
+                   (genislik // olcek) * (yukseklik // olcek) * piksel_bayti > DEV_GORSEL_BELLEK_MB * 1024 * 1024):
+                olcek *= 2
+        return olcek
+
+    def bellek_tahmini(self, baslik, kaynak_bayt):
+        """
+        Görsel işlenirken kaplayacağı en yüksek bellek (bayt), sadece başlıktan:
+        kaynak baytları + draft ölçeğinde çözülen raster + küçültme/kodlama ara görüntüleri için pay.
+        """
+        if not baslik:
+            return kaynak_bayt * BILINMEYEN_BOYUT_KATSAYISI
+        genislik, yukseklik, bilesen = baslik
+        piksel_bayti = 1 if bilesen == 1 else 4
+        olcek = self.cozme_olcegi(genislik, yukseklik, bilesen)
+        cozulen = (genislik // olcek) * (yukseklik // olcek) * piksel_bayti
+        return kaynak_bayt + cozulen * 3 // 2
+
+    def optimize_veri(self, kaynak_veri, grup=kalite_tahmincisi.GENEL_GRUP):
+        """
+        Görseli bellekteki baytlardan işler, RENK FORMATINA DOKUNMADAN (CMYK/RGB korunur;
+        CMYK_SRGB_DONUSUMU açıksa CMYK profiliyle sRGB'ye çevrilir), ICC Renk Profilini KORUR (Renk kaymasını önler),
+        kısa kenarı 1000px'e indirir ve 4MB altına sıkıştırır.
+        TUREVLER tanımlıysa aynı çözülmüş görselden her türev de (büyükten küçüğe, bir öncekinden
+        küçültülerek) üretilir; görsel sadece bir kez çözülür. Her seviye kendi biçiminde kodlanır.
+        Dönüş: ({ad: çıktı baytları | None}, bilgi)  (None -> orijinal dosya aynen kullanılmalı)
+        bilgi: grup, yol, bicim, kaynak_bpp, piksel, tahmin, kalite, gozlemler (kalite modeli için),
+               deneme, cozme_sn, kucultme_sn, renk_sn, kodlama_sn, islem_sn, bicimler,
+               cozme_olcegi / tepe_rss_mb (sadece dev görsellerde), butunluk,
+               ssim / boyut_kalitesi (sadece ALGISAL_KALITE açıkken) (metrik raporu için)
+        Diske dokunmaz; hatalar çağırana iletilir. BOZUK_KAYNAK_KONTROLU açıkken bozuk JPEG'de
+        BozukGorselHatasi verilir (gri bantlı çıktı üretilmez).
+        """
+        file_size_mb = len(kaynak_veri) / (1024 * 1024)
+        bilgi = {"grup": grup, "yol": "kopya"}
+        ciktilar = {}
+        bas = time.perf_counter()
+
+        # Bütünlük: sadece yapı (decode yok); şüpheliyse kesik veriye izin vermeden bir kez çözülür
+        if BOZUK_KAYNAK_KONTROLU and not kaynak_veri:
+            raise jpeg_araclari.BozukGorselHatasi("Boş dosya (0 bayt)")
+        if BOZUK_KAYNAK_KONTROLU and kaynak_veri[:2] == b"\xff\xd8":
+            durum, neden = jpeg_araclari.jpeg_yapi_kontrolu(kaynak_veri)
+            if durum == "supheli":
+                hata = jpeg_araclari.tam_coz(io.BytesIO(kaynak_veri))
+                if hata:
+                    raise jpeg_araclari.BozukGorselHatasi(f"{neden} | Çözme: {hata}")
+                durum, neden = "uyari", f"{neden} (tam çözme başarılı)"
+            if durum == "bozuk":
+                raise jpeg_araclari.BozukGorselHatasi(neden)
+            if neden:
+                bilgi["butunluk"] = neden
+
+        with Image.open(io.BytesIO(kaynak_veri)) as img:
+            # --- ADIM 0: ICC Profilini Yakala (Renk Doğruluğu İçin) ---
+            icc_profile = img.info.get('icc_profile')
             
-            with Image.open(source_path) as img:
-                # --- ADIM 0: ICC Profilini Yakala (Renk Doğruluğu İçin) ---
-                icc_profile = img.info.get('icc_profile')
-                
-                # Orijinal boyutları al
-                width, height = img.size
-                kisa_kenar = min(width, height)
-                
-                # --- ADIM 1: Renk Dönüşümü İPTAL ---
-                # Kullanıcı isteği üzerine CMYK -> RGB dönüşümü kaldırıldı.
-                
+            # Orijinal boyutları al
+            width, height = img.size
+            kisa_kenar = min(width, height)
+
+            # --- ADIM 0.5: Dev görsel -> tam çözünürlükte hiç çözme (ölçekli çözme + şeritli küçültme) ---
+            dev = img.format == "JPEG" and self.dev_gorsel_mi(width, height)
+            if dev:
+                piksel_butcesi.tepe_rss_sifirla()
+                olcek = self.cozme_olcegi(width, height, len(img.getbands()))
+                if olcek > 1:
+                    img.draft(img.mode, (width // olcek, height // olcek))
+                bilgi["cozme_olcegi"] = olcek
+            
+            # --- ADIM 1: Renk Dönüşümü (Varsayılan: YOK) ---
+            # Kullanıcı isteği üzerine CMYK -> RGB dönüşümü kaldırıldı; sadece CMYK_SRGB_DONUSUMU
+            # açıksa, küçültmeden sonra (daha az pikselde) ICC profiliyle yapılır (bkz. ADIM 3-B).
+            donustur = CMYK_SRGB_DONUSUMU and img.mode == "CMYK"
+            if donustur and not icc_profile and CMYK_VARSAYILAN_PROFIL:
+                donusum_profili = cikti_kodlayicilari.profil_dosyasi_oku(CMYK_VARSAYILAN_PROFIL)
+            else:
+                donusum_profili = icc_profile
+
+            # ÖNEMLİ: icc_profile her seviyenin kodlama ayarlarına eklenerek renk haritası geri yüklenir
+            # (bkz. cikti_kodlayicilari.hazirla). EXIF_KORU açıksa EXIF de (küçük resim hariç) eklenir.
+            exif = cikti_kodlayicilari.exif_kucuk_resimsiz(img) if EXIF_KORU else None
+            bilgi["kaynak_bpp"] = len(kaynak_veri) / (width * height)
+            adaylar = list(range(BASLANGIC_KALITE, MIN_KALITE - 1, -KALITE_AZALTMA_ADIMI))
+
+            # Her seviye bir öncekinin küçültülmüş halinden üretilir (ilk seviye orijinalden)
+            onceki = img
+            for seviye in self.seviyeler():
                 # --- ADIM 2: Karar Mekanizması ---
                 # Eğer kısa kenar 1000px altındaysa VE dosya boyutu 4MB altındaysa
-                # hiç dokunma, direkt kopyala (Kalite kaybı 0 olsun)
-                resize_needed = kisa_kenar > STANDART_KISA_KENAR
-                
-                if not resize_needed and file_size_mb < HEDEF_MAX_BOYUT_MB:
-                    shutil.copy2(source_path, target_path)
-                    return True
+                # hiç dokunma, direkt kopyala (Kalite kaybı 0 olsun). JPEG dışı biçimde her zaman kodlanır.
+                resize_needed = kisa_kenar > seviye["kisa_kenar"]
+                bicim = seviye["bicim"]
+
+                if not resize_needed and file_size_mb < seviye["max_mb"] and bicim == "jpeg" and not donustur:
+                    ciktilar[seviye["ad"]] = None
+                    continue
 
                 # --- ADIM 3: İşleme ---
-                
+                sureler = {}
+
                 # A) Resize (Sadece gerekliyse)
                 if resize_needed:
-                    ratio = STANDART_KISA_KENAR / kisa_kenar
+                    ratio = seviye["kisa_kenar"] / kisa_kenar
                     new_width = int(width * ratio)
                     new_height = int(height * ratio)
-                    # LANCZOS: En iyi küçültme filtresi
-                    img = img.resize((new_width, new_height), Image.LANCZOS)
-                
-                # B) Sıkıştırma Döngüsü
-                current_quality = BASLANGIC_KALITE
-                saved_successfully = False
+                    onceki = self.kucult(onceki, (new_width, new_height), sureler, seritli=dev)
+                    hedef_img = onceki
+                else:
+                    cozme_bas = time.perf_counter()
+                    img.load()
+                    sureler["cozme_sn"] = time.perf_counter() - cozme_bas
+                    hedef_img = img
 
-                while current_quality >= MIN_KALITE:
-                    try:
-                        # Formatı koruyarak kaydet.
-                        # ÖNEMLİ: icc_profile parametresi ile renk haritasını geri yüklüyoruz.
-                        save_kwargs = {
-                            "quality": current_quality,
-                            "optimize": True
-                        }
-                        
-                        if icc_profile:
-                            save_kwargs["icc_profile"] = icc_profile
-
-                        img.save(target_path, "JPEG", **save_kwargs)
-                        
-                        # Boyut kontrolü
-                        if self.get_file_size_mb(target_path) < HEDEF_MAX_BOYUT_MB:
-                            saved_successfully = True
-                            break # Hedefe ulaşıldı
-                        
-                        current_quality -= KALITE_AZALTMA_ADIMI
-                    except OSError:
-                        # CMYK JPEG yazma hatası vb. olursa
-                        raise Exception("Format Yazma Hatası")
-
-                # Eğer kalite düşmesine rağmen kaydedilemediyse (çok nadir)
-                if not saved_successfully:
-                     shutil.copy2(source_path, target_path)
-
-                return True
+                # B) CMYK -> sRGB (bir kez; sonraki seviyeler dönüşmüş görselden küçültülür)
+                if donustur and hedef_img.mode == "CMYK":
+                    renk_bas = time.perf_counter()
+                    hedef_img, icc_profile = cikti_kodlayicilari.srgb_donustur(hedef_img, donusum_profili)
+                    onceki = hedef_img
+                    sureler["renk_sn"] = time.perf_counter() - renk_bas
+                    bilgi["renk_donusumu"] = "icc" if icc_profile else "basit"
 
+                # C) Sıkıştırma: Bellekte (BytesIO) kalite araması
+                piksel = hedef_img.width * hedef_img.height
+                tahmin = None
+                if KALITE_TAHMINI:
+                    tahmin = self.tahminci.tahmin_et(grup, bilgi["kaynak_bpp"], piksel,
+                                                     seviye["max_mb"] * 1024 * 1024, adaylar, bicim)
+
+                # Eğer kalite düşmesine rağmen hedefe inilemediyse (çok nadir) None döner
+                kodlama_bas = time.perf_counter()
+                kod_img, save_kwargs = cikti_kodlayicilari.hazirla(hedef_img, bicim, icc_profile)
+                if exif:
+                    save_kwargs["exif"] = exif
+
+                # Küçültülmemiş orijinal JPEG: önce niceleme tablolarını koruyarak (tek kodlama) dene
+                veri, koruma_denemesi = None, 0
+                if (KALITE_KORUYAN_YOL and not ALGISAL_KALITE and bicim == "jpeg" and kod_img is img
+                        and img.format == "JPEG" and file_size_mb < seviye["max_mb"] * KORUYAN_YOL_AZAMI_ORAN):
+                    veri, koruma_denemesi = self.koruyarak_kodla(img, save_kwargs, seviye["max_mb"]), 1
+                korundu = veri is not None
+                if korundu:
+                    kalite, gozlemler, tahmin = "keep", [], None
+                else:
+                    veri, kalite, gozlemler = self.kaliteyi_bul(kod_img, save_kwargs, tahmin, seviye["max_mb"], bicim)
+                sigmadi = veri is None
+                if sigmadi and bicim != "jpeg":
+                    # Orijinal bu biçime aynen konamaz: en düşük kalitedeki sonuç kullanılır (sınır aşılsa da)
+                    kalite = adaylar[-1]
+                    veri = self.kodla(kod_img, kalite, save_kwargs, bicim)
+                boyut_kalitesi, skor = kalite, None
+                if ALGISAL_KALITE and not sigmadi and not korundu:
+                    # Sınıra sığan en yüksek kaliteden, gözle fark edilmeyen en düşük kaliteye in
+                    veri, kalite, skor = self.algisal_kaliteyi_bul(kod_img, save_kwargs, veri, kalite, gozlemler,
+                                                                  bicim, (grup, seviye["ad"]))
+                sureler["kodlama_sn"] = time.perf_counter() - kodlama_bas
+                ciktilar[seviye["ad"]] = veri
+
+                for ad, sure in sureler.items():
+                    bilgi[ad] = bilgi.get(ad, 0.0) + sure
+                if veri is not None:
+                    # Biçim karşılaştırması: [çıktı sayısı, bayt, kodlama süresi, piksel]
+                    toplam = bilgi.setdefault("bicimler", {}).setdefault(bicim, [0, 0, 0.0, 0])
+                    toplam[0] += 1
+                    toplam[1] += len(veri)
+                    toplam[2] += sureler["kodlama_sn"]
+                    toplam[3] += piksel
+                if seviye["ad"] == ANA_CIKTI:
+                    bilgi.update(bicim=bicim, piksel=piksel, tahmin=tahmin, kalite=kalite, gozlemler=gozlemler,
+                                 deneme=len(gozlemler) + koruma_denemesi)
+                    if skor is not None:
+                        bilgi.update(ssim=round(skor, 5), boyut_kalitesi=boyut_kalitesi)
+                    bilgi["yol"] = ("hedefe_inilemedi" if sigmadi else
+                                    "kalite_korundu" if korundu else "yeniden_sikistirma")
+                else:
+                    bilgi.setdefault("turev_gozlemleri", []).append((piksel, gozlemler, bicim))
+
+            bilgi["islem_sn"] = time.perf_counter() - bas
+            if dev:
+                bilgi["tepe_rss_mb"] = piksel_butcesi.tepe_rss_mb()
+            return ciktilar, bilgi
+
+    def ciktilari_yaz(self, kaynak, hedefler, ciktilar, bilgi, kaynak_veri=None):
+        """
+        Her seviyenin çıktısını kendi hedefine yazar (geçici dosya + yer değiştirme).
+        Çıktısı None olan seviyeye orijinal aynen aktarılır: kaynak_veri bellekteyse oradan
+        (diskten tekrar okunmaz), değilse kopya motoruyla. JPEG dışı biçimdeki seviyeye orijinal
+        konamayacağından çıktısı yoksa hata verilir.
+        """
+        bicimler = {seviye["ad"]: seviye["bicim"] for seviye in self.seviyeler()}
+        for ad, hedef in hedefler.items():
+            veri = ciktilar.get(ad)
+            if veri is not None:
+                kopya_motoru.atomik_yaz(hedef, veri)
+            elif bicimler[ad] != "jpeg":
+                raise ValueError(f"'{ad}' çıktısı üretilemedi (orijinal {bicimler[ad]} olarak yazılamaz)")
+            elif kaynak_veri is not None:
+                kopya_motoru.atomik_yaz(hedef, kaynak_veri)
+                shutil.copystat(kaynak, hedef)
+            else:
+                self.aynen_kopyala(kaynak, hedef, bilgi)
+            if ad == ANA_CIKTI:
+                bilgi["cikti_bayt"] = bilgi.get("kaynak_bayt") if veri is None else len(veri)
+
+    def hepsine_kopyala(self, kaynak, hedefler, bilgi):
+        """
+        Orijinali tüm seviyelerin hedeflerine aynen aktarır (işlem gerekmediğinde / hata durumunda).
+        JPEG dışı biçimdeki seviyelere orijinal konamaz: onlar atlanır ve sonunda hata verilir.
+        """
+        bicimler = {seviye["ad"]: seviye["bicim"] for seviye in self.seviyeler()}
+        atlanan = []
+        for ad, hedef in hedefler.items():
+            if bicimler[ad] != "jpeg":
+                atlanan.append(ad)
+                continue
+            self.aynen_kopyala(kaynak, hedef, bilgi)
+        if ANA_CIKTI not in atlanan:
+            bilgi["cikti_bayt"] = bilgi.get("kaynak_bayt")
+        if atlanan:
+            raise ValueError(f"Orijinal {', '.join(atlanan)} çıktısına kopyalanamaz (JPEG dışı biçim)")
+
+    def _gorsel_isle(self, source_path, target_path, baslik=None):
+        """
+        Tek görseli diskten okuyup işler ve hedef(ler)e yazar: (başarılı_mı, bilgi)
+        baslik (iş planında okunmuşsa) verilirse ön kontrol başlığı tekrar okumaz.
+        """
+        bilgi = {"kaynak": str(source_path), "hedef": str(target_path), "yol": "kopya"}
+        hedefler = self.hedefler(target_path)
+        bas = time.perf_counter()
+        try:
+            bilgi["kaynak_bayt"] = os.path.getsize(source_path)
+            if self.dogrudan_kopyalanir_mi(source_path, bilgi["kaynak_bayt"] / (1024 * 1024), baslik):
+                self.kopyadan_once_dogrula(source_path, bilgi)
+                self.hepsine_kopyala(source_path, hedefler, bilgi)
+                return True, bilgi
+
+            with open(source_path, "rb") as f:
+                kaynak_veri = f.read()
+            bilgi["okuma_sn"] = time.perf_counter() - bas
+
+            ciktilar, islem_bilgisi = self.optimize_veri(kaynak_veri, self.grup_adi(target_path))
+            bilgi.update(islem_bilgisi)
+
+            # Kazanan sonuçlar diske tek seferde yazılır
+            yazma_bas = time.perf_counter()
+            self.ciktilari_yaz(source_path, hedefler, ciktilar, bilgi)
+            bilgi["yazma_sn"] = time.perf_counter() - yazma_bas
+            return True, bilgi
+
+        except jpeg_araclari.BozukGorselHatasi as e:
+            # Bozuk kaynak: gri bantlı çıktı da, bozuk kopya da üretilmez
+            bilgi["yol"] = "bozuk_kaynak"
+            bilgi["hata"] = str(e)
+            return False, bilgi
         except Exception as e:
-            # Herhangi bir hata durumunda orijinali kopyala
+            # Herhangi bir hata durumunda orijinali kopyala (hata metriğe yazılır)
+            bilgi["hata"] = f"{type(e).__name__}: {e}"
             try:
-                shutil.copy2(source_path, target_path)
-                return True
-            except:
-                return False
+                self.hepsine_kopyala(source_path, hedefler, bilgi)
+                bilgi["yol"] = "hata_kopya"
+                return True, bilgi
+            except Exception as e2:
+                bilgi["yol"] = "hata"
+                bilgi["hata"] += f" | Kopyalama: {type(e2).__name__}: {e2}"
+                return False, bilgi
+        finally:
+            bilgi["toplam_sn"] = time.perf_counter() - bas
+
+    def optimize_image(self, source_path, target_path):
+        """Tek görseli diskten okuyup işler ve hedefe yazar (sıralı çalışma)."""
+        return self._gorsel_isle(source_path, target_path)[0]
+
+    def gorevleri_calistir(self, gorevler, her_sonuc=None, basliklar=None):
+        """
+        (kaynak, hedef) görevlerini işler; sonuçlar görev sırasıyla döner.
+        ISCI_SAYISI > 1 ise görevler oku / işle / yaz hattından geçer (bkz. _hat_akisi).
+        her_sonuc verilirse her görev bittiğinde her_sonuc(gorev, sonuc, bilgi) çağrılır (manifest için).
+        basliklar (iş planından, {kaynak: başlık}) verilirse JPEG başlıkları tekrar okunmaz.
+        """
+        sonuclar = []
+        for gorev, (sonuc, bilgi) in zip(gorevler, self._sonuc_akisi(gorevler, basliklar or {})):
+            self.bilgi_isle(bilgi)
+            if her_sonuc:
+                her_sonuc(gorev, sonuc, bilgi)
+            sonuclar.append(sonuc)
+        return sonuclar
+
+    def _sonuc_akisi(self, gorevler, basliklar):
+        if ISCI_SAYISI <= 1 or len(gorevler) < 2:
+            for kaynak, hedef in tqdm(gorevler, desc="Optimizasyon"):
+                yield self._gorsel_isle(kaynak, hedef, basliklar.get(kaynak))
+            return
+
+        print(f"⚡ {ISCI_SAYISI} işçi süreç ile paralel işleniyor (oku / işle / yaz hattı)")
+        yield from self._hat_akisi(gorevler, basliklar)
+
+    # -------------------------------------------------------------------------
+    # 🚰 OKU / İŞLE / YAZ HATTI
+    # -------------------------------------------------------------------------
+
+    def _okuyucu(self, gorevler, kuyruk, havuz, dur, butce=None, basliklar=None):
+        """
+        OKUMA aşaması (thread): Kaynak baytlarını sırayla okur ve işçi havuzuna verir.
+        Kuyruk sınırlı olduğundan işçiler geride kalınca okuma da bekler (bellek sınırı).
+        butce (PikselButcesi) verilirse her görsel, başlıktan tahmin edilen belleği ayırmadan
+        okunmaz/gönderilmez; ayrılan bellek işçideki iş bitince geri bırakılır.
+        basliklar (iş planından, {kaynak: başlık}) verilirse başlıklar tekrar okunmaz.
+        Kuyruğa (durum, veri, is, bilgi) girer: durum = "kopya" | "islem" | "hata"
+        Havuz bozulursa (işçi süreç öldü) hata kuyruğa konur ve okuma durur.
+        """
+        for kaynak, hedef in gorevler:
+            bilgi = {"kaynak": str(kaynak), "hedef": str(hedef), "yol": "kopya"}
+            ayrilan = 0
+            havuz_bozuk = False
+            try:
+                bilgi["kaynak_bayt"] = os.path.getsize(kaynak)
+                if basliklar and kaynak in basliklar:
+                    baslik = basliklar[kaynak]
+                else:
+                    baslik = jpeg_araclari.jpeg_baslik_oku(kaynak)
+                if self.dogrudan_kopyalanir_mi(kaynak, bilgi["kaynak_bayt"] / (1024 * 1024), baslik):
+                    self.kopyadan_once_dogrula(kaynak, bilgi)
+                    oge = ("kopya", None, None, bilgi)
+                else:
+                    if butce is not None:
+                        miktar = self.bellek_tahmini(baslik, bilgi["kaynak_bayt"])
+                        bilgi["bellek_tahmini_mb"] = round(miktar / (1024 * 1024), 1)
+                        if not butce.al(miktar, dur):
+                            return
+                        ayrilan = miktar
+
+                    bas = time.perf_counter()
+                    with open(kaynak, "rb") as f:
+                        veri = f.read()
+                    bilgi["okuma_sn"] = time.perf_counter() - bas
+                    is_ = havuz.submit(_veri_isle, veri, self.grup_adi(hedef))
+                    if ayrilan:
+                        is_.add_done_callback(lambda _, miktar=ayrilan: butce.birak(miktar))
+                        ayrilan = 0
+                    oge = ("islem", veri, is_, bilgi)
+            except BrokenProcessPool as e:
+                if ayrilan:
+                    butce.birak(ayrilan)
+                oge, havuz_bozuk = ("hata", None, e, bilgi), True
+            except Exception as e:
+                if ayrilan:
+                    butce.birak(ayrilan)
+                oge = ("hata", None, e, bilgi)
+
+            while not dur.is_set():
+                try:
+                    kuyruk.put(oge, timeout=0.5)
+                    break
+                except queue.Full:
+                    continue
+            if dur.is_set() or havuz_bozuk:
+                return
+
+    def _parti_yaz(self, parti):
+        """
+        YAZMA aşaması: Biriken çıktıları art arda diske yazar, her görev için (başarılı_mı, bilgi) üretir.
+        İşçi havuzu bozulduysa (BrokenProcessPool) görsel kopyalanmaz; hata çağırana iletilir.
+        """
+        for (kaynak, hedef), durum, veri, is_, bilgi in parti:
+            bas = time.perf_counter()
+            hedefler = self.hedefler(hedef)
+            try:
+                if durum == "kopya":
+                    self.hepsine_kopyala(kaynak, hedefler, bilgi)
+                elif durum == "hata":
+                    raise is_
+                else:
+                    try:
+                        ciktilar, islem_bilgisi = is_.result()
+                        bilgi.update(islem_bilgisi)
+                    except (jpeg_araclari.BozukGorselHatasi, BrokenProcessPool):
+                        raise
+                    except Exception as e:
+                        ciktilar = {}
+                        bilgi["yol"] = "hata_kopya"
+                        bilgi["hata"] = f"{type(e).__name__}: {e}"
+                    # None: hedefe inilemedi / işlenemedi -> orijinal (zaten bellekte) aynen yazılır
+                    self.ciktilari_yaz(kaynak, hedefler, ciktilar, bilgi, kaynak_veri=veri)
+                sonuc = True
+            except BrokenProcessPool:
+                # İşçi süreç öldü (ör. bellek yetersizliği): görselin kendi hatası değil, kopya üretilmez
+                raise
+            except jpeg_araclari.BozukGorselHatasi as e:
+                # Bozuk kaynak: gri bantlı çıktı da, bozuk kopya da üretilmez
+                bilgi["yol"] = "bozuk_kaynak"
+                bilgi["hata"] = str(e)
+                sonuc = False
+            except Exception as e:
+                # Herhangi bir hata durumunda orijinali kopyala (hata metriğe yazılır)
+                bilgi["hata"] = f"{type(e).__name__}: {e}"
+                try:
+                    self.hepsine_kopyala(kaynak, hedefler, bilgi)
+                    bilgi["yol"] = "hata_kopya"
+                    sonuc = True
+                except Exception as e2:
+                    bilgi["yol"] = "hata"
+                    bilgi["hata"] += f" | Kopyalama: {type(e2).__name__}: {e2}"
+                    sonuc = False
+
+            # Hatta görselin kendi iş süresi: okuma + işçideki işlem + yazma (kuyrukta bekleme hariç)
+            bilgi["yazma_sn"] = time.perf_counter() - bas
+            bilgi["toplam_sn"] = sum(bilgi.get(ad) or 0.0 for ad in ("okuma_sn", "islem_sn", "yazma_sn"))
+            yield sonuc, bilgi
+
+    def _hat_akisi(self, gorevler, basliklar=None):
+        """
+        Görevleri üç aşamalı hattan geçirir, sonuçları görev sırasıyla üretir:
+          1) Okuyucu thread : kaynak baytlarını önceden okur (ON_OKUMA_SAYISI kadar ileride)
+          2) İşçi süreçler  : çözme / küçültme / kodlama (diske dokunmaz)
+          3) Yazıcı (bu thread): biten çıktıları YAZMA_PARCA_BOYUTU'luk partiler halinde yazar
+        Böylece harici diskin okuma/yazma süresi CPU işiyle örtüşür.
+        Bir işçi süreç beklenmedik şekilde ölürse (BrokenProcessPool) çalışma hatayla durdurulur:
+        biten görseller yazılmış ve manifeste kaydedilmiştir, kalanlar sonraki çalışmada işlenir.
+        """
+        kuyruk = queue.Queue(maxsize=ISCI_SAYISI * ON_OKUMA_SAYISI)
+        dur = threading.Event()
+        butce = None
+        if PIKSEL_BUTCESI_MB:
+            butce = piksel_butcesi.PikselButcesi(PIKSEL_BUTCESI_MB * 1024 * 1024)
+            print(f"🧮 Piksel bütçesi: aynı anda en fazla ~{PIKSEL_BUTCESI_MB} MB çözme belleği")
+
+        with ProcessPoolExecutor(max_workers=ISCI_SAYISI, initializer=_isci_baslat,
+                                 initargs=(_isci_ayarlari(), self.tahminci.gruplar)) as havuz:
+            okuyucu = threading.Thread(target=self._okuyucu,
+                                       args=(gorevler, kuyruk, havuz, dur, butce, basliklar), daemon=True)
+            okuyucu.start()
+            try:
+                parti = []
+                for sira, gorev in enumerate(tqdm(gorevler, desc="Optimizasyon")):
+                    durum, veri, is_, bilgi = kuyruk.get()
+                    if durum == "islem":
+                        # Sonucu beklerken diğer işçiler ve okuyucu çalışmaya devam eder
+                        try:
+                            is_.result()
+                        except Exception:
+                            pass
+                    parti.append((gorev, durum, veri, is_, bilgi))
+
+                    # Parti dolduysa, sırada hazır görev yoksa veya son görevse diske yaz
+                    if len(parti) >= YAZMA_PARCA_BOYUTU or kuyruk.empty() or sira == len(gorevler) - 1:
+                        yield from self._parti_yaz(parti)
+                        parti = []
+            except BrokenProcessPool:
+                print("❌ Bir işçi süreç beklenmedik şekilde sonlandı (bellek yetersizliği olabilir). Çalışma durduruldu; "
+                      "tamamlanmayan görseller kopyalanmadı ve manifeste yazılmadı, yeniden çalıştırıldığında işlenecek.")
+                raise
+            finally:
+                dur.set()
+                okuyucu.join()
+                if butce is not None and butce.bekleme_sayisi:
+                    print(f"🧮 Bellek sınırı nedeniyle {butce.bekleme_sayisi} görsel sıra bekledi "
+                          f"(en yüksek: ~{butce.en_yuksek // (1024 * 1024)} MB)")
+
+    # -------------------------------------------------------------------------
+    # 🗺 İŞ PLANI
+    # -------------------------------------------------------------------------
+
+    def plani_olustur(self, gorevler):
+        """
+        Görevleri başlık ve boyuttan tahmin edilen maliyete göre planlar:
+          1) Aynen kopyalanacaklar (decode gerekmeyen) ayrı gruba alınır, klasör sırası korunur.
+          2) Yeniden sıkıştırılacaklar maliyete göre büyükten küçüğe sıralanır (LPT); havuz her işi
+             ilk boşalan işçiye verdiğinden bu sıra işçiler arasında dengeli bir dağıtım sağlar.
+        Plan IS_PLANI_DOSYASI'na yazılır, Excel sırasıyla karşılaştırmalı tahmini süre basılır.
+        Dönüş: (sıralanmış görevler, {kaynak: başlık})
+        """
+        mb = 1024 * 1024
+        basliklar = jpeg_araclari.basliklari_oku([kaynak for kaynak, _ in gorevler])
+        islemler, kopyalar = [], []
+        for kaynak, hedef in gorevler:
+            try:
+                bayt = os.path.getsize(kaynak)
+            except OSError:
+                bayt = 0
+            baslik = basliklar.get(kaynak)
+            if bayt and self.dogrudan_kopyalanir_mi(kaynak, bayt / mb, baslik):
+                kopyalar.append((kaynak, hedef, baslik, bayt, is_plani.kopya_maliyeti(bayt)))
+            else:
+                # Başlığı okunamayan görselde piksel sayısı bellek tahminindeki gibi boyuttan kestirilir
+                piksel = baslik[0] * baslik[1] if baslik else bayt * BILINMEYEN_BOYUT_KATSAYISI / 3
+                islemler.append((kaynak, hedef, baslik, bayt, is_plani.islem_maliyeti(piksel, bayt)))
+
+        _, excel_suresi = is_plani.dagit([kayit[4] for kayit in islemler], ISCI_SAYISI)
+        islemler.sort(key=lambda kayit: kayit[4], reverse=True)
+        atamalar, lpt_suresi = is_plani.dagit([kayit[4] for kayit in islemler], ISCI_SAYISI)
+        kopya_suresi = sum(kayit[4] for kayit in kopyalar)
+
+        satirlar = []
+        zaman = lpt_suresi
+        for sira, (kaynak, hedef, baslik, bayt, maliyet) in enumerate(islemler + kopyalar, start=1):
+            satir = {"sira": sira, "kaynak": str(kaynak), "hedef": str(hedef),
+                     "genislik": baslik[0] if baslik else None, "yukseklik": baslik[1] if baslik else None,
+                     "kaynak_mb": round(bayt / mb, 2), "tahmini_sn": round(maliyet, 3)}
+            if sira <= len(islemler):
+                isci, baslangic = atamalar[sira - 1]
+                satir.update(grup="islem", isci=isci + 1, baslangic_sn=round(baslangic, 2))
+            else:
+                # Kopyalar işlemlerden sonra yazıcıda sırayla aktarılır
+                satir.update(grup="kopya", isci=None, baslangic_sn=round(zaman, 2))
+                zaman += maliyet
+            satirlar.append(satir)
+
+        print(f"🗺  İş Planı: {len(islemler)} yeniden sıkıştırma (~{sum(kayit[4] for kayit in islemler) / 60:.1f} dk "
+              f"işçi zamanı), {len(kopyalar)} aynen kopya (~{kopya_suresi / 60:.1f} dk)")
+        print(f"    Tahmini süre ({ISCI_SAYISI} işçi): {(lpt_suresi + kopya_suresi) / 60:.1f} dk "
+              f"(Excel sırasıyla: {(excel_suresi + kopya_suresi) / 60:.1f} dk)")
+        if IS_PLANI_DOSYASI and is_plani.plani_yaz(satirlar, IS_PLANI_DOSYASI):
+            print(f"    Plan: {IS_PLANI_DOSYASI}")
+        return [(kaynak, hedef) for kaynak, hedef, *_ in islemler + kopyalar], basliklar
+
+    # -------------------------------------------------------------------------
+    # 🔮 SİMÜLASYON TAHMİNİ (DRY_RUN)
+    # -------------------------------------------------------------------------
+
+    def simule_et(self, gorevler, mukerrerler=(), basliklar=None):
+        """
+        Gerçek çalışmanın maliyetini hiçbir dosya yazmadan tahmin eder, Ebat bazında raporlar:
+          1) Her görselin boyutu ve JPEG başlığı okunur; aynen kopyalanacaklar ayrılır.
+          2) Yeniden sıkıştırılacaklardan her Ebat için eşit aralıklı örnekler seçilir ve bellekte
+             gerçekten işlenir (okuma süresi, işlem süresi, tüm seviyelerin çıktı baytı ölçülür).
+          3) Ebat'ın örnek oranları (çıktı/kaynak bayt, megapiksel başına işlem süresi) kalan
+             görsellere, ölçülen okuma hızı da tüm G/Ç'ye uygulanır.
+        Manifest dikkate alınmaz (tam çalışma varsayılır); kalite modeli okunur ama kaydedilmez.
+        basliklar (iş planından) verilirse başlıklar tekrar okunmaz.
+        Dönüş: Ebat satırları + TOPLAM satırı (SIMULASYON_RAPORU'na da yazılır).
+        """
+        mb = 1024 * 1024
+        seviye_sayisi = len(self.seviyeler())
+        if KALITE_TAHMINI:
+            self.tahminci = kalite_tahmincisi.KaliteTahmincisi.yukle(KALITE_MODELI_DOSYASI)
+
+        # --- 1) Başlık ve boyut taraması ---
+        ebatlar = {}
+        def ebat_kaydi(hedef):
+            return ebatlar.setdefault(self.grup_adi(hedef), {
+                "gorsel": 0, "kopya": 0, "mukerrer": 0,
+                "kaynak_bayt": 0, "kopya_bayt": 0, "mukerrer_bayt": 0,
+                "adaylar": [], "ornekler": [],
+            })
+
+        if basliklar is None:
+            basliklar = jpeg_araclari.basliklari_oku([kaynak for kaynak, _ in gorevler])
+        for kaynak, hedef in tqdm(gorevler, desc="Simülasyon Taraması"):
+            kayit = ebat_kaydi(hedef)
+            try:
+                boyut = os.path.getsize(kaynak)
+            except OSError:
+                continue
+            kayit["gorsel"] += 1
+            kayit["kaynak_bayt"] += boyut
+            baslik = basliklar.get(kaynak)
+            if self.dogrudan_kopyalanir_mi(kaynak, boyut / mb, baslik):
+                kayit["kopya"] += 1
+                kayit["kopya_bayt"] += boyut
+            else:
+                kayit["adaylar"].append((kaynak, boyut, baslik[0] * baslik[1] if baslik else None))
+
+        for _, kaynak, hedef in mukerrerler:
+            kayit = ebat_kaydi(hedef)
+            try:
+                boyut = os.path.getsize(kaynak)
+            except OSError:
+                continue
+            kayit["gorsel"] += 1
+            kayit["mukerrer"] += 1
+            kayit["kaynak_bayt"] += boyut
+            kayit["mukerrer_bayt"] += boyut
+
+        # --- 2) Örnek deneme kodlamaları ---
+        secilenler = []
+        for ebat, kayit in ebatlar.items():
+            adaylar = kayit["adaylar"]
+            adet = min(len(adaylar), max(SIMULASYON_MIN_ORNEK, math.ceil(len(adaylar) * SIMULASYON_ORNEK_ORANI)))
+            secilenler += [(ebat, adaylar[sira * len(adaylar) // adet]) for sira in range(adet)]
+
+        for ebat, (kaynak, boyut, piksel) in tqdm(secilenler, desc="Simülasyon Örnekleri"):
+            try:
+                bas = time.perf_counter()
+                with open(kaynak, "rb") as f:
+                    veri = f.read()
+                okuma_sn = time.perf_counter() - bas
+                ciktilar, bilgi = self.optimize_veri(veri, ebat)
+            except Exception as e:
+                tqdm.write(f"⚠️ Örnek işlenemedi (tahmine katılmadı): {kaynak} -> {e}")
+                continue
+            self.tahmin_ogren(bilgi)
+            cikti_bayt = sum(boyut if cikti is None else len(cikti) for cikti in ciktilar.values())
+            yeniden = any(cikti is not None for cikti in ciktilar.values())
+            piksel = round(boyut / bilgi["kaynak_bpp"])
+            ebatlar[ebat]["ornekler"].append((kaynak, boyut, piksel, cikti_bayt, okuma_sn, bilgi["islem_sn"], yeniden))
+
+        # --- 3) Ebat'a ölçekleme ---
+        def oranlar(ornekler):
+            if not ornekler:
+                return None
+            kaynak_bayt = sum(o[1] for o in ornekler)
+            piksel = sum(o[2] for o in ornekler)
+            return {
+                "cikti": sum(o[3] for o in ornekler) / kaynak_bayt,
+                "sn_mp": sum(o[5] for o in ornekler) / (piksel / 1e6),
+                "bpp": kaynak_bayt / piksel,
+                "yeniden": sum(o[6] for o in ornekler) / len(ornekler),
+            }
+
+        tum_ornekler = [o for kayit in ebatlar.values() for o in kayit["ornekler"]]
+        genel = oranlar(tum_ornekler)
+        okuma_sn = sum(o[4] for o in tum_ornekler)
+        okuma_hizi = sum(o[1] for o in tum_ornekler) / okuma_sn if okuma_sn > 0 else None
+
+        satirlar = []
+        toplam = dict.fromkeys(("gorsel", "kopya", "mukerrer", "yeniden", "ornek",
+                                "kaynak_bayt", "cikti_bayt", "islem_sn", "gc_sn"), 0)
+        for ebat in sorted(ebatlar):
+            kayit = ebatlar[ebat]
+            oran = oranlar(kayit["ornekler"]) or genel
+            ornekli = {o[0] for o in kayit["ornekler"]}
+            degerler = {
+                "gorsel": kayit["gorsel"], "kopya": kayit["kopya"], "mukerrer": kayit["mukerrer"],
+                "yeniden": sum(o[6] for o in kayit["ornekler"]), "ornek": len(kayit["ornekler"]),
+                "kaynak_bayt": kayit["kaynak_bayt"],
+                # Aynen kopyalananlar her seviyeye bir kez yazılır
+                "cikti_bayt": kayit["kopya_bayt"] * seviye_sayisi + sum(o[3] for o in kayit["ornekler"]),
+                "islem_sn": sum(o[5] for o in kayit["ornekler"]),
+            }
+            for kaynak, boyut, piksel in kayit["adaylar"]:
+                if kaynak in ornekli:
+                    continue
+                if oran is None:
+                    # Hiçbir örnek ölçülemedi: çıktı kaynak boyutunda varsayılır
+                    degerler["cikti_bayt"] += boyut * seviye_sayisi
+                    continue
+                degerler["cikti_bayt"] += boyut * oran["cikti"]
+                degerler["islem_sn"] += (piksel or boyut / oran["bpp"]) / 1e6 * oran["sn_mp"]
+                degerler["yeniden"] += oran["yeniden"]
+            # Mükerrerler ilk kopyanın çıktısını kopyalar: işlem yok, çıktı o Ebat'ın oranında
+            degerler["cikti_bayt"] += kayit["mukerrer_bayt"] * (oran["cikti"] if oran else seviye_sayisi)
+            degerler["gc_sn"] = ((degerler["kaynak_bayt"] + degerler["cikti_bayt"]) / okuma_hizi
+                                 if okuma_hizi else 0.0)
+
+            for ad, deger in degerler.items():
+                toplam[ad] += deger
+            satirlar.append(self._simulasyon_satiri(ebat, degerler))
+        satirlar.append(self._simulasyon_satiri("TOPLAM", toplam))
+
+        print("\n🔮 SİMÜLASYON TAHMİNİ (Ebat bazında)")
+        for satir in satirlar:
+            print(f"   {satir['Ebat']}: {satir['Gorsel_Sayisi']} görsel | yeniden sıkıştırılacak ~{satir['Yeniden_Sikistirilacak']} "
+                  f"| {satir['Kaynak_MB']} MB -> ~{satir['Tahmini_Cikti_MB']} MB (%{satir['Kazanc_Yuzde']} kazanç) "
+                  f"| ~{satir['Tahmini_Sure_Dk']} dk")
+        if len(self.seviyeler()) > 1:
+            print("   (Çıktı boyutu ana çıktı + tüm türevlerin toplamıdır)")
+        try:
+            pd.DataFrame(satirlar).to_excel(SIMULASYON_RAPORU, index=False)
+            print(f"💾 Simülasyon raporu kaydedildi: {SIMULASYON_RAPORU}")
+        except Exception as e:
+            print(f"❌ Simülasyon raporu kaydedilemedi: {e}")
+        return satirlar
+
+    def _simulasyon_satiri(self, ebat, d):
+        """Simülasyon raporunun bir satırı. Süre: paralelde işlem süresi işçilere bölünür ve G/Ç ile örtüşür."""
+        mb = 1024 * 1024
+        if ISCI_SAYISI > 1:
+            sure_sn = max(d["islem_sn"] / ISCI_SAYISI, d["gc_sn"])
+        else:
+            sure_sn = d["islem_sn"] + d["gc_sn"]
+        return {
+            "Ebat": ebat,
+            "Gorsel_Sayisi": d["gorsel"],
+            "Aynen_Kopya": d["kopya"],
+            "Mukerrer": d["mukerrer"],
+            "Yeniden_Sikistirilacak": round(d["yeniden"]),
+            "Ornek_Sayisi": d["ornek"],
+            "Kaynak_MB": round(d["kaynak_bayt"] / mb, 1),
+            "Tahmini_Cikti_MB": round(d["cikti_bayt"] / mb, 1),
+            "Tahmini_Kazanc_MB": round((d["kaynak_bayt"] - d["cikti_bayt"]) / mb, 1),
+            "Kazanc_Yuzde": round(100 * (1 - d["cikti_bayt"] / d["kaynak_bayt"]), 1) if d["kaynak_bayt"] else 0.0,
+            "Islem_Sn": round(d["islem_sn"], 1),
+            "GC_Sn": round(d["gc_sn"], 1),
+            "Tahmini_Sure_Dk": round(sure_sn / 60, 1),
+        }
 
     def baslat(self):
         print(f"📊 Envanter dosyası okunuyor: {self.excel_path.name}")
@@ -138,7 +1250,27 @@ class StokOptimizeEdici:
         print(f"\n🚀 Toplam {len(df)} klasör satırı işlenecek.")
         print(f"🎯 Hedef: Kısa Kenar Max {STANDART_KISA_KENAR}px | Boyut Max {HEDEF_MAX_BOYUT_MB}MB")
         print(f"🎨 Renk Profili: KORUNACAK (ICC Profile Copy)")
+        if CMYK_SRGB_DONUSUMU:
+            print("🎨 CMYK -> sRGB: AÇIK (ICC profiliyle, önbellekli dönüşüm)")
+        if ALGISAL_KALITE:
+            try:
+                import algisal_kalite  # noqa: F401
+            except ImportError:
+                print("❌ HATA: Algısal kalite hedefi (ALGISAL_KALITE) için 'numpy' gerekli.")
+                return
+            print(f"👁  Algısal Kalite: AÇIK (sınıra sığan en düşük kalite, SSIM >= {ALGISAL_HEDEF_SSIM})")
+        print(f"🖼  Çıktı Biçimi: {CIKTI_BICIMI.upper()}")
         print(f"📂 Çıktı Dizini: {HEDEF_ANA_KLASOR}")
+        for turev in TUREVLER:
+            print(f"🪜 Türev '{turev['ad']}': Kısa Kenar Max {turev['kisa_kenar']}px | "
+                  f"Boyut Max {turev['max_mb']}MB | {(turev.get('bicim') or CIKTI_BICIMI).upper()} -> {turev['klasor']}")
+
+        desteksiz = sorted({s["bicim"] for s in self.seviyeler()
+                            if not cikti_kodlayicilari.destekleniyor_mu(s["bicim"])})
+        if desteksiz:
+            print(f"❌ Hata: Çıktı biçimi desteklenmiyor: {', '.join(desteksiz)} "
+                  f"(Pillow sürümünü/eklentisini kontrol edin; tanımlı biçimler: {', '.join(cikti_kodlayicilari.KODLAYICILAR)})")
+            return
         
         if DRY_RUN:
             print("\n⚠️  [SİMÜLASYON MODU] Dosyalar kopyalanmayacak/oluşturulmayacak.")
@@ -149,9 +1281,10 @@ class StokOptimizeEdici:
 
         basarili_sayisi = 0
         hatali_sayisi = 0
+        gorevler = []  # (kaynak_dosya, hedef_dosya)
         
-        # Excel'deki her satırı gez
-        for _, row in tqdm(df.iterrows(), total=len(df), desc="Optimizasyon"):
+        # Excel'deki her satırı gez, işlenecek dosyaları topla
+        for _, row in tqdm(df.iterrows(), total=len(df), desc="Klasörler Hazırlanıyor"):
             kaynak_klasor = Path(row['Yol'])
             
             try:
@@ -165,29 +1298,153 @@ class StokOptimizeEdici:
             if not kaynak_klasor.exists():
                 continue
 
-            if DRY_RUN:
-                continue 
-            
             try:
-                if not hedef_dizin.exists():
-                    hedef_dizin.mkdir(parents=True)
+                # Simülasyonda klasör oluşturulmaz, sadece görseller listelenir
+                if not DRY_RUN:
+                    if not hedef_dizin.exists():
+                        hedef_dizin.mkdir(parents=True)
+                    for turev in TUREVLER:
+                        (Path(turev["klasor"]) / ebat / urun / yuzey).mkdir(parents=True, exist_ok=True)
                 
                 for dosya in kaynak_klasor.iterdir():
                     if dosya.is_file() and dosya.suffix.lower() in ['.jpg', '.jpeg']:
-                        hedef_dosya = hedef_dizin / dosya.name
-                        self.optimize_image(dosya, hedef_dosya)
+                        gorevler.append((dosya, hedef_dizin / cikti_kodlayicilari.dosya_adi(dosya.name, CIKTI_BICIMI)))
                 
                 basarili_sayisi += 1
             except Exception as e:
                 hatali_sayisi += 1
+                tqdm.write(f"❌ Klasör hazırlanamadı: {kaynak_klasor} -> {e}")
+
+        # Manifest: daha önce aynı ayarlarla işlenmiş ve değişmemiş dosyaları atla
+        manifest = None
+        atlanan_sayisi = 0
+        if MANIFEST_KULLAN and not DRY_RUN:
+            ayarlar = {ad: deger for ad, deger in _isci_ayarlari().items() if ad not in CIKTIYI_ETKILEMEYEN_AYARLAR}
+            manifest = optimizasyon_manifesti.OptimizasyonManifesti(HEDEF_ANA_KLASOR, ayarlar)
+            guncel = lambda k, h: manifest.guncel_mi(k, h) and all(t.exists() for t in self.hedefler(h).values())
+            kalanlar = [(k, h) for k, h in gorevler if not guncel(k, h)]
+            atlanan_sayisi = len(gorevler) - len(kalanlar)
+            gorevler = kalanlar
+            if atlanan_sayisi:
+                print(f"📒 Manifest: {atlanan_sayisi} görsel değişmemiş, atlanacak.")
+
+        # Birebir aynı içerikleri bul (boyut -> kısmi özet -> tam özet). Sadece kalan görevler
+        # indekslenir: manifestin atladığı dosyalar her çalışmada yeniden okunup özetlenmez.
+        indeks = icerik_indeksi.IcerikIndeksi()
+        if MUKERRER_TEK_ISLEM and gorevler:
+            for kaynak, _ in gorevler:
+                indeks.ekle(kaynak)
+            grup_sayisi, fazla, _ = indeks.ozet()
+            if fazla:
+                print(f"♊ {grup_sayisi} grupta {fazla} mükerrer görsel bulundu, her içerik bir kez işlenecek.")
+
+        # Her içerikten sadece ilki (temsilci) işlenir; mükerrerler sonra onun çıktısını kopyalar
+        islenen = {}  # içerik özeti -> ilk üretilen hedef dosya
+        islenecekler = []
+        mukerrerler = []  # (ilk_cikti, kaynak, hedef)
+        for kaynak, hedef in gorevler:
+            anahtar = indeks.icerik_anahtari(kaynak)
+            if anahtar in islenen:
+                mukerrerler.append((islenen[anahtar], kaynak, hedef))
+                continue
+            islenecekler.append((kaynak, hedef))
+            if anahtar:
+                islenen[anahtar] = hedef
+
+        # İş planı: pahalı görseller önce (LPT), aynen kopyalar ayrı grupta sonda
+        basliklar = None
+        if IS_PLANI and islenecekler:
+            islenecekler, basliklar = self.plani_olustur(islenecekler)
+
+        if DRY_RUN:
+            self.simule_et(islenecekler, mukerrerler, basliklar)
+            print("\n💡 SİMÜLASYON TAMAMLANDI. Gerçek işlem için 'DRY_RUN = False' yapın.")
+            return
+
+        def kaydet(gorev, sonuc, bilgi):
+            if manifest:
+                manifest.kaydet(gorev[0], gorev[1], sonuc, bilgi.get("yol"))
+
+        if KALITE_TAHMINI:
+            self.tahminci = kalite_tahmincisi.KaliteTahmincisi.yukle(KALITE_MODELI_DOSYASI)
+
+        if METRIK_RAPORU and not DRY_RUN:
+            self.metrikler = optimizasyon_metrikleri.MetrikToplayici(METRIK_DOSYASI, METRIK_OZET_DOSYASI)
+
+        metrik_ozeti = None
+        try:
+            sonuclar = self.gorevleri_calistir(islenecekler, her_sonuc=kaydet, basliklar=basliklar)
+
+            mukerrer_sayisi = 0
+            for ilk_cikti, kaynak, hedef in mukerrerler:
+                bas = time.perf_counter()
+                try:
+                    ilk_hedefler = self.hedefler(ilk_cikti)
+                    for ad, turev_hedefi in self.hedefler(hedef).items():
+                        kopya_motoru.kopyala(ilk_hedefler[ad], turev_hedefi, baglanti=KOPYA_HARDLINK)
+                    mukerrer_sayisi += 1
+                    bilgi = {"kaynak": str(kaynak), "hedef": str(hedef), "yol": "mukerrer",
+                             "cikti_bayt": os.path.getsize(hedef),
+                             "yazma_sn": time.perf_counter() - bas,
+                             "toplam_sn": time.perf_counter() - bas}
+                    kaydet((kaynak, hedef), True, bilgi)
+                    self.bilgi_isle(bilgi)
+                except OSError:
+                    # İlk çıktı okunamazsa normal işleme devam
+                    sonuc, bilgi = self._gorsel_isle(kaynak, hedef)
+                    self.bilgi_isle(bilgi)
+                    kaydet((kaynak, hedef), sonuc, bilgi)
+                    sonuclar.append(sonuc)
+        finally:
+            if manifest:
+                manifest.kapat()
+            if KALITE_TAHMINI and self.tahmin_sayaci["kodlanan"]:
+                self.tahminci.kaydet(KALITE_MODELI_DOSYASI)
+            if self.metrikler:
+                metrik_ozeti = self.metrikler.kapat()
+                self.metrikler = None
 
         print("\n" + "="*50)
         print("🏁 İŞLEM TAMAMLANDI")
         print("="*50)
         print(f"✅ Başarıyla İşlenen Klasör: {basarili_sayisi}")
-        
-        if DRY_RUN:
-            print("\n💡 SİMÜLASYON TAMAMLANDI. Gerçek işlem için 'DRY_RUN = False' yapın.")
+        if hatali_sayisi:
+            print(f"❌ Hazırlanamayan Klasör: {hatali_sayisi}")
+        print(f"🖼  İşlenen Görsel: {sum(1 for s in sonuclar if s)} / {len(sonuclar)}")
+        if mukerrer_sayisi:
+            print(f"♊ Tekrar İşlenmeyen Mükerrer Görsel: {mukerrer_sayisi}")
+        if atlanan_sayisi:
+            print(f"📒 Değişmediği İçin Atlanan Görsel: {atlanan_sayisi}")
+        sayac = self.tahmin_sayaci
+        if sayac["kodlanan"]:
+            print(f"🔁 Görsel Başına Ortalama Kodlama: {sayac['deneme'] / sayac['kodlanan']:.2f}")
+        if sayac["tahmin"]:
+            print(f"🎯 Kalite Tahmini İsabeti: {sayac['isabet']} / {sayac['tahmin']} "
+                  f"(%{100 * sayac['isabet'] / sayac['tahmin']:.0f})")
+        if metrik_ozeti and metrik_ozeti["gorsel_sayisi"]:
+            yollar = metrik_ozeti["yollar"]
+            hata_kopya, hata = yollar.get("hata_kopya", 0), yollar.get("hata", 0)
+            if hata_kopya or hata:
+                print(f"⚠️  Hata Nedeniyle Aynen Kopyalanan: {hata_kopya} | Başarısız: {hata} (ayrıntı: {METRIK_DOSYASI})")
+            if yollar.get("bozuk_kaynak"):
+                print(f"🩺 Bozuk Kaynak (çıktı üretilmedi): {yollar['bozuk_kaynak']} (ayrıntı: {METRIK_DOSYASI})")
+            print(f"⏱  Hız: {metrik_ozeti['gorsel_sn']} görsel/sn | {metrik_ozeti['mb_sn']} MB/sn | "
+                  f"Gecikme p50: {metrik_ozeti['gecikme_p50_sn']} sn, p95: {metrik_ozeti['gecikme_p95_sn']} sn")
+            dev = metrik_ozeti["dev_gorsel"]
+            if dev["adet"]:
+                print(f"🐘 Dev Görsel (>{DEV_GORSEL_ESIGI_MP} MP): {dev['adet']} | Tepe bellek (RSS) "
+                      f"p50: {dev['tepe_rss_mb_p50']} MB, en fazla: {dev['tepe_rss_mb_max']} MB")
+                if not piksel_butcesi.TEPE_SIFIRLANABILIR:
+                    print("   (Bu sistemde tepe RSS görsel başına sıfırlanamaz; değerler süreç başından beri en yüksek değerdir.)")
+            algisal = metrik_ozeti["algisal"]
+            if algisal["adet"]:
+                print(f"👁  Algısal Kalite: {algisal['adet']} görsel | ort. kalite {algisal['ort_kalite']} "
+                      f"(sınır için {algisal['ort_boyut_kalitesi']}) | SSIM p50: {algisal['ssim_p50']}, "
+                      f"en düşük: {algisal['ssim_min']}")
+            for bicim, deger in metrik_ozeti["bicimler"].items():
+                print(f"🖼  {bicim.upper()}: {deger['cikti_sayisi']} çıktı | ort. {deger['ort_kb']} KB "
+                      f"({deger['kb_megapiksel']} KB/MP) | ort. kodlama {deger['ort_kodlama_ms']} ms")
+            print(f"📈 Metrikler: {METRIK_DOSYASI} | Özet: {METRIK_OZET_DOSYASI}")
 
 if __name__ == "__main__":
     try:
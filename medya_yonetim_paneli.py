@@ -21,6 +21,7 @@ def safe_import(module_name, key):
         return None
 
 disk_envanter_guncelleyici = safe_import('disk_envanter_guncelleyici', 'envanter')
+envanter_izleyici = safe_import('envanter_izleyici', 'izleyici')
 main_optimizer = safe_import('main_optimizer', 'optimizer')
 bayi_paketi_hazirlayici = safe_import('bayi_paketi_hazirlayici', 'bayi')
 ai_envanter_analizcisi = safe_import('ai_envanter_analizcisi', 'ai') 
@@ -134,16 +135,50 @@ class MedyaYonetimApp:
         ttk.Entry(f, textvariable=self.path_env).pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0,10))
         ttk.Button(f, text="Klasör Seç", command=lambda: self.select_folder(self.path_env)).pack(side=tk.RIGHT)
         
-        ttk.Button(frame, text="▶ TARAMAYI BAŞLAT", command=self.run_envanter).pack(pady=30)
+        self.env_artimli = tk.BooleanVar(value=True)
+        ttk.Checkbutton(frame, text="Artımlı Tarama (Sadece değişen klasörleri yeniden tarar)", variable=self.env_artimli).pack(anchor="w", pady=(15,0))
+        self.env_akis = tk.BooleanVar(value=False)
+        ttk.Checkbutton(frame, text="Akış Modu (Çok büyük arşivler için envanteri sabit bellekle yazar; ek analizler dosya listesini bellekte tutar)", variable=self.env_akis).pack(anchor="w")
+        self.env_mukerrer = tk.BooleanVar(value=False)
+        ttk.Checkbutton(frame, text="Mükerrer Görsel Analizi (Birebir aynı görselleri ayrı rapora yazar)", variable=self.env_mukerrer).pack(anchor="w")
+        self.env_benzer = tk.BooleanVar(value=False)
+        ttk.Checkbutton(frame, text="Benzer Görsel Analizi (Farklı boyut/kalitedeki aynı fotoğrafları bulur)", variable=self.env_benzer).pack(anchor="w")
+        self.env_butunluk = tk.BooleanVar(value=False)
+        ttk.Checkbutton(frame, text="Bütünlük Kontrolü (Bozuk / yarım kopyalanmış görselleri ayrı rapora yazar)", variable=self.env_butunluk).pack(anchor="w")
+        
+        ttk.Button(frame, text="▶ TARAMAYI BAŞLAT", command=self.run_envanter).pack(pady=(30,5))
+        
+        self.izleyici = None
+        self.btn_izle_text = tk.StringVar(value="👁 CANLI İZLEMEYİ BAŞLAT")
+        ttk.Button(frame, textvariable=self.btn_izle_text, command=self.toggle_izleme).pack(pady=5)
 
     def run_envanter(self):
         if not MODULE_STATUS['envanter']: return
-        path = self.path_env.get()
+        path = self.path_env.get(); artimli = self.env_artimli.get(); akis = self.env_akis.get(); mukerrer = self.env_mukerrer.get(); benzer = self.env_benzer.get(); butunluk = self.env_butunluk.get()
         def task():
             try:
                 # Modüldeki hedefi güncelle
                 disk_envanter_guncelleyici.HEDEF_KLASOR = Path(path)
-                disk_envanter_guncelleyici.EnvanterTarayici(path).tara_ve_raporla()
+                disk_envanter_guncelleyici.EnvanterTarayici(path, artimli=artimli, akis=akis, mukerrer=mukerrer, benzer=benzer, butunluk=butunluk).tara_ve_raporla()
+            except Exception as e: print(f"HATA: {e}")
+        threading.Thread(target=task, daemon=True).start()
+
+    def toggle_izleme(self):
+        if not MODULE_STATUS['izleyici']: return
+        if self.izleyici:
+            self.izleyici.durdur()
+            self.izleyici = None
+            self.btn_izle_text.set("👁 CANLI İZLEMEYİ BAŞLAT")
+            return
+        
+        path = self.path_env.get()
+        disk_envanter_guncelleyici.HEDEF_KLASOR = Path(path)
+        self.izleyici = envanter_izleyici.EnvanterIzleyici(disk_envanter_guncelleyici.EnvanterTarayici(path))
+        self.btn_izle_text.set("⏹ CANLI İZLEMEYİ DURDUR")
+        
+        izleyici = self.izleyici
+        def task():
+            try: izleyici.baslat()
             except Exception as e: print(f"HATA: {e}")
         threading.Thread(target=task, daemon=True).start()
 
@@ -152,7 +187,7 @@ class MedyaYonetimApp:
         frame = ttk.Frame(self.tab_optimize, padding=30)
         frame.pack(fill=tk.BOTH, expand=True)
         
-        ttk.Label(frame, text="Mükerrerleri siler, 4MB altına sıkıştırır, ICC profillerini koruyarak CMYK->RGB dönüşümü yapar.").pack(anchor="w", pady=(0,20))
+        ttk.Label(frame, text="Mükerrerleri bir kez işler, 4MB altına sıkıştırır, ICC profillerini korur (CMYK->sRGB dönüşümü isteğe bağlı).").pack(anchor="w", pady=(0,20))
         
         # Excel
         f1 = ttk.Frame(frame); f1.pack(fill=tk.X, pady=5)
@@ -171,18 +206,40 @@ class MedyaYonetimApp:
         # Ayarlar
         self.opt_dry = tk.BooleanVar(value=False)
         ttk.Checkbutton(frame, text="Simülasyon Modu (İşaretliyse dosya oluşturmaz, sadece raporlar)", variable=self.opt_dry).pack(anchor="w", pady=15)
+        self.opt_cmyk = tk.BooleanVar(value=False)
+        ttk.Checkbutton(frame, text="CMYK görselleri ICC profiliyle sRGB'ye dönüştür (web için)", variable=self.opt_cmyk).pack(anchor="w", pady=(0,10))
+        self.opt_algisal = tk.BooleanVar(value=False)
+        ttk.Checkbutton(frame, text="Algısal Kalite (Gözle fark edilmeyen en düşük kaliteye in, SSIM hedefli)", variable=self.opt_algisal).pack(anchor="w", pady=(0,10))
+        self.opt_exif = tk.BooleanVar(value=False)
+        ttk.Checkbutton(frame, text="EXIF bilgilerini koru (yön, tarih, kamera; küçük resim atılır)", variable=self.opt_exif).pack(anchor="w", pady=(0,10))
+        
+        f3 = ttk.Frame(frame); f3.pack(fill=tk.X, pady=5)
+        ttk.Label(f3, text="Paralel İşçi Sayısı (1 = sıralı):").pack(side=tk.LEFT)
+        self.opt_isci = tk.IntVar(value=1)
+        ttk.Spinbox(f3, from_=1, to=max(1, os.cpu_count() or 1), textvariable=self.opt_isci, width=5).pack(side=tk.LEFT, padx=10)
+
+        f4 = ttk.Frame(frame); f4.pack(fill=tk.X, pady=5)
+        ttk.Label(f4, text="Çıktı Biçimi:").pack(side=tk.LEFT)
+        self.opt_bicim = tk.StringVar(value="jpeg")
+        ttk.Combobox(f4, textvariable=self.opt_bicim, values=["jpeg", "webp", "avif"], state="readonly", width=8).pack(side=tk.LEFT, padx=10)
         
         ttk.Button(frame, text="▶ OPTİMİZASYONU BAŞLAT", command=self.run_optimize).pack(pady=10)
 
     def run_optimize(self):
         if not MODULE_STATUS['optimizer']: return
-        exc = self.path_opt_exc.get(); trg = self.path_opt_trg.get(); dry = self.opt_dry.get()
+        exc = self.path_opt_exc.get(); trg = self.path_opt_trg.get(); dry = self.opt_dry.get(); isci = self.opt_isci.get()
+        bicim = self.opt_bicim.get(); cmyk = self.opt_cmyk.get(); algisal = self.opt_algisal.get(); exif = self.opt_exif.get()
         def task():
             try:
                 # Modül değişkenlerini GUI'den gelenlerle güncelle
                 main_optimizer.ANALIZ_DOSYASI = exc
                 main_optimizer.HEDEF_ANA_KLASOR = Path(trg)
                 main_optimizer.DRY_RUN = dry
+                main_optimizer.ISCI_SAYISI = isci
+                main_optimizer.CIKTI_BICIMI = bicim
+                main_optimizer.CMYK_SRGB_DONUSUMU = cmyk
+                main_optimizer.ALGISAL_KALITE = algisal
+                main_optimizer.EXIF_KORU = exif
                 
                 # Motoru başlat
                 main_optimizer.StokOptimizeEdici(exc).baslat()
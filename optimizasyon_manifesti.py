@@ -0,0 +1,138 @@
+import os
+import json
+import hashlib
+
+# =============================================================================
+# ⚙️ AYARLAR
+# =============================================================================
+
+# Manifest dosyasının adı (hedef ana klasörün içinde tutulur)
+MANIFEST_ADI = ".optimizasyon_manifesti.jsonl"
+
+# Dosyadaki geçersiz (üzerine yazılmış) satır sayısı, geçerli kayıt sayısının bu katını
+# aşarsa manifest açılışta sıkıştırılır (her kaynak için tek satır kalır)
+SIKISTIRMA_ORANI = 1.0
+
+# Sadece bu işlem yollarıyla (bkz. optimizasyon_metrikleri) üretilen çıktılar güncel sayılır.
+# Yedek sonuçlar (hata_kopya: işleme hatasında orijinal kopyalandı, hedefe_inilemedi: sınıra inilemedi)
+# ve yolu kaydedilmemiş eski satırlar sonraki çalışmada yeniden denenir.
+GUNCEL_YOLLAR = {"yeniden_sikistirma", "kalite_korundu", "kopya", "mukerrer"}
+
+# =============================================================================
+# 📒 OPTİMİZASYON MANİFESTİ
+# =============================================================================
+
+def ayar_ozeti(ayarlar):
+    """Optimizasyon ayarlarının kısa özeti; ayarlardan biri değişirse özet de değişir."""
+    metin = json.dumps(ayarlar, sort_keys=True, default=str)
+    return hashlib.blake2b(metin.encode("utf-8"), digest_size=8).hexdigest()
+
+
+class OptimizasyonManifesti:
+    """
+    Hangi kaynaktan hangi ayarlarla hangi çıktının üretildiğini kaydeder.
+
+    Her işlenen dosya için bir JSON satırı eklenir ve hemen diske yazılır (append-only);
+    böylece yarıda kesilen bir çalışmada o ana kadar bitenler kaybolmaz. Aynı kaynağın
+    sonraki satırı öncekini geçersiz kılar.
+
+    Satır yapısı:
+        kaynak, boyut, mtime_ns, ayar, hedef, sonuc, yol, cikti_boyut
+    """
+    def __init__(self, klasor, ayarlar):
+        self.yol = os.path.join(str(klasor), MANIFEST_ADI)
+        self.ayar = ayar_ozeti(ayarlar)
+        self.kayitlar = {}
+        self._dosya = None
+        self.yukle()
+
+    def yukle(self):
+        satir_sayisi = 0
+        try:
+            with open(self.yol, "r", encoding="utf-8") as f:
+                for satir in f:
+                    try:
+                        kayit = json.loads(satir)
+                        self.kayitlar[kayit["kaynak"]] = kayit
+                        satir_sayisi += 1
+                    except (ValueError, KeyError):
+                        # Çökme anında yarım kalmış son satır: yok say
+                        continue
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            print(f"⚠️ Manifest okunamadı, tüm dosyalar işlenecek: {e}")
+            return
+
+        if satir_sayisi - len(self.kayitlar) > len(self.kayitlar) * SIKISTIRMA_ORANI:
+            self.sikistir()
+
+    def sikistir(self):
+        """Manifesti her kaynak için son kayıt kalacak şekilde yeniden yazar (atomik)."""
+        gecici = self.yol + ".tmp"
+        try:
+            with open(gecici, "w", encoding="utf-8") as f:
+                for kayit in self.kayitlar.values():
+                    f.write(json.dumps(kayit, ensure_ascii=False) + "\n")
+            os.replace(gecici, self.yol)
+        except OSError as e:
+            print(f"⚠️ Manifest sıkıştırılamadı: {e}")
+
+    def guncel_mi(self, kaynak, hedef):
+        """
+        Kaynak, ayarlar ve hedef son başarılı kayıtla aynıysa ve çıktı hâlâ yerindeyse True.
+        (Kaynak için boyut + mtime_ns karşılaştırılır; içerik okunmaz.)
+        Yolu GUNCEL_YOLLAR dışında olan kayıtlar (yedek kopyalar) güncel sayılmaz.
+        """
+        kayit = self.kayitlar.get(str(kaynak))
+        if not kayit or not kayit.get("sonuc") or kayit.get("ayar") != self.ayar:
+            return False
+        if kayit.get("yol") not in GUNCEL_YOLLAR:
+            return False
+        if kayit.get("hedef") != str(hedef):
+            return False
+        try:
+            st = os.stat(kaynak)
+            cikti = os.stat(hedef)
+        except OSError:
+            return False
+        return (st.st_size == kayit.get("boyut") and st.st_mtime_ns == kayit.get("mtime_ns")
+                and cikti.st_size == kayit.get("cikti_boyut"))
+
+    def kaydet(self, kaynak, hedef, sonuc, yol=None):
+        """İşlenen bir dosyanın sonucunu ve işlem yolunu (bilgi["yol"]) manifeste ekler."""
+        try:
+            st = os.stat(kaynak)
+            boyut, mtime_ns = st.st_size, st.st_mtime_ns
+        except OSError:
+            boyut, mtime_ns = None, None
+        try:
+            cikti_boyut = os.path.getsize(hedef) if sonuc else None
+        except OSError:
+            cikti_boyut, sonuc = None, False
+
+        kayit = {
+            "kaynak": str(kaynak),
+            "boyut": boyut,
+            "mtime_ns": mtime_ns,
+            "ayar": self.ayar,
+            "hedef": str(hedef),
+            "sonuc": bool(sonuc),
+            "yol": yol,
+            "cikti_boyut": cikti_boyut,
+        }
+        self.kayitlar[kayit["kaynak"]] = kayit
+
+        try:
+            if self._dosya is None:
+                self._dosya = open(self.yol, "a", encoding="utf-8")
+            self._dosya.write(json.dumps(kayit, ensure_ascii=False) + "\n")
+            # Satır satır diske it: çökme olursa bitenler kaybolmasın
+            self._dosya.flush()
+        except OSError as e:
+            print(f"⚠️ Manifest yazılamadı: {e}")
+
+    def kapat(self):
+        if self._dosya is not None:
+            self._dosya.close()
+            self._dosya = None
@@ -0,0 +1,164 @@
+import csv
+import json
+import math
+import time
+from collections import Counter
+
+# =============================================================================
+# ⚙️ AYARLAR
+# =============================================================================
+
+# Görsel başına ölçümlerin yazılacağı CSV ve toplu özetin yazılacağı JSON
+METRIK_DOSYASI = "Optimizasyon_Metrikleri.csv"
+OZET_DOSYASI = "Optimizasyon_Ozeti.json"
+
+# CSV sütunları (bilgi sözlüğünde olmayan alanlar boş kalır)
+SUTUNLAR = [
+    "kaynak", "hedef", "grup", "bicim", "renk_donusumu", "yol", "kopya_yontemi", "hata", "butunluk",
+    "kaynak_bayt", "cikti_bayt", "bellek_tahmini_mb", "cozme_olcegi", "tepe_rss_mb", "kalite", "boyut_kalitesi", "ssim", "tahmin", "deneme",
+    "okuma_sn", "cozme_sn", "kucultme_sn", "renk_sn", "kodlama_sn", "yazma_sn", "toplam_sn",
+]
+
+# İşlem yolları:
+#   kopya              : İşlem gerekmedi, orijinal aynen kopyalandı
+#   yeniden_sikistirma : Küçültüldü ve/veya yeniden kodlandı
+#   kalite_korundu     : Küçültme gerekmedi; orijinal niceleme tablolarıyla (quality="keep") yeniden kaydedilip sınıra sığdı
+#   hedefe_inilemedi   : En düşük kalitede bile sınır aşıldı, orijinal kopyalandı
+#   mukerrer           : Aynı içerikli görselin çıktısı kopyalandı
+#   hata_kopya         : İşlenirken hata oluştu, orijinal kopyalandı
+#   bozuk_kaynak       : Kaynak JPEG bozuk (kesik / yarım kopya), çıktı üretilmedi (bkz. BOZUK_KAYNAK_KONTROLU)
+#   hata               : Kopyalama da başarısız oldu, çıktı yok
+
+# Algısal kalite (ALGISAL_KALITE açıkken): kalite = seçilen (SSIM hedefini tutan en düşük) kalite,
+# boyut_kalitesi = sadece boyut sınırına göre seçilecek olan kalite, ssim = seçilen çıktının skoru.
+
+# Biçim karşılaştırması (özette "bicimler"): Kodlanan her seviye (ana + türevler) kendi biçimine sayılır.
+# Farklı boyutlardaki çıktılar KB/MP (megapiksel başına KB) ile karşılaştırılabilir.
+
+# =============================================================================
+# 📈 METRİK TOPLAYICI
+# =============================================================================
+
+def yuzdelik(degerler, oran):
+    """Sıralı listede en yakın sıra yöntemiyle yüzdelik değer (boş liste -> 0)."""
+    if not degerler:
+        return 0.0
+    sira = min(len(degerler), max(1, math.ceil(oran / 100 * len(degerler)))) - 1
+    return degerler[sira]
+
+
+class MetrikToplayici:
+    """
+    Görsel başına ölçümleri satır satır CSV'ye yazar (bellekte tutulmaz), toplu değerleri
+    (yol dağılımı, bayt toplamları, süre listesi) biriktirir ve bitişte JSON özet üretir.
+    """
+    def __init__(self, csv_dosyasi=METRIK_DOSYASI, ozet_dosyasi=OZET_DOSYASI):
+        self.csv_dosyasi = csv_dosyasi
+        self.ozet_dosyasi = ozet_dosyasi
+        self.yollar = Counter()
+        self.kopya_yontemleri = Counter()
+        self.sureler = []
+        self.asama_sureleri = Counter()
+        self.bicimler = {}  # biçim -> [çıktı sayısı, bayt, kodlama süresi, piksel]
+        self.dev_sayisi = 0
+        self.dev_rss = []   # Dev görsellerin (sınırlı bellekle işlenen) tepe RSS değerleri (MB; ölçülebildiyse)
+        self.algisal = []   # Algısal kalite: (ssim, kalite, boyut_kalitesi)
+        self.kaynak_bayt = 0
+        self.cikti_bayt = 0
+        self.baslangic = time.perf_counter()
+        self._dosya = None
+        self._yazici = None
+        try:
+            self._dosya = open(csv_dosyasi, "w", newline="", encoding="utf-8")
+            self._yazici = csv.DictWriter(self._dosya, fieldnames=SUTUNLAR, extrasaction="ignore")
+            self._yazici.writeheader()
+        except OSError as e:
+            print(f"⚠️ Metrik dosyası açılamadı, sadece özet tutulacak: {e}")
+
+    def ekle(self, bilgi):
+        self.yollar[bilgi.get("yol", "?")] += 1
+        if bilgi.get("kopya_yontemi"):
+            self.kopya_yontemleri[bilgi["kopya_yontemi"]] += 1
+        self.kaynak_bayt += bilgi.get("kaynak_bayt") or 0
+        self.cikti_bayt += bilgi.get("cikti_bayt") or 0
+        if bilgi.get("toplam_sn") is not None:
+            self.sureler.append(bilgi["toplam_sn"])
+        for asama in ("okuma_sn", "cozme_sn", "kucultme_sn", "renk_sn", "kodlama_sn", "yazma_sn"):
+            self.asama_sureleri[asama] += bilgi.get(asama) or 0.0
+        if bilgi.get("ssim") is not None:
+            self.algisal.append((bilgi["ssim"], bilgi.get("kalite") or 0, bilgi.get("boyut_kalitesi") or 0))
+        if bilgi.get("cozme_olcegi") is not None:
+            self.dev_sayisi += 1
+            if bilgi.get("tepe_rss_mb") is not None:
+                self.dev_rss.append(bilgi["tepe_rss_mb"])
+        for bicim, degerler in (bilgi.get("bicimler") or {}).items():
+            toplam = self.bicimler.setdefault(bicim, [0, 0, 0.0, 0])
+            for sira, deger in enumerate(degerler):
+                toplam[sira] += deger
+
+        if self._yazici:
+            satir = {ad: bilgi.get(ad) for ad in SUTUNLAR}
+            for ad in ("okuma_sn", "cozme_sn", "kucultme_sn", "renk_sn", "kodlama_sn", "yazma_sn", "toplam_sn"):
+                if satir[ad] is not None:
+                    satir[ad] = round(satir[ad], 4)
+            if satir["tepe_rss_mb"] is not None:
+                satir["tepe_rss_mb"] = round(satir["tepe_rss_mb"], 1)
+            self._yazici.writerow(satir)
+
+    def ozet(self):
+        gecen = max(time.perf_counter() - self.baslangic, 1e-9)
+        sirali = sorted(self.sureler)
+        adet = sum(self.yollar.values())
+        mb = 1024 * 1024
+        return {
+            "gorsel_sayisi": adet,
+            "gecen_sn": round(gecen, 2),
+            "gorsel_sn": round(adet / gecen, 2),
+            "mb_sn": round(self.kaynak_bayt / mb / gecen, 2),
+            "kaynak_mb": round(self.kaynak_bayt / mb, 2),
+            "cikti_mb": round(self.cikti_bayt / mb, 2),
+            "gecikme_p50_sn": round(yuzdelik(sirali, 50), 4),
+            "gecikme_p95_sn": round(yuzdelik(sirali, 95), 4),
+            "gecikme_max_sn": round(sirali[-1], 4) if sirali else 0.0,
+            "yollar": dict(self.yollar),
+            "kopya_yontemleri": dict(self.kopya_yontemleri),
+            # Paralel çalışmada aşama süreleri işçilerin toplamıdır (duvar saati değil)
+            "asama_toplam_sn": {ad: round(sn, 2) for ad, sn in self.asama_sureleri.items()},
+            "bicimler": {
+                bicim: {
+                    "cikti_sayisi": sayi,
+                    "cikti_mb": round(bayt / mb, 2),
+                    "ort_kb": round(bayt / 1024 / sayi, 1),
+                    "kb_megapiksel": round(bayt / 1024 / (piksel / 1e6), 1) if piksel else 0.0,
+                    "kodlama_sn": round(sn, 2),
+                    "ort_kodlama_ms": round(1000 * sn / sayi, 1),
+                }
+                for bicim, (sayi, bayt, sn, piksel) in self.bicimler.items() if sayi
+            },
+            "dev_gorsel": {
+                "adet": self.dev_sayisi,
+                "tepe_rss_mb_p50": round(yuzdelik(sorted(self.dev_rss), 50), 1),
+                "tepe_rss_mb_max": round(max(self.dev_rss), 1) if self.dev_rss else 0.0,
+            },
+            "algisal": {
+                "adet": len(self.algisal),
+                "ssim_p50": round(yuzdelik(sorted(s for s, _, _ in self.algisal), 50), 4),
+                "ssim_min": round(min(s for s, _, _ in self.algisal), 4) if self.algisal else 0.0,
+                "ort_kalite": round(sum(k for _, k, _ in self.algisal) / len(self.algisal), 1) if self.algisal else 0.0,
+                "ort_boyut_kalitesi": (round(sum(b for _, _, b in self.algisal) / len(self.algisal), 1)
+                                       if self.algisal else 0.0),
+            },
+        }
+
+    def kapat(self):
+        """CSV'yi kapatır, JSON özeti yazar ve özeti döner."""
+        if self._dosya:
+            self._dosya.close()
+            self._dosya = None
+        ozet = self.ozet()
+        try:
+            with open(self.ozet_dosyasi, "w", encoding="utf-8") as f:
+                json.dump(ozet, f, ensure_ascii=False, indent=2)
+        except OSError as e:
+            print(f"⚠️ Metrik özeti yazılamadı: {e}")
+        return ozet
@@ -0,0 +1,99 @@
+import sys
+import threading
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# =============================================================================
+# ⚙️ AYARLAR
+# =============================================================================
+
+# Aynı anda çözülmekte olan görsellerin toplam tahmini bellek sınırı (MB)
+VARSAYILAN_BUTCE_MB = 2048
+
+# Tepe RSS sadece Linux'ta (/proc/self/clear_refs) görsel başına sıfırlanabilir
+TEPE_SIFIRLANABILIR = sys.platform.startswith("linux")
+
+# =============================================================================
+# 🧮 PİKSEL BÜTÇESİ (Bellek sınırlı iş kabulü)
+# =============================================================================
+
+class PikselButcesi:
+    """
+    Paralel çözme (decode) işlerinin toplam bellek ihtiyacını sınırlar.
+
+    Her görsel, işe alınmadan önce başlığından hesaplanan bellek ihtiyacını bütçeden ayırır
+    (al) ve iş bitince geri bırakır (birak). Bütçe yetmiyorsa yer açılana kadar beklenir:
+      - Küçük görseller bütçe elverdiğince birlikte çalışır,
+      - Bütçeden büyük tek bir görsel, çalışan herkes bitince TEK BAŞINA kabul edilir
+        (sonsuza kadar beklemez) ve o bitene kadar başka iş alınmaz.
+    """
+    def __init__(self, limit_bayt=VARSAYILAN_BUTCE_MB * 1024 * 1024):
+        self.limit = limit_bayt
+        self.kullanilan = 0
+        self.en_yuksek = 0
+        self.bekleme_sayisi = 0
+        self._kosul = threading.Condition()
+
+    def al(self, miktar, dur=None):
+        """
+        Bütçeden 'miktar' bayt ayırır; yer yoksa bekler. dur (threading.Event) kurulursa
+        beklemeyi bırakıp False döner.
+        """
+        with self._kosul:
+            bekledi = False
+            while self.kullanilan > 0 and self.kullanilan + miktar > self.limit:
+                if dur is not None and dur.is_set():
+                    return False
+                bekledi = True
+                self._kosul.wait(timeout=0.5)
+            if bekledi:
+                self.bekleme_sayisi += 1
+            self.kullanilan += miktar
+            self.en_yuksek = max(self.en_yuksek, self.kullanilan)
+            return True
+
+    def birak(self, miktar):
+        with self._kosul:
+            self.kullanilan = max(0, self.kullanilan - miktar)
+            self._kosul.notify_all()
+
+# =============================================================================
+# 📏 TEPE BELLEK (RSS) ÖLÇÜMÜ
+# =============================================================================
+
+def tepe_rss_sifirla():
+    """
+    Linux: sürecin tepe RSS değerini (VmHWM) şimdiki kullanıma indirir; başarılıysa True.
+    Diğer sistemlerde (macOS, Windows) karşılığı yoktur, hiçbir şey yapmadan False döner.
+    """
+    if not TEPE_SIFIRLANABILIR:
+        return False
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def tepe_rss_mb():
+    """
+    Sürecin tepe RSS değeri (MB). TEPE_SIFIRLANABILIR olmayan sistemlerde (macOS) süreç açıldığından
+    beri en yüksek değerdir (görsel başına üst sınır olarak okunmalı). Ölçülemezse (Windows) None.
+    """
+    if TEPE_SIFIRLANABILIR:
+        try:
+            with open("/proc/self/status", "r") as f:
+                for satir in f:
+                    if satir.startswith("VmHWM:"):
+                        return int(satir.split()[1]) / 1024
+        except (OSError, ValueError, IndexError):
+            pass
+    if resource is None:
+        return None
+    tepe = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS bayt, Linux KB cinsinden döner
+    return tepe / (1024 * 1024) if sys.platform == "darwin" else tepe / 1024
@@ -0,0 +1,58 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# Modüller depo kökünde düz betikler olarak durur; testler onları doğrudan içe aktarır.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def jpeg_yaz(yol, boyut=(800, 600), seed=0, mod="RGB", **kaydet):
+    """Gürültülü gradyan bir JPEG yazar (gerçek fotoğraf gibi sıkıştırması zor içerik)."""
+    import numpy as np
+    from PIL import Image
+
+    rng = np.random.default_rng(seed)
+    genislik, yukseklik = boyut
+    bant = 4 if mod == "CMYK" else 3
+    gradyan = np.linspace(0, 200, genislik, dtype=np.float32)[None, :, None]
+    piksel = gradyan + rng.normal(0, 30, (yukseklik, genislik, bant)).astype(np.float32)
+    img = Image.fromarray(np.clip(piksel, 0, 255).astype(np.uint8), "RGBA" if mod == "CMYK" else "RGB")
+    if mod == "CMYK":
+        img = Image.frombytes("CMYK", img.size, img.tobytes())
+    kaydet.setdefault("quality", 95)
+    Path(yol).parent.mkdir(parents=True, exist_ok=True)
+    img.save(yol, "JPEG", **kaydet)
+    return Path(yol)
+
+
+def envanter_yaz(yol, klasorler):
+    """main_optimizer'ın okuduğu envanter Excel'ini (Yol / Ebat / Orijinal_Ad / Yuzey) yazar."""
+    import pandas as pd
+
+    satirlar = [{"Yol": str(k), "Ebat": Path(k).parts[-3], "Orijinal_Ad": Path(k).parts[-2],
+                 "Yuzey": Path(k).parts[-1]} for k in klasorler]
+    pd.DataFrame(satirlar).to_excel(yol, index=False)
+    return Path(yol)
+
+
+@pytest.fixture
+def optimizer_ortami(tmp_path, monkeypatch):
+    """main_optimizer'ın tüm çıktı ve yan dosyalarını geçici klasöre yönlendirir (sıralı, tahminsiz)."""
+    import main_optimizer
+
+    monkeypatch.chdir(tmp_path)
+    ayarlar = {
+        "HEDEF_ANA_KLASOR": tmp_path / "cikti",
+        "METRIK_DOSYASI": str(tmp_path / "metrik.csv"),
+        "METRIK_OZET_DOSYASI": str(tmp_path / "metrik_ozet.json"),
+        "IS_PLANI_DOSYASI": str(tmp_path / "plan.csv"),
+        "KALITE_MODELI_DOSYASI": str(tmp_path / "model.json"),
+        "SIMULASYON_RAPORU": str(tmp_path / "simulasyon.xlsx"),
+        "KALITE_TAHMINI": False,
+        "ISCI_SAYISI": 1,
+        "TUREVLER": [],
+    }
+    for ad, deger in ayarlar.items():
+        monkeypatch.setattr(main_optimizer, ad, deger)
+    return tmp_path
@@ -0,0 +1,46 @@
+import io
+
+import numpy as np
+import pytest
+from PIL import Image
+
+import algisal_kalite
+import main_optimizer
+from conftest import jpeg_yaz
+
+
+@pytest.fixture
+def optimizer(tmp_path, monkeypatch):
+    monkeypatch.setattr(main_optimizer, "KALITE_MODELI_DOSYASI", str(tmp_path / "model.json"))
+    monkeypatch.setattr(main_optimizer, "KALITE_TAHMINI", False)
+    monkeypatch.setattr(main_optimizer, "TUREVLER", [])
+    return main_optimizer.StokOptimizeEdici(tmp_path / "envanter.xlsx")
+
+
+def test_ssim_ayni_duzlemde_bir_bozulunca_duser():
+    rng = np.random.default_rng(9)
+    duzlem = rng.integers(0, 256, (64, 64)).astype(np.float32)
+    assert algisal_kalite.ssim(duzlem, duzlem) == pytest.approx(1.0)
+    assert algisal_kalite.ssim(duzlem, duzlem + rng.normal(0, 40, duzlem.shape)) < 0.9
+
+
+@pytest.mark.parametrize("max_mb", [4.0, 0.5, 0.3])
+@pytest.mark.parametrize("seed", [0, 1])
+def test_algisal_kalite_boyut_kalitesinin_ustune_cikmaz(optimizer, tmp_path, monkeypatch, max_mb, seed):
+    monkeypatch.setattr(main_optimizer, "HEDEF_MAX_BOYUT_MB", max_mb)
+    veri = jpeg_yaz(tmp_path / "kaynak.jpg", (1800, 1200), seed=seed).read_bytes()
+
+    monkeypatch.setattr(main_optimizer, "ALGISAL_KALITE", False)
+    _, boyut_bilgi = optimizer.optimize_veri(veri)
+    monkeypatch.setattr(main_optimizer, "ALGISAL_KALITE", True)
+    ciktilar, bilgi = optimizer.optimize_veri(veri)
+
+    cikti = ciktilar[main_optimizer.ANA_CIKTI]
+    assert bilgi["boyut_kalitesi"] == boyut_bilgi["kalite"]
+    assert bilgi["kalite"] <= bilgi["boyut_kalitesi"]
+    assert len(cikti) < max_mb * 1024 * 1024
+    if bilgi["kalite"] < bilgi["boyut_kalitesi"]:
+        # Sadece algısal hedef korunarak aşağı inilir
+        assert bilgi["ssim"] >= main_optimizer.ALGISAL_HEDEF_SSIM
+    with Image.open(io.BytesIO(cikti)) as img:
+        assert img.size == (1500, 1000)
@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+import algisal_ozet
+
+
+def _kaba_kuvvet(ozetler, esik):
+    ciftler = set()
+    for i in range(len(ozetler)):
+        for j in range(i + 1, len(ozetler)):
+            mesafe = algisal_ozet.hamming(int(ozetler[i]), int(ozetler[j]))
+            if mesafe <= esik:
+                ciftler.add((i, j, mesafe))
+    return ciftler
+
+
+def _ozetler(adet, seed):
+    """Rastgele özetler + birkaç bit çevrilmiş yakın kopyaları (eşiğin iki yanında mesafeler)."""
+    rng = np.random.default_rng(seed)
+    temel = rng.integers(0, 2**63, adet, dtype=np.uint64) * np.uint64(2) + rng.integers(0, 2, adet, dtype=np.uint64)
+    ozetler = list(temel)
+    for ozet in temel[: adet // 2]:
+        bitler = rng.choice(64, size=rng.integers(0, 12), replace=False)
+        ozetler.append(ozet ^ np.uint64(sum(1 << int(b) for b in bitler)))
+    return np.array(ozetler, dtype=np.uint64)
+
+
+@pytest.mark.parametrize("esik", [0, 3, 6, 10])
+@pytest.mark.parametrize("seed", [0, 1])
+def test_yakin_ciftler_kaba_kuvvetle_ayni(esik, seed):
+    ozetler = _ozetler(120, seed)
+    i, j, mesafe = algisal_ozet.yakin_ciftler(ozetler, esik)
+    bulunan = set(zip(i.tolist(), j.tolist(), mesafe.tolist()))
+    assert bulunan == _kaba_kuvvet(ozetler, esik)
+    assert len(bulunan) == len(i)
+
+
+def test_yakin_ciftler_az_ozet():
+    for ozetler in ([], [5]):
+        i, j, mesafe = algisal_ozet.yakin_ciftler(ozetler, 6)
+        assert len(i) == len(j) == len(mesafe) == 0
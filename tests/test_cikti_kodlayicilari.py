@@ -0,0 +1,57 @@
+import io
+
+import pytest
+from PIL import Image, ImageCms
+
+import cikti_kodlayicilari
+import main_optimizer
+from conftest import envanter_yaz, jpeg_yaz
+
+SRGB = ImageCms.ImageCmsProfile(ImageCms.createProfile("sRGB")).tobytes()
+
+
+@pytest.mark.parametrize("ad, bicim, beklenen", [
+    ("1.JPG", "jpeg", "1.JPG"),
+    ("1.jpeg", "jpeg", "1.jpeg"),
+    ("1.jpg", "webp", "1.webp"),
+    ("urun.v2.JPG", "avif", "urun.v2.avif"),
+    ("uzantisiz", "webp", "uzantisiz.webp"),
+])
+def test_dosya_adi(ad, bicim, beklenen):
+    assert cikti_kodlayicilari.dosya_adi(ad, bicim) == beklenen
+
+
+def test_hazirla_desteklenen_modda_profili_aynen_ekler():
+    img = Image.new("RGB", (8, 8))
+    hazir, ayarlar = cikti_kodlayicilari.hazirla(img, "webp", b"profil")
+    assert hazir is img and ayarlar["icc_profile"] == b"profil"
+
+
+def test_hazirla_cmyk_webp_icin_srgbye_donusturur():
+    img = Image.new("CMYK", (8, 8), (0, 255, 255, 0))
+    hazir, ayarlar = cikti_kodlayicilari.hazirla(img, "webp", None)
+    # Profilsiz CMYK: basit dönüşüm, artık geçersiz olan kaynak profili eklenmez
+    assert hazir.mode == "RGB" and "icc_profile" not in ayarlar
+    assert hazir.getpixel((0, 0))[0] > 200
+
+
+@pytest.mark.parametrize("bicim", ["webp", "avif"])
+def test_turev_bicimiyle_adlandirilir_ve_profil_korunur(optimizer_ortami, monkeypatch, bicim):
+    if not cikti_kodlayicilari.destekleniyor_mu(bicim):
+        pytest.skip(f"Bu Pillow kurulumu {bicim} yazamıyor")
+    monkeypatch.setattr(main_optimizer, "TUREVLER", [
+        {"ad": "bayi", "kisa_kenar": 300, "max_mb": 0.5, "klasor": optimizer_ortami / "bayi", "bicim": bicim},
+    ])
+    klasor = optimizer_ortami / "kaynak" / "60X120" / "A" / "MAT"
+    jpeg_yaz(klasor / "1.JPG", (600, 400), seed=6, icc_profile=SRGB)
+    envanter = envanter_yaz(optimizer_ortami / "envanter.xlsx", [klasor])
+
+    main_optimizer.StokOptimizeEdici(envanter).baslat()
+
+    ana = optimizer_ortami / "cikti" / "60X120" / "A" / "MAT" / "1.JPG"
+    turev = optimizer_ortami / "bayi" / "60X120" / "A" / "MAT" / cikti_kodlayicilari.dosya_adi("1.JPG", bicim)
+    assert ana.exists() and turev.exists()
+    with Image.open(io.BytesIO(turev.read_bytes())) as img:
+        assert img.format == cikti_kodlayicilari.KODLAYICILAR[bicim]["format"]
+        assert img.size == (450, 300)
+        assert img.info.get("icc_profile") == SRGB
@@ -0,0 +1,53 @@
+import io
+
+import numpy as np
+import pytest
+from PIL import Image
+
+import main_optimizer
+from conftest import jpeg_yaz
+
+
+@pytest.fixture
+def optimizer(tmp_path, monkeypatch):
+    monkeypatch.setattr(main_optimizer, "KALITE_MODELI_DOSYASI", str(tmp_path / "model.json"))
+    monkeypatch.setattr(main_optimizer, "KALITE_TAHMINI", False)
+    monkeypatch.setattr(main_optimizer, "TUREVLER", [])
+    return main_optimizer.StokOptimizeEdici(tmp_path / "envanter.xlsx")
+
+
+@pytest.fixture(scope="module")
+def dev_jpeg(tmp_path_factory):
+    return jpeg_yaz(tmp_path_factory.mktemp("dev") / "dev.jpg", (4800, 3600), seed=7, quality=85).read_bytes()
+
+
+def test_dev_gorsel_olcekli_cozulur_ve_ayni_boyutta_cikar(optimizer, dev_jpeg, monkeypatch):
+    monkeypatch.setattr(main_optimizer, "HIZLI_KUCULTME", False)
+    normal, normal_bilgi = optimizer.optimize_veri(dev_jpeg)
+
+    # Eşik ve bellek sınırı küçültülünce aynı görsel "dev" sayılır
+    monkeypatch.setattr(main_optimizer, "DEV_GORSEL_ESIGI_MP", 1)
+    monkeypatch.setattr(main_optimizer, "DEV_GORSEL_BELLEK_MB", 1)
+    monkeypatch.setattr(main_optimizer, "SERIT_YUKSEKLIGI", 64)
+    dev, dev_bilgi = optimizer.optimize_veri(dev_jpeg)
+
+    assert "cozme_olcegi" not in normal_bilgi
+    # HIZLI_KUCULTME kapalı olsa da bellek sınırı için 1/2 çözülür, hedefin (1000) altına inilmez
+    assert dev_bilgi["cozme_olcegi"] == 2
+    with Image.open(io.BytesIO(normal[main_optimizer.ANA_CIKTI])) as a, \
+            Image.open(io.BytesIO(dev[main_optimizer.ANA_CIKTI])) as b:
+        assert a.size == b.size == (1333, 1000)
+        fark = np.abs(np.asarray(a, dtype=np.int16) - np.asarray(b, dtype=np.int16))
+        assert fark.mean() < 4
+
+
+def test_seritli_kucultme_tek_seferlikle_ayni(optimizer, monkeypatch):
+    monkeypatch.setattr(main_optimizer, "SERIT_YUKSEKLIGI", 37)
+    rng = np.random.default_rng(8)
+    img = Image.fromarray(rng.integers(0, 256, (900, 600, 3), dtype=np.uint8))
+
+    seritli = np.asarray(optimizer.seritli_kucult(img, (200, 300)), dtype=np.int16)
+    tek = np.asarray(img.resize((200, 300), Image.LANCZOS), dtype=np.int16)
+
+    assert seritli.shape == tek.shape
+    assert np.abs(seritli - tek).max() <= 1
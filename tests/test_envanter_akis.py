@@ -0,0 +1,46 @@
+import pandas as pd
+import pytest
+
+import disk_envanter_guncelleyici
+from disk_envanter_guncelleyici import EnvanterTarayici
+from conftest import jpeg_yaz
+
+
+@pytest.fixture
+def arsiv(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # Bütünlük önbelleği çalışma klasörüne yazılır
+    monkeypatch.setattr(disk_envanter_guncelleyici, "SNAPSHOT_DOSYASI", str(tmp_path / "snapshot.json"))
+    kok = tmp_path / "arsiv"
+    for i, (urun, ebat) in enumerate((("A", "60X120"), ("B", "60X120"), ("C", "30X60"))):
+        for sira in range(2):
+            jpeg_yaz(kok / ebat / urun / "MAT" / f"{sira}.jpg", boyut=(64, 48), seed=i * 2 + sira)
+    # Aynı içerik iki klasörde: mükerrer raporuna düşmeli
+    (kok / "30X60" / "C" / "MAT" / "kopya.jpg").write_bytes((kok / "60X120" / "A" / "MAT" / "0.jpg").read_bytes())
+    return kok
+
+
+def _rapor(tarayici, yol, monkeypatch):
+    monkeypatch.setattr(disk_envanter_guncelleyici, "RAPOR_ADI", str(yol))
+    tarayici.tara_ve_raporla()
+    return pd.read_excel(yol).sort_values("Yol").reset_index(drop=True)
+
+
+def test_akis_raporu_bellek_raporuyla_ayni(arsiv, tmp_path, monkeypatch):
+    bellek = _rapor(EnvanterTarayici(arsiv, artimli=False, akis=False), tmp_path / "bellek.xlsx", monkeypatch)
+    akis = _rapor(EnvanterTarayici(arsiv, akis=True), tmp_path / "akis.xlsx", monkeypatch)
+
+    assert len(bellek) == 3
+    assert list(akis.columns) == list(bellek.columns)
+    pd.testing.assert_frame_equal(akis, bellek)
+
+
+def test_akis_modunda_ek_raporlar_uretilir(arsiv, tmp_path, monkeypatch):
+    bozuk = arsiv / "30X60" / "C" / "MAT" / "1.jpg"
+    bozuk.write_bytes(bozuk.read_bytes()[:-200])
+    tarayici = EnvanterTarayici(arsiv, akis=True, mukerrer=True, butunluk=True)
+    _rapor(tarayici, tmp_path / "akis.xlsx", monkeypatch)
+
+    mukerrer = pd.read_excel(tmp_path / disk_envanter_guncelleyici.MUKERRER_RAPOR_ADI)
+    assert sorted(mukerrer["Yol"].map(lambda yol: yol.rsplit("/", 1)[-1])) == ["0.jpg", "kopya.jpg"]
+    butunluk = pd.read_excel(tmp_path / disk_envanter_guncelleyici.BUTUNLUK_RAPOR_ADI)
+    assert list(butunluk["Yol"]) == [str(bozuk)]
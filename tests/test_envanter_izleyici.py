@@ -0,0 +1,73 @@
+import os
+
+import pytest
+
+import hizli_tarayici
+from envanter_izleyici import EnvanterIzleyici
+
+
+class _Tarayici:
+    """Başlık okumayan, yazılan raporları sayan sahte EnvanterTarayici."""
+    def __init__(self, kok):
+        self.root_path = kok
+        self.rapor_sayisi = 0
+
+    def baslik_gerekli_mi(self, kayit):
+        return False
+
+    def snapshot_kaydet(self, klasorler):
+        pass
+
+    def raporu_yaz(self, klasorler):
+        self.rapor_sayisi += 1
+
+
+@pytest.fixture
+def izleyici(tmp_path):
+    (tmp_path / "Ebat" / "Urun").mkdir(parents=True)
+    (tmp_path / "Ebat" / "Urun" / "a.jpg").write_bytes(b"x" * 10)
+    (tmp_path / ".Trashes").mkdir()
+    (tmp_path / "Ebat" / "@eaDir").mkdir()
+    izleyici = EnvanterIzleyici(_Tarayici(tmp_path))
+    izleyici.klasorler = {yol: kayit for yol, kayit, _, _ in hizli_tarayici.agaci_gez(str(tmp_path))}
+    return izleyici
+
+
+def test_atlanan_klasor_olaylari_envantere_girmez(izleyici, tmp_path):
+    once = dict(izleyici.klasorler)
+    for klasor in (tmp_path / ".Trashes", tmp_path / "Ebat" / "@eaDir"):
+        (klasor / "b.jpg").write_bytes(b"y")
+        izleyici.isaretle(klasor / "b.jpg", False)
+        izleyici.isaretle(klasor / "alt", True)
+
+    assert not izleyici.kirli
+    assert izleyici.kirlileri_isle() == 0
+    assert izleyici.klasorler == once
+
+
+def test_atlanan_klasor_dogrudan_guncellenmez(izleyici, tmp_path):
+    assert not izleyici._klasoru_guncelle(str(tmp_path / "Ebat" / "@eaDir"))
+    assert str(tmp_path / "Ebat" / "@eaDir") not in izleyici.klasorler
+
+
+def test_degismeyen_klasor_rapor_yazdirmaz(izleyici, tmp_path):
+    urun = tmp_path / "Ebat" / "Urun"
+    (urun / "gecici.tmp").write_bytes(b"")
+    os.remove(urun / "gecici.tmp")
+    izleyici.isaretle(urun / "gecici.tmp", False)
+    assert izleyici.kirlileri_isle() == 0
+
+    (urun / "b.jpg").write_bytes(b"y" * 5)
+    izleyici.isaretle(urun / "b.jpg", False)
+    assert izleyici.kirlileri_isle() == 1
+    assert izleyici.klasorler[str(urun)]["gorsel_sayisi"] == 2
+
+
+def test_yoklama_sadece_icerik_degisimini_sayar(izleyici, tmp_path):
+    urun = tmp_path / "Ebat" / "Urun"
+    (urun / "gecici.tmp").write_bytes(b"")
+    os.remove(urun / "gecici.tmp")
+    assert izleyici.yokla() == 0
+
+    (tmp_path / "Ebat" / "Yeni").mkdir()
+    assert izleyici.yokla() == 2
@@ -0,0 +1,69 @@
+import os
+
+import pytest
+
+import disk_envanter_guncelleyici
+from disk_envanter_guncelleyici import EnvanterTarayici
+
+
+@pytest.fixture
+def arsiv(tmp_path, monkeypatch):
+    monkeypatch.setattr(disk_envanter_guncelleyici, "SNAPSHOT_DOSYASI", str(tmp_path / "snapshot.json"))
+    kok = tmp_path / "arsiv"
+    for urun in ("A", "B"):
+        klasor = kok / "60X120" / urun / "MAT"
+        klasor.mkdir(parents=True)
+        (klasor / "1.jpg").write_bytes(b"x" * 10)
+    return kok
+
+
+def _tara(tarayici):
+    klasorler, degisen = tarayici.agaci_tara(tarayici.snapshot_yukle())
+    tarayici.snapshot_kaydet(klasorler)
+    return klasorler, degisen
+
+
+def test_degismeyen_klasorler_snapshottan_gelir(arsiv, monkeypatch):
+    tarayici = EnvanterTarayici(arsiv, baslik=False)
+    ilk, degisen = _tara(tarayici)
+    assert degisen == len(ilk) == 6
+
+    # İkinci taramada hiçbir klasör yeniden listelenmez
+    listelenen = []
+    incele = disk_envanter_guncelleyici.hizli_tarayici.klasor_incele
+
+    def say(klasor, onceki_kayit=None, *args, **kwargs):
+        kayit, onbellekten = incele(klasor, onceki_kayit, *args, **kwargs)
+        if not onbellekten:
+            listelenen.append(klasor)
+        return kayit, onbellekten
+
+    monkeypatch.setattr(disk_envanter_guncelleyici.hizli_tarayici, "klasor_incele", say)
+    ikinci, degisen = _tara(tarayici)
+    assert degisen == 0 and listelenen == []
+    assert ikinci == ilk
+
+
+def test_dosya_eklenen_klasor_yeniden_listelenir(arsiv):
+    tarayici = EnvanterTarayici(arsiv, baslik=False)
+    _tara(tarayici)
+
+    klasor = arsiv / "60X120" / "A" / "MAT"
+    onceki_mtime = os.stat(klasor).st_mtime_ns
+    (klasor / "2.jpg").write_bytes(b"y" * 5)
+    # Kaba zaman damgalı dosya sistemlerinde ekleme aynı tik içinde kalabilir
+    if os.stat(klasor).st_mtime_ns == onceki_mtime:
+        os.utime(klasor, ns=(onceki_mtime, onceki_mtime + 1_000_000_000))
+
+    klasorler, degisen = _tara(tarayici)
+    assert degisen == 1
+    assert klasorler[str(klasor)]["gorsel_sayisi"] == 2
+    assert klasorler[str(klasor)]["toplam_bytes"] == 15
+
+
+def test_baska_koke_ait_snapshot_kullanilmaz(arsiv, tmp_path):
+    _tara(EnvanterTarayici(arsiv, baslik=False))
+    baska = tmp_path / "baska"
+    baska.mkdir()
+    assert EnvanterTarayici(baska, baslik=False).snapshot_yukle() == {}
+    assert EnvanterTarayici(arsiv, baslik=False).snapshot_yukle() != {}
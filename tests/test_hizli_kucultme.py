@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+from PIL import Image
+
+import main_optimizer
+from conftest import jpeg_yaz
+
+
+@pytest.fixture
+def optimizer(tmp_path, monkeypatch):
+    monkeypatch.setattr(main_optimizer, "KALITE_MODELI_DOSYASI", str(tmp_path / "model.json"))
+    monkeypatch.setattr(main_optimizer, "TUREVLER", [])
+    return main_optimizer.StokOptimizeEdici(tmp_path / "envanter.xlsx")
+
+
+@pytest.fixture
+def buyuk_jpeg(tmp_path):
+    return jpeg_yaz(tmp_path / "buyuk.jpg", (2000, 1600), seed=4)
+
+
+def _kucult(optimizer, yol, hedef):
+    with Image.open(yol) as img:
+        sureler = {}
+        sonuc = optimizer.kucult(img, hedef, sureler)
+        return sonuc, img.size, sureler
+
+
+@pytest.mark.parametrize("hizli", [True, False])
+def test_kucult_hedef_boyutu_verir(optimizer, buyuk_jpeg, monkeypatch, hizli):
+    monkeypatch.setattr(main_optimizer, "HIZLI_KUCULTME", hizli)
+    sonuc, cozulen, sureler = _kucult(optimizer, buyuk_jpeg, (250, 200))
+
+    assert sonuc.size == (250, 200)
+    # Hızlı yolda DCT aşamasında 1/4 çözülür (hedefin KUCULTME_PAYI katı: 500x400), yoksa tam çözünürlük
+    assert cozulen == ((500, 400) if hizli else (2000, 1600))
+    assert {"cozme_sn", "kucultme_sn"} <= sureler.keys()
+
+
+def test_hizli_kucultme_tam_cozmeyle_gorsel_olarak_ayni(optimizer, buyuk_jpeg, monkeypatch):
+    monkeypatch.setattr(main_optimizer, "HIZLI_KUCULTME", True)
+    hizli, _, _ = _kucult(optimizer, buyuk_jpeg, (250, 200))
+    with Image.open(buyuk_jpeg) as img:
+        tam = img.resize((250, 200), Image.LANCZOS)
+
+    fark = np.abs(np.asarray(hizli, dtype=np.int16) - np.asarray(tam, dtype=np.int16))
+    assert fark.mean() < 3
+
+
+@pytest.mark.parametrize("boyut, beklenen", [((8000, 6000), 2), ((2400, 1800), 1), ((20000, 16000), 8)])
+def test_cozme_olcegi_hedefin_payindan_kucuk_birakmaz(optimizer, boyut, beklenen):
+    olcek = optimizer.cozme_olcegi(*boyut)
+    assert olcek == beklenen
+    assert min(boyut) // olcek >= main_optimizer.STANDART_KISA_KENAR * main_optimizer.KUCULTME_PAYI or olcek == 1
@@ -0,0 +1,65 @@
+import os
+
+import pytest
+
+import hizli_tarayici
+
+
+@pytest.fixture
+def agac(tmp_path):
+    """kok / 60X120 / {A, B, .gizli, __MACOSX, kopya} / MAT / görseller"""
+    for urun in ("A", "B", ".gizli", "__MACOSX", "kopya"):
+        klasor = tmp_path / "60X120" / urun / "MAT"
+        klasor.mkdir(parents=True)
+        (klasor / "1.jpg").write_bytes(b"x" * 10)
+        (klasor / "2.JPEG").write_bytes(b"x" * 5)
+        (klasor / "not.txt").write_bytes(b"x")
+    return tmp_path
+
+
+def _gez(kok, **kwargs):
+    return {os.path.relpath(klasor, kok): (kayit, derinlik)
+            for klasor, kayit, _, derinlik in hizli_tarayici.agaci_gez(kok, isci_sayisi=2, **kwargs)}
+
+
+def test_girilsin_mi():
+    assert hizli_tarayici.girilsin_mi("A")
+    assert not hizli_tarayici.girilsin_mi("$RECYCLE.BIN")
+    assert not hizli_tarayici.girilsin_mi(".gizli")
+    assert hizli_tarayici.girilsin_mi(".gizli", gizli_atla=False)
+    budama = lambda ad, derinlik: derinlik == 2 and ad == "kopya"
+    assert not hizli_tarayici.girilsin_mi("kopya", 2, budama=budama)
+    assert hizli_tarayici.girilsin_mi("kopya", 3, budama=budama)
+
+
+def test_gizli_ve_sistem_klasorlerine_girilmez(agac):
+    sonuc = _gez(agac)
+    assert set(sonuc) == {".", "60X120"} | {os.path.join("60X120", u, *s) for u in ("A", "B", "kopya") for s in ((), ("MAT",))}
+
+    kayit, derinlik = sonuc[os.path.join("60X120", "A", "MAT")]
+    assert derinlik == 3
+    assert kayit["gorsel_sayisi"] == 2 and kayit["toplam_bytes"] == 15
+    assert sorted(ad for ad, _ in kayit["gorseller"]) == ["1.jpg", "2.JPEG"]
+
+
+def test_budama_dala_hic_girmez(agac):
+    sonuc = _gez(agac, budama=lambda ad, derinlik: derinlik == 2 and ad == "kopya")
+    assert not any(yol.startswith(os.path.join("60X120", "kopya")) for yol in sonuc)
+
+
+def test_max_derinlikte_listelenir_ama_inilmez(agac):
+    sonuc = _gez(agac, max_derinlik=2)
+    assert max(derinlik for _, derinlik in sonuc.values()) == 2
+    kayit, _ = sonuc[os.path.join("60X120", "A")]
+    assert kayit["alt_klasorler"] == ["MAT"]
+
+
+def test_onceki_kayit_degismeyen_klasoru_listelemez(agac):
+    ilk = {klasor: kayit for klasor, kayit, _, _ in hizli_tarayici.agaci_gez(agac)}
+    yeni = agac / "60X120" / "A" / "MAT" / "3.jpg"
+    yeni.write_bytes(b"x")
+    os.utime(yeni.parent, ns=(0, 1))  # mtime çözünürlüğünden bağımsız olarak değişsin
+
+    onbellekten = {klasor: onb for klasor, _, onb, _ in hizli_tarayici.agaci_gez(agac, onceki=ilk)}
+    assert not onbellekten[str(yeni.parent)]
+    assert all(onb for klasor, onb in onbellekten.items() if klasor != str(yeni.parent))
@@ -0,0 +1,83 @@
+import os
+
+import pytest
+
+import icerik_indeksi
+from icerik_indeksi import IcerikIndeksi, KISMI_OZET_BOYUTU
+
+
+@pytest.fixture
+def sayac(monkeypatch):
+    """Hangi dosyalar için kısmi / tam özet hesaplandığını kaydeder."""
+    cagrilar = {"kismi": [], "tam": []}
+    kismi, tam = icerik_indeksi.kismi_ozet, icerik_indeksi.tam_ozet
+
+    def kismi_say(yol):
+        cagrilar["kismi"].append(os.path.basename(yol))
+        return kismi(yol)
+
+    def tam_say(yol):
+        cagrilar["tam"].append(os.path.basename(yol))
+        return tam(yol)
+
+    monkeypatch.setattr(icerik_indeksi, "kismi_ozet", kismi_say)
+    monkeypatch.setattr(icerik_indeksi, "tam_ozet", tam_say)
+    return cagrilar
+
+
+def _dosyalar(tmp_path, icerikler):
+    yollar = {}
+    for ad, veri in icerikler.items():
+        yollar[ad] = tmp_path / ad
+        yollar[ad].write_bytes(veri)
+    return yollar
+
+
+def test_boyut_kismi_tam_ozet_zinciri(tmp_path, sayac):
+    buyuk = 3 * KISMI_OZET_BOYUTU
+    temel = os.urandom(buyuk)
+    orta_farkli = bytearray(temel)
+    orta_farkli[buyuk // 2] ^= 0xFF
+    bas_farkli = bytearray(temel)
+    bas_farkli[0] ^= 0xFF
+    yollar = _dosyalar(tmp_path, {
+        "a.jpg": temel,
+        "a_kopya.jpg": temel,
+        "orta_farkli.jpg": bytes(orta_farkli),   # kısmi özet aynı, tam özet farklı
+        "bas_farkli.jpg": bytes(bas_farkli),     # kısmi özette elenir
+        "tekil_boyut.jpg": temel[:-1],           # boyutta elenir
+    })
+    indeks = IcerikIndeksi(isci_sayisi=1)
+    for yol in yollar.values():
+        indeks.ekle(yol)
+
+    gruplar = indeks.mukerrer_gruplar()
+
+    assert [(boyut, yollar_) for _, boyut, yollar_ in gruplar] == \
+        [(buyuk, [str(yollar["a.jpg"]), str(yollar["a_kopya.jpg"])])]
+    assert "tekil_boyut.jpg" not in sayac["kismi"]
+    assert sorted(sayac["tam"]) == ["a.jpg", "a_kopya.jpg", "orta_farkli.jpg"]
+    assert indeks.icerik_anahtari(yollar["a_kopya.jpg"]) == indeks.icerik_anahtari(yollar["a.jpg"])
+    assert indeks.icerik_anahtari(yollar["orta_farkli.jpg"]) is None
+    assert indeks.ozet() == (1, 1, round(buyuk / (1024 * 1024), 2))
+
+
+def test_kucuk_dosyada_tam_ozet_okunmaz(tmp_path, sayac):
+    yollar = _dosyalar(tmp_path, {"a.jpg": b"x" * 100, "b.jpg": b"x" * 100, "c.jpg": b"y" * 100})
+    indeks = IcerikIndeksi(isci_sayisi=1)
+    for yol in yollar.values():
+        indeks.ekle(yol)
+
+    gruplar = indeks.mukerrer_gruplar()
+
+    assert [g[2] for g in gruplar] == [[str(yollar["a.jpg"]), str(yollar["b.jpg"])]]
+    assert sayac["tam"] == []
+
+
+def test_bos_ve_okunamayan_dosyalar_atlanir(tmp_path):
+    bos = tmp_path / "bos.jpg"
+    bos.write_bytes(b"")
+    indeks = IcerikIndeksi(isci_sayisi=1)
+    indeks.ekle(bos)
+    indeks.ekle(tmp_path / "yok.jpg")
+    assert indeks.mukerrer_gruplar() == []
@@ -0,0 +1,68 @@
+import queue
+import threading
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+import main_optimizer
+from conftest import jpeg_yaz
+
+
+@pytest.fixture
+def optimizer(tmp_path, monkeypatch):
+    monkeypatch.setattr(main_optimizer, "TUREVLER", [])
+    monkeypatch.setattr(main_optimizer, "KOPYA_HARDLINK", False)
+    return main_optimizer.StokOptimizeEdici(tmp_path / "envanter.xlsx")
+
+
+def _bozuk_is():
+    is_ = Future()
+    is_.set_exception(BrokenProcessPool("işçi süreç öldü"))
+    return is_
+
+
+def test_bozuk_havuzda_kopya_uretilmez(optimizer, tmp_path):
+    kaynak = tmp_path / "a.jpg"
+    kaynak.write_bytes(b"\xff\xd8" + b"x" * 64)
+    (tmp_path / "cikti").mkdir()
+    ilk, ikinci = tmp_path / "cikti" / "ilk.jpg", tmp_path / "cikti" / "ikinci.jpg"
+    parti = [
+        ((kaynak, ilk), "kopya", None, None, {"kaynak_bayt": 66}),
+        ((kaynak, ikinci), "islem", kaynak.read_bytes(), _bozuk_is(), {"kaynak_bayt": 66}),
+    ]
+
+    sonuclar = optimizer._parti_yaz(parti)
+    sonuc, bilgi = next(sonuclar)
+    assert sonuc and ilk.exists()
+    with pytest.raises(BrokenProcessPool):
+        next(sonuclar)
+    assert not ikinci.exists()
+
+
+def test_havuz_gonderiminde_bozulma_kopyalanmaz(optimizer, tmp_path):
+    kaynak = tmp_path / "a.jpg"
+    kaynak.write_bytes(b"\xff\xd8" + b"x" * 64)
+    (tmp_path / "cikti").mkdir()
+    hedef = tmp_path / "cikti" / "a.jpg"
+    parti = [((kaynak, hedef), "hata", None, BrokenProcessPool("havuz bozuk"), {"kaynak_bayt": 66})]
+
+    with pytest.raises(BrokenProcessPool):
+        list(optimizer._parti_yaz(parti))
+    assert not hedef.exists()
+
+
+def test_okuyucu_plandaki_basliklari_tekrar_okumaz(optimizer, tmp_path, monkeypatch):
+    kaynak = tmp_path / "kucuk.jpg"
+    jpeg_yaz(kaynak, boyut=(200, 150))
+    basliklar = {kaynak: main_optimizer.jpeg_araclari.jpeg_baslik_oku(kaynak)}
+
+    def okunmamali(yol):
+        raise AssertionError(f"Başlık tekrar okundu: {yol}")
+
+    monkeypatch.setattr(main_optimizer.jpeg_araclari, "jpeg_baslik_oku", okunmamali)
+    kuyruk = queue.Queue()
+    optimizer._okuyucu([(kaynak, tmp_path / "cikti.jpg")], kuyruk, None, threading.Event(), basliklar=basliklar)
+
+    durum, _, hata, _ = kuyruk.get_nowait()
+    assert durum == "kopya", hata
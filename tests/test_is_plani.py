@@ -0,0 +1,51 @@
+import itertools
+import random
+
+import pytest
+
+import is_plani
+
+
+def _en_iyi_makespan(maliyetler, isci_sayisi):
+    """Küçük girdiler için tüm atamaları deneyerek en kısa toplam süre."""
+    en_iyi = float("inf")
+    for atama in itertools.product(range(isci_sayisi), repeat=len(maliyetler)):
+        yuk = [0.0] * isci_sayisi
+        for maliyet, isci in zip(maliyetler, atama):
+            yuk[isci] += maliyet
+        en_iyi = min(en_iyi, max(yuk))
+    return en_iyi
+
+
+def test_dagit_ilk_bosalan_isciye_verir():
+    atamalar, makespan = is_plani.dagit([7, 6, 5, 4, 3], 2)
+    assert atamalar == [(0, 0.0), (1, 0.0), (1, 6.0), (0, 7.0), (0, 11.0)]
+    assert makespan == 14.0
+
+
+def test_lpt_sirasi_kisa_isleri_sona_birakir():
+    # Uzun iş sonda verilirse tek işçide kuyruk oluşur; büyükten küçüğe sıra bunu önler
+    maliyetler = [1, 1, 1, 1, 4]
+    assert is_plani.dagit(maliyetler, 2)[1] == 6
+    assert is_plani.dagit(sorted(maliyetler, reverse=True), 2)[1] == 4
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_lpt_makespan_sinirinda(seed):
+    rng = random.Random(seed)
+    isci_sayisi = rng.randint(2, 3)
+    maliyetler = sorted((rng.uniform(0.1, 10) for _ in range(rng.randint(1, 7))), reverse=True)
+
+    atamalar, makespan = is_plani.dagit(maliyetler, isci_sayisi)
+    en_iyi = _en_iyi_makespan(maliyetler, isci_sayisi)
+
+    assert len(atamalar) == len(maliyetler)
+    assert makespan >= en_iyi - 1e-9
+    # Graham sınırı: LPT <= (4/3 - 1/(3m)) * OPT
+    assert makespan <= (4 / 3 - 1 / (3 * isci_sayisi)) * en_iyi + 1e-9
+
+
+def test_dagit_bos_ve_tek_isci():
+    assert is_plani.dagit([], 4) == ([], 0.0)
+    atamalar, makespan = is_plani.dagit([2, 3], 0)
+    assert atamalar == [(0, 0.0), (0, 2.0)] and makespan == 5.0
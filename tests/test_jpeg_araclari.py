@@ -0,0 +1,87 @@
+import io
+
+import numpy as np
+import pytest
+from PIL import Image
+
+import jpeg_araclari
+
+
+@pytest.fixture(scope="module")
+def jpeg_baytlari():
+    rng = np.random.default_rng(1)
+    img = Image.fromarray(rng.integers(0, 256, (120, 200, 3), dtype=np.uint8))
+    tampon = io.BytesIO()
+    img.save(tampon, "JPEG", quality=90)
+    return tampon.getvalue()
+
+
+def _yaz(tmp_path, ad, veri):
+    yol = tmp_path / ad
+    yol.write_bytes(veri)
+    return str(yol)
+
+
+def test_saglam_jpeg(tmp_path, jpeg_baytlari):
+    yol = _yaz(tmp_path, "saglam.jpg", jpeg_baytlari)
+    assert jpeg_araclari.jpeg_baslik_oku(yol) == (200, 120, 3)
+    assert jpeg_araclari.jpeg_yapi_kontrolu(jpeg_baytlari) == ("saglam", "")
+    assert jpeg_araclari.jpeg_butunluk_kontrolu(yol)[1] == "saglam"
+
+
+def test_goruntu_verisinde_kesik_dosya_bozuk(tmp_path, jpeg_baytlari):
+    kesik = jpeg_baytlari[:len(jpeg_baytlari) // 2]
+    yol = _yaz(tmp_path, "kesik.jpg", kesik)
+
+    # Başlık sağlam: boyutlar okunur, ama yapı EOI'siz (şüpheli) ve tam çözme başarısız
+    assert jpeg_araclari.jpeg_baslik_oku(yol) == (200, 120, 3)
+    assert jpeg_araclari.jpeg_yapi_kontrolu(kesik)[0] == "supheli"
+    assert jpeg_araclari.jpeg_butunluk_kontrolu(yol)[1] == "bozuk"
+
+
+def test_baslikta_kesik_dosya_bozuk(tmp_path, jpeg_baytlari):
+    kesik = jpeg_baytlari[:100]
+    yol = _yaz(tmp_path, "kesik.jpg", kesik)
+    assert jpeg_araclari.jpeg_baslik_oku(yol) is None
+    assert jpeg_araclari.jpeg_yapi_kontrolu(kesik)[0] == "bozuk"
+    assert jpeg_araclari.jpeg_butunluk_kontrolu(yol)[1] == "bozuk"
+
+
+def test_sonu_sifirla_dolu_yarim_kopya_bozuk(jpeg_baytlari):
+    yarim = jpeg_baytlari[:len(jpeg_baytlari) // 2]
+    yarim += bytes(len(jpeg_baytlari) - len(yarim) + jpeg_araclari.SIFIR_BLOK_BOYUTU)
+    assert jpeg_araclari.jpeg_yapi_kontrolu(yarim)[0] == "bozuk"
+
+
+@pytest.mark.parametrize("veri", [b"", b"\xff\xd8"])
+def test_cok_kisa_dosya_bozuk(veri):
+    assert jpeg_araclari.jpeg_yapi_kontrolu(veri)[0] == "bozuk"
+
+
+def test_eoi_sonrasi_veri_uyari(jpeg_baytlari):
+    veri = jpeg_baytlari + b"\x01" * (jpeg_araclari.EOI_SONRASI_TOLERANS + 1)
+    assert jpeg_araclari.jpeg_yapi_kontrolu(veri)[0] == "uyari"
+
+
+def test_jpeg_olmayan_dosya(tmp_path):
+    yol = _yaz(tmp_path, "resim.jpg", b"\x89PNG\r\n\x1a\n" + b"\x00" * 32)
+    assert jpeg_araclari.jpeg_baslik_oku(yol) is None
+    assert jpeg_araclari.jpeg_yapi_kontrolu(b"\x89PNG\r\n\x1a\n")[0] == "supheli"
+
+
+@pytest.mark.parametrize("kontrol", [False, True])
+def test_optimizer_kesik_kaynak_sadece_kontrol_acikken_reddedilir(tmp_path, jpeg_baytlari, monkeypatch, kontrol):
+    import main_optimizer
+
+    monkeypatch.setattr(main_optimizer, "BOZUK_KAYNAK_KONTROLU", kontrol)
+    monkeypatch.setattr(main_optimizer, "KALITE_MODELI_DOSYASI", str(tmp_path / "model.json"))
+    monkeypatch.setattr(main_optimizer, "TUREVLER", [])
+    optimizer = main_optimizer.StokOptimizeEdici(tmp_path / "envanter.xlsx")
+    kesik = jpeg_baytlari[: len(jpeg_baytlari) // 2]
+
+    if kontrol:
+        with pytest.raises(jpeg_araclari.BozukGorselHatasi):
+            optimizer.optimize_veri(kesik)
+    else:
+        _, bilgi = optimizer.optimize_veri(kesik)
+        assert bilgi["yol"] != "bozuk_kaynak"
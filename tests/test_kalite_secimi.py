@@ -0,0 +1,89 @@
+import io
+
+import numpy as np
+import pytest
+from PIL import Image, ImageFile
+
+import main_optimizer
+
+
+@pytest.fixture
+def optimizer(tmp_path, monkeypatch):
+    monkeypatch.setattr(main_optimizer, "KALITE_MODELI_DOSYASI", str(tmp_path / "model.json"))
+    monkeypatch.setattr(main_optimizer, "TUREVLER", [])
+    return main_optimizer.StokOptimizeEdici(tmp_path / "envanter.xlsx")
+
+
+@pytest.fixture(scope="module")
+def yuksek_bpp_jpeg():
+    """Sınıra yakın (4.0 MB sınır, ~4.3 MB), piksel başına ~2.9 bayt: keep modunda Pillow tamponunu aşar."""
+    rng = np.random.default_rng(0)
+    img = Image.fromarray(rng.integers(0, 256, (1500, 1000, 3), dtype=np.uint8))
+    tampon = io.BytesIO()
+    img.save(tampon, "JPEG", quality=97, subsampling=0)
+    return tampon.getvalue()
+
+
+def test_koruyan_yol_yuksek_bpp_kaynakta_kalite_aramasina_duser(optimizer, yuksek_bpp_jpeg, monkeypatch):
+    monkeypatch.setattr(main_optimizer, "HEDEF_MAX_BOYUT_MB", 4.0)
+    assert 4.0 < len(yuksek_bpp_jpeg) / (1024 * 1024) < 4.0 * main_optimizer.KORUYAN_YOL_AZAMI_ORAN
+
+    onceki_blok = ImageFile.MAXBLOCK
+    ciktilar, bilgi = optimizer.optimize_veri(yuksek_bpp_jpeg)
+
+    assert ImageFile.MAXBLOCK == onceki_blok
+    assert bilgi["yol"] in ("kalite_korundu", "yeniden_sikistirma")
+    veri = ciktilar[main_optimizer.ANA_CIKTI]
+    assert veri is not None and len(veri) < 4.0 * 1024 * 1024
+
+
+def test_koruyan_yol_kodlayici_hatasinda_kalite_aramasina_duser(optimizer, yuksek_bpp_jpeg, monkeypatch):
+    monkeypatch.setattr(main_optimizer, "HEDEF_MAX_BOYUT_MB", 4.0)
+    jpeg_kodla = optimizer.jpeg_kodla
+
+    def keep_bozuk(img, kalite, save_kwargs):
+        if kalite == "keep":
+            raise Exception("Format Yazma Hatası")
+        return jpeg_kodla(img, kalite, save_kwargs)
+
+    monkeypatch.setattr(optimizer, "jpeg_kodla", keep_bozuk)
+    ciktilar, bilgi = optimizer.optimize_veri(yuksek_bpp_jpeg)
+
+    assert bilgi["yol"] == "yeniden_sikistirma"
+    assert len(ciktilar[main_optimizer.ANA_CIKTI]) < 4.0 * 1024 * 1024
+    assert bilgi["deneme"] == len(bilgi["gozlemler"]) + 1
+
+
+def test_koruyarak_kodla_sinira_sigmazsa_none(optimizer, yuksek_bpp_jpeg):
+    with Image.open(io.BytesIO(yuksek_bpp_jpeg)) as img:
+        assert optimizer.koruyarak_kodla(img, {}, max_mb=1.0) is None
+        veri = optimizer.koruyarak_kodla(img, {})
+    assert veri is not None and veri[:2] == b"\xff\xd8"
+
+
+def _dogrusal_kalite(boyut, limit):
+    """Eski döngü: BASLANGIC_KALITE'den aşağı, sınıra sığan ilk kalite (yoksa None)."""
+    for kalite in range(main_optimizer.BASLANGIC_KALITE, main_optimizer.MIN_KALITE - 1,
+                        -main_optimizer.KALITE_AZALTMA_ADIMI):
+        if boyut(kalite) < limit:
+            return kalite
+    return None
+
+
+@pytest.mark.parametrize("ilk_kalite", [None, 95, 90, 80, 70, 60, 42])
+@pytest.mark.parametrize("esik", range(50, 101, 5))
+def test_kaliteyi_bul_dogrusal_donguyle_ayni(optimizer, monkeypatch, esik, ilk_kalite):
+    # Monoton boyut fonksiyonu: kalite eşiğin üstündeyse sınırı aşar
+    limit = 1000
+    boyut = lambda kalite: 100 + kalite if kalite <= esik else 2000 + kalite
+    monkeypatch.setattr(optimizer, "kodla", lambda img, kalite, save_kwargs, bicim="jpeg": b"x" * boyut(kalite))
+
+    veri, kalite, gozlemler = optimizer.kaliteyi_bul(None, {}, ilk_kalite, max_mb=limit / (1024 * 1024))
+
+    beklenen = _dogrusal_kalite(boyut, limit)
+    assert kalite == beklenen
+    assert (veri is None) == (beklenen is None)
+    if veri is not None:
+        assert len(veri) == boyut(beklenen)
+    # Tahminsiz: 95 + kalan 7 adayda ikili arama (en fazla 3); isabetsiz tahminde komşu denemesi +1
+    assert len(gozlemler) <= (4 if ilk_kalite is None else 5)
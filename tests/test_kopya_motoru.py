@@ -0,0 +1,154 @@
+import builtins
+import errno
+import os
+
+import pytest
+
+import kopya_motoru
+
+
+class _KisaYazan:
+    """Tamponsuz dosyanın write() çağrısında en fazla `sinir` bayt yazmasını taklit eder."""
+    def __init__(self, dosya, sinir):
+        self._dosya = dosya
+        self._sinir = sinir
+
+    def write(self, veri):
+        return self._dosya.write(veri[:self._sinir])
+
+    def __getattr__(self, ad):
+        return getattr(self._dosya, ad)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *hata):
+        self._dosya.close()
+
+
+@pytest.fixture
+def kaynak(tmp_path):
+    yol = tmp_path / "kaynak.jpg"
+    yol.write_bytes(os.urandom(100_000))
+    return yol
+
+
+def _kisa_yazan_open(monkeypatch, sinir):
+    def sahte_open(yol, kip="r", *args, **kwargs):
+        dosya = builtins.open(yol, kip, *args, **kwargs)
+        return _KisaYazan(dosya, sinir) if "w" in kip else dosya
+    monkeypatch.setattr(kopya_motoru, "open", sahte_open, raising=False)
+
+
+def test_tampon_kopyasi_kismi_yazmalari_tamamlar(kaynak, tmp_path, monkeypatch):
+    monkeypatch.setattr(kopya_motoru, "TAMPON_BOYUTU", 16 * 1024)
+    _kisa_yazan_open(monkeypatch, 1000)
+    hedef = tmp_path / "hedef.jpg"
+
+    kopya_motoru._tamponla_kopyala(str(kaynak), str(hedef))
+
+    assert hedef.read_bytes() == kaynak.read_bytes()
+
+
+def test_tampon_kopyasi_yazamazsa_hedefi_siler(kaynak, tmp_path, monkeypatch):
+    _kisa_yazan_open(monkeypatch, 0)
+    hedef = tmp_path / "hedef.jpg"
+
+    with pytest.raises(OSError):
+        kopya_motoru._tamponla_kopyala(str(kaynak), str(hedef))
+    assert not hedef.exists()
+
+
+@pytest.fixture
+def yontemler(monkeypatch):
+    """Kopyalama yöntemlerini sırayla çağrıldığı kaydedilen sahte yöntemlerle değiştirir."""
+    monkeypatch.setattr(kopya_motoru, "_desteksiz", set())
+    cagrilar = []
+
+    def kur(*davranislar):
+        def yontem(ad, davranis):
+            def calis(kaynak, hedef):
+                cagrilar.append(ad)
+                if davranis is not None:
+                    raise davranis
+                with builtins.open(kaynak, "rb") as k, builtins.open(hedef, "wb") as h:
+                    h.write(k.read())
+            return calis
+        monkeypatch.setattr(kopya_motoru, "_YONTEMLER", [(ad, yontem(ad, d)) for ad, d in davranislar])
+        return cagrilar
+    return kur
+
+
+def test_desteksiz_yontem_atlanir_ve_hatirlanir(kaynak, tmp_path, yontemler):
+    cagrilar = yontemler(("birinci", OSError(errno.EXDEV, "desteksiz")), ("ikinci", None))
+
+    assert kopya_motoru.kopyala(kaynak, tmp_path / "h1.jpg") == "ikinci"
+    assert kopya_motoru.kopyala(kaynak, tmp_path / "h2.jpg") == "ikinci"
+    assert cagrilar == ["birinci", "ikinci", "ikinci"]
+    assert (tmp_path / "h2.jpg").read_bytes() == kaynak.read_bytes()
+
+
+def test_sonraki_yontem_diski_desteksiz_saymaz(kaynak, tmp_path, yontemler):
+    cagrilar = yontemler(("birinci", kopya_motoru._SonrakiYontem()), ("ikinci", None))
+
+    kopya_motoru.kopyala(kaynak, tmp_path / "h1.jpg")
+    kopya_motoru.kopyala(kaynak, tmp_path / "h2.jpg")
+    assert cagrilar == ["birinci", "ikinci", "birinci", "ikinci"]
+
+
+def test_hic_yontem_olmazsa_tampon(kaynak, tmp_path, yontemler):
+    yontemler(("birinci", OSError(errno.ENOSYS, "yok")))
+    hedef = tmp_path / "hedef.jpg"
+
+    assert kopya_motoru.kopyala(kaynak, hedef) == "tampon"
+    assert hedef.read_bytes() == kaynak.read_bytes()
+    assert os.stat(hedef).st_mtime_ns == os.stat(kaynak).st_mtime_ns
+
+
+def test_gercek_hata_iletilir(kaynak, tmp_path, yontemler):
+    cagrilar = yontemler(("birinci", OSError(errno.ENOSPC, "disk dolu")), ("ikinci", None))
+    with pytest.raises(OSError) as hata:
+        kopya_motoru.kopyala(kaynak, tmp_path / "hedef.jpg")
+    assert hata.value.errno == errno.ENOSPC
+    assert cagrilar == ["birinci"]
+
+
+def test_baglanti_hardlink_once_denenir(kaynak, tmp_path, yontemler):
+    cagrilar = yontemler(("birinci", None))
+    hedef = tmp_path / "hedef.jpg"
+
+    assert kopya_motoru.kopyala(kaynak, hedef, baglanti=True) == "hardlink"
+    assert os.path.samefile(kaynak, hedef)
+    assert cagrilar == []
+
+    # Hedef varsa üzerine yazılmaz, önce silinir: bağlı kaynak değişmez
+    assert kopya_motoru.kopyala(kaynak, hedef) == "birinci"
+    assert not os.path.samefile(kaynak, hedef)
+
+
+def test_basarisiz_kopya_onceki_hedefi_korur(kaynak, tmp_path, yontemler):
+    hedef = tmp_path / "hedef.jpg"
+    hedef.write_bytes(b"onceki iyi cikti")
+    yontemler(("birinci", OSError(errno.ENOSPC, "disk dolu")))
+
+    with pytest.raises(OSError):
+        kopya_motoru.kopyala(kaynak, hedef)
+
+    assert hedef.read_bytes() == b"onceki iyi cikti"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["hedef.jpg", "kaynak.jpg"]
+
+
+def test_kaynaga_bagli_hedefe_kopya_kaynagi_bozmaz(kaynak, tmp_path, yontemler):
+    yontemler(("birinci", None))
+    hedef = tmp_path / "hedef.jpg"
+    onceki = kaynak.read_bytes()
+    assert kopya_motoru.kopyala(kaynak, hedef, baglanti=True) == "hardlink"
+
+    # Aynı dosyaya tekrar bağlanmak geçici dosya bırakmaz
+    assert kopya_motoru.kopyala(kaynak, hedef, baglanti=True) == "hardlink"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["hedef.jpg", "kaynak.jpg"]
+
+    # Bağlı hedefe normal kopya: yeni dosya yerine taşınır, kaynağın içeriği yazılmaz
+    assert kopya_motoru.kopyala(kaynak, hedef) == "birinci"
+    hedef.write_bytes(b"duzenlendi")
+    assert kaynak.read_bytes() == onceki
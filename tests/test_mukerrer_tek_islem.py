@@ -0,0 +1,38 @@
+import shutil
+
+import icerik_indeksi
+import main_optimizer
+from conftest import envanter_yaz, jpeg_yaz
+
+
+def _arsiv(kok):
+    """İki üründe birebir aynı bir görsel + birer tekil görsel."""
+    a = kok / "kaynak" / "60X120" / "A" / "MAT"
+    b = kok / "kaynak" / "60X120" / "B" / "MAT"
+    jpeg_yaz(a / "ortak.jpg", (1400, 1000), seed=1)
+    jpeg_yaz(a / "tekil.jpg", (1400, 1000), seed=2)
+    b.mkdir(parents=True)
+    shutil.copy(a / "ortak.jpg", b / "ortak.jpg")
+    jpeg_yaz(b / "diger.jpg", (1400, 1000), seed=3)
+    return envanter_yaz(kok / "envanter.xlsx", [a, b])
+
+
+def test_mukerrer_bir_kez_islenir_ve_cikti_kopyalanir(optimizer_ortami):
+    envanter = _arsiv(optimizer_ortami)
+    main_optimizer.StokOptimizeEdici(envanter).baslat()
+
+    cikti = optimizer_ortami / "cikti" / "60X120"
+    assert (cikti / "A" / "MAT" / "ortak.jpg").read_bytes() == (cikti / "B" / "MAT" / "ortak.jpg").read_bytes()
+
+
+def test_manifestin_atladigi_dosyalar_ozetlenmez(optimizer_ortami, monkeypatch):
+    monkeypatch.setattr(main_optimizer, "MANIFEST_KULLAN", True)
+    envanter = _arsiv(optimizer_ortami)
+    main_optimizer.StokOptimizeEdici(envanter).baslat()
+
+    ozetlenen = []
+    kismi = icerik_indeksi.kismi_ozet
+    monkeypatch.setattr(icerik_indeksi, "kismi_ozet", lambda yol: ozetlenen.append(yol) or kismi(yol))
+    main_optimizer.StokOptimizeEdici(envanter).baslat()
+
+    assert ozetlenen == []
@@ -0,0 +1,108 @@
+import os
+
+import pytest
+
+import optimizasyon_manifesti
+from optimizasyon_manifesti import OptimizasyonManifesti
+
+AYARLAR = {"HEDEF_MAX_BOYUT_MB": 4.0, "MIN_KALITE": 60}
+
+
+@pytest.fixture
+def dosyalar(tmp_path):
+    kaynak = tmp_path / "kaynak.jpg"
+    hedef = tmp_path / "cikti" / "kaynak.jpg"
+    kaynak.write_bytes(b"k" * 100)
+    hedef.parent.mkdir()
+    hedef.write_bytes(b"h" * 40)
+    return tmp_path, kaynak, hedef
+
+
+def _manifest(klasor, ayarlar=AYARLAR):
+    return OptimizasyonManifesti(klasor, ayarlar)
+
+
+@pytest.mark.parametrize("yol", sorted(optimizasyon_manifesti.GUNCEL_YOLLAR))
+def test_basarili_yollar_guncel(dosyalar, yol):
+    klasor, kaynak, hedef = dosyalar
+    m = _manifest(klasor)
+    m.kaydet(kaynak, hedef, True, yol)
+    m.kapat()
+    assert _manifest(klasor).guncel_mi(kaynak, hedef)
+
+
+@pytest.mark.parametrize("yol", ["hata_kopya", "hedefe_inilemedi", None])
+def test_yedek_sonuclar_yeniden_denenir(dosyalar, yol):
+    klasor, kaynak, hedef = dosyalar
+    m = _manifest(klasor)
+    m.kaydet(kaynak, hedef, True, yol)
+    m.kapat()
+    assert not _manifest(klasor).guncel_mi(kaynak, hedef)
+
+
+def test_yol_kaydedilir(dosyalar):
+    klasor, kaynak, hedef = dosyalar
+    m = _manifest(klasor)
+    m.kaydet(kaynak, hedef, True, "kalite_korundu")
+    m.kapat()
+    assert _manifest(klasor).kayitlar[str(kaynak)]["yol"] == "kalite_korundu"
+
+
+@pytest.fixture
+def kayitli(dosyalar):
+    klasor, kaynak, hedef = dosyalar
+    m = _manifest(klasor)
+    m.kaydet(kaynak, hedef, True, "yeniden_sikistirma")
+    m.kapat()
+    return klasor, kaynak, hedef
+
+
+def test_kaynak_boyutu_degisince_gecersiz(kayitli):
+    klasor, kaynak, hedef = kayitli
+    st = os.stat(kaynak)
+    kaynak.write_bytes(b"k" * 101)
+    os.utime(kaynak, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert not _manifest(klasor).guncel_mi(kaynak, hedef)
+
+
+def test_kaynak_mtime_degisince_gecersiz(kayitli):
+    klasor, kaynak, hedef = kayitli
+    st = os.stat(kaynak)
+    os.utime(kaynak, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert not _manifest(klasor).guncel_mi(kaynak, hedef)
+
+
+def test_ayar_degisince_gecersiz(kayitli):
+    klasor, kaynak, hedef = kayitli
+    assert not _manifest(klasor, dict(AYARLAR, MIN_KALITE=70)).guncel_mi(kaynak, hedef)
+
+
+def test_cikti_degisince_veya_silinince_gecersiz(kayitli):
+    klasor, kaynak, hedef = kayitli
+    hedef.write_bytes(b"h" * 41)
+    assert not _manifest(klasor).guncel_mi(kaynak, hedef)
+    hedef.unlink()
+    assert not _manifest(klasor).guncel_mi(kaynak, hedef)
+
+
+def test_farkli_hedef_gecersiz(kayitli):
+    klasor, kaynak, hedef = kayitli
+    baska = hedef.with_name("baska.jpg")
+    baska.write_bytes(hedef.read_bytes())
+    assert not _manifest(klasor).guncel_mi(kaynak, baska)
+
+
+def test_basarisiz_sonuc_gecersiz(dosyalar):
+    klasor, kaynak, hedef = dosyalar
+    m = _manifest(klasor)
+    m.kaydet(kaynak, hedef, False, "hata")
+    m.kapat()
+    assert not _manifest(klasor).guncel_mi(kaynak, hedef)
+
+
+def test_son_kayit_oncekini_gecersiz_kilar(kayitli):
+    klasor, kaynak, hedef = kayitli
+    m = _manifest(klasor)
+    m.kaydet(kaynak, hedef, True, "hata_kopya")
+    m.kapat()
+    assert not _manifest(klasor).guncel_mi(kaynak, hedef)
@@ -0,0 +1,67 @@
+import csv
+import json
+
+import pytest
+
+import optimizasyon_metrikleri
+from optimizasyon_metrikleri import MetrikToplayici, yuzdelik
+
+
+@pytest.mark.parametrize("degerler, oran, beklenen", [
+    ([], 50, 0.0),
+    ([7.0], 95, 7.0),
+    ([1, 2, 3, 4], 50, 2),
+    ([1, 2, 3, 4, 5], 50, 3),
+    (list(range(1, 101)), 95, 95),
+    (list(range(1, 101)), 100, 100),
+    ([1, 2, 3], 0, 1),
+])
+def test_yuzdelik_en_yakin_sira(degerler, oran, beklenen):
+    assert yuzdelik(degerler, oran) == beklenen
+
+
+@pytest.fixture
+def toplayici(tmp_path):
+    return MetrikToplayici(str(tmp_path / "metrik.csv"), str(tmp_path / "ozet.json"))
+
+
+def test_ozet_gecikme_yuzdelikleri_ve_yollar(toplayici, tmp_path):
+    # 1..20 sn, karışık sırada
+    for sn in (13, 2, 20, 7, 1, 18, 5, 11, 16, 3, 9, 14, 6, 19, 4, 10, 17, 8, 12, 15):
+        toplayici.ekle({"yol": "kopya" if sn % 2 else "yeniden_sikistirma", "toplam_sn": float(sn),
+                        "kaynak_bayt": 1024 * 1024, "cikti_bayt": 512 * 1024})
+    toplayici.ekle({"yol": "hata"})  # Süresiz görsel gecikmeye katılmaz
+
+    ozet = toplayici.kapat()
+    assert ozet["gorsel_sayisi"] == 21
+    assert ozet["gecikme_p50_sn"] == 10.0
+    assert ozet["gecikme_p95_sn"] == 19.0
+    assert ozet["gecikme_max_sn"] == 20.0
+    assert ozet["yollar"] == {"kopya": 10, "yeniden_sikistirma": 10, "hata": 1}
+    assert ozet["kaynak_mb"] == 20.0 and ozet["cikti_mb"] == 10.0
+
+    assert json.loads((tmp_path / "ozet.json").read_text(encoding="utf-8")) == ozet
+    with open(tmp_path / "metrik.csv", newline="", encoding="utf-8") as f:
+        satirlar = list(csv.DictReader(f))
+    assert len(satirlar) == 21 and list(satirlar[0]) == optimizasyon_metrikleri.SUTUNLAR
+
+
+def test_bicim_bazinda_toplamlar(toplayici):
+    # bicimler: {biçim: [çıktı sayısı, bayt, kodlama süresi, piksel]}
+    toplayici.ekle({"yol": "yeniden_sikistirma",
+                    "bicimler": {"jpeg": [1, 1024 * 1024, 0.2, 2_000_000], "webp": [1, 256 * 1024, 0.5, 500_000]}})
+    toplayici.ekle({"yol": "yeniden_sikistirma", "bicimler": {"jpeg": [2, 1024 * 1024, 0.2, 2_000_000]}})
+
+    bicimler = toplayici.kapat()["bicimler"]
+    assert bicimler["jpeg"] == {"cikti_sayisi": 3, "cikti_mb": 2.0, "ort_kb": 682.7, "kb_megapiksel": 512.0,
+                                "kodlama_sn": 0.4, "ort_kodlama_ms": 133.3}
+    assert bicimler["webp"] == {"cikti_sayisi": 1, "cikti_mb": 0.25, "ort_kb": 256.0, "kb_megapiksel": 512.0,
+                                "kodlama_sn": 0.5, "ort_kodlama_ms": 500.0}
+
+
+def test_dev_gorsel_rss_olculemezse_sayilir_ama_yuzdelige_girmez(toplayici):
+    toplayici.ekle({"yol": "yeniden_sikistirma", "cozme_olcegi": 2, "tepe_rss_mb": 300.0})
+    toplayici.ekle({"yol": "yeniden_sikistirma", "cozme_olcegi": 4, "tepe_rss_mb": None})
+
+    dev = toplayici.kapat()["dev_gorsel"]
+    assert dev == {"adet": 2, "tepe_rss_mb_p50": 300.0, "tepe_rss_mb_max": 300.0}
@@ -0,0 +1,33 @@
+import main_optimizer
+from conftest import envanter_yaz, jpeg_yaz
+
+
+def _arsiv(kok):
+    """Yeniden sıkıştırılacak büyük görseller + aynen kopyalanacak küçük görseller."""
+    klasorler = []
+    for i, urun in enumerate("ABC"):
+        klasor = kok / "kaynak" / "60X120" / urun / "MAT"
+        jpeg_yaz(klasor / "buyuk.jpg", (1600, 1200), seed=i)
+        jpeg_yaz(klasor / "kucuk.jpg", (400, 300), seed=10 + i)
+        klasorler.append(klasor)
+    return envanter_yaz(kok / "envanter.xlsx", klasorler)
+
+
+def _calistir(kok, envanter, isci_sayisi, monkeypatch):
+    hedef = kok / f"cikti_{isci_sayisi}"
+    monkeypatch.setattr(main_optimizer, "HEDEF_ANA_KLASOR", hedef)
+    monkeypatch.setattr(main_optimizer, "ISCI_SAYISI", isci_sayisi)
+    main_optimizer.StokOptimizeEdici(envanter).baslat()
+    return {yol.relative_to(hedef): yol.read_bytes() for yol in hedef.rglob("*.jpg")}
+
+
+def test_paralel_ve_sirali_calisma_ayni_ciktiyi_uretir(optimizer_ortami, monkeypatch):
+    envanter = _arsiv(optimizer_ortami)
+
+    sirali = _calistir(optimizer_ortami, envanter, 1, monkeypatch)
+    paralel = _calistir(optimizer_ortami, envanter, 2, monkeypatch)
+
+    assert len(sirali) == 6
+    assert sirali.keys() == paralel.keys()
+    for yol in sirali:
+        assert sirali[yol] == paralel[yol], yol
@@ -0,0 +1,82 @@
+import threading
+
+import pytest
+
+import piksel_butcesi
+from piksel_butcesi import PikselButcesi
+
+
+def _arka_planda_al(butce, miktar, dur=None):
+    sonuc = []
+    is_parcacigi = threading.Thread(target=lambda: sonuc.append(butce.al(miktar, dur)), daemon=True)
+    is_parcacigi.start()
+    return is_parcacigi, sonuc
+
+
+def test_butce_elverdikce_birlikte_kabul_edilir():
+    butce = PikselButcesi(100)
+    assert butce.al(40) and butce.al(60)
+    assert butce.kullanilan == butce.en_yuksek == 100
+    assert butce.bekleme_sayisi == 0
+
+
+def test_yer_yoksa_birakilana_kadar_bekler():
+    butce = PikselButcesi(100)
+    butce.al(80)
+    is_parcacigi, sonuc = _arka_planda_al(butce, 30)
+    is_parcacigi.join(timeout=0.2)
+    assert is_parcacigi.is_alive() and sonuc == []
+
+    butce.birak(80)
+    is_parcacigi.join(timeout=2)
+    assert sonuc == [True]
+    assert butce.kullanilan == 30 and butce.bekleme_sayisi == 1
+
+
+def test_butceden_buyuk_gorsel_tek_basina_kabul_edilir():
+    butce = PikselButcesi(100)
+    assert butce.al(250)  # Boş bütçede sonsuza kadar beklemez
+    is_parcacigi, sonuc = _arka_planda_al(butce, 1)
+    is_parcacigi.join(timeout=0.2)
+    assert is_parcacigi.is_alive()  # Dev görsel bitene kadar başka iş alınmaz
+
+    butce.birak(250)
+    is_parcacigi.join(timeout=2)
+    assert sonuc == [True] and butce.en_yuksek == 250
+
+
+def test_dur_kurulunca_bekleme_birakilir():
+    butce = PikselButcesi(100)
+    butce.al(100)
+    dur = threading.Event()
+    is_parcacigi, sonuc = _arka_planda_al(butce, 10, dur)
+    dur.set()
+    is_parcacigi.join(timeout=2)
+    assert sonuc == [False] and butce.kullanilan == 100
+
+
+def test_birak_eksiye_dusmez():
+    butce = PikselButcesi(100)
+    butce.al(10)
+    butce.birak(50)
+    assert butce.kullanilan == 0
+
+
+def test_linux_disinda_tepe_rss_sifirlanmaz(monkeypatch):
+    monkeypatch.setattr(piksel_butcesi, "TEPE_SIFIRLANABILIR", False)
+
+    def acilmamali(*args, **kwargs):
+        raise AssertionError("/proc okunmamalı")
+
+    monkeypatch.setattr("builtins.open", acilmamali)
+    assert piksel_butcesi.tepe_rss_sifirla() is False
+    if piksel_butcesi.resource is None:
+        assert piksel_butcesi.tepe_rss_mb() is None
+    else:
+        assert piksel_butcesi.tepe_rss_mb() > 0
+
+
+@pytest.mark.skipif(not piksel_butcesi.TEPE_SIFIRLANABILIR, reason="Sadece Linux")
+def test_linuxta_tepe_rss_olculur():
+    piksel_butcesi.tepe_rss_sifirla()
+    assert piksel_butcesi.tepe_rss_mb() > 0
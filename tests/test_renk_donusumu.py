@@ -0,0 +1,58 @@
+import io
+
+import pytest
+from PIL import Image, ImageCms
+
+import cikti_kodlayicilari
+import main_optimizer
+from conftest import jpeg_yaz
+
+SRGB = ImageCms.ImageCmsProfile(ImageCms.createProfile("sRGB")).tobytes()
+
+
+@pytest.fixture
+def optimizer(tmp_path, monkeypatch):
+    monkeypatch.setattr(main_optimizer, "KALITE_MODELI_DOSYASI", str(tmp_path / "model.json"))
+    monkeypatch.setattr(main_optimizer, "KALITE_TAHMINI", False)
+    monkeypatch.setattr(main_optimizer, "TUREVLER", [])
+    return main_optimizer.StokOptimizeEdici(tmp_path / "envanter.xlsx")
+
+
+@pytest.mark.parametrize("boyut, aynen", [((1500, 1200), False), ((600, 400), True)])
+def test_cmyk_donusum_kapaliyken_cmyk_kalir(optimizer, tmp_path, monkeypatch, boyut, aynen):
+    monkeypatch.setattr(main_optimizer, "CMYK_SRGB_DONUSUMU", False)
+    veri = jpeg_yaz(tmp_path / "cmyk.jpg", boyut, mod="CMYK").read_bytes()
+
+    cikti = optimizer.optimize_veri(veri)[0][main_optimizer.ANA_CIKTI]
+    if aynen:
+        assert cikti is None  # Küçük görsel aynen kopyalanır
+    else:
+        assert Image.open(io.BytesIO(cikti)).mode == "CMYK"
+
+
+@pytest.mark.parametrize("boyut", [(1500, 1200), (600, 400)])
+def test_cmyk_donusum_acikken_srgb_yazilir(optimizer, tmp_path, monkeypatch, boyut):
+    monkeypatch.setattr(main_optimizer, "CMYK_SRGB_DONUSUMU", True)
+    yol = jpeg_yaz(tmp_path / "cmyk.jpg", boyut, mod="CMYK")
+
+    # Küçük CMYK görsel de aynen kopyalanmaz
+    assert not optimizer.dogrudan_kopyalanir_mi(yol, yol.stat().st_size / (1024 * 1024))
+    ciktilar, bilgi = optimizer.optimize_veri(yol.read_bytes())
+
+    with Image.open(io.BytesIO(ciktilar[main_optimizer.ANA_CIKTI])) as img:
+        assert img.mode == "RGB"
+        assert min(img.size) == min(min(boyut), main_optimizer.STANDART_KISA_KENAR)
+    assert bilgi["renk_donusumu"] == "basit"  # Profilsiz kaynak
+
+
+def test_donusum_profil_basina_bir_kez_kurulur(monkeypatch):
+    monkeypatch.setattr(cikti_kodlayicilari, "_DONUSUMLER", {})
+    kurulan = []
+    kur = ImageCms.buildTransform
+    monkeypatch.setattr(ImageCms, "buildTransform", lambda *a, **k: kurulan.append(1) or kur(*a, **k))
+
+    for renk in ((200, 10, 10), (10, 200, 10), (10, 10, 200)):
+        img, profil = cikti_kodlayicilari.srgb_donustur(Image.new("RGB", (4, 4), renk), SRGB)
+        assert img.mode == "RGB" and profil == cikti_kodlayicilari._SRGB_BAYTLARI
+
+    assert len(kurulan) == 1
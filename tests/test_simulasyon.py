@@ -0,0 +1,52 @@
+import pandas as pd
+import pytest
+
+import main_optimizer
+from conftest import envanter_yaz, jpeg_yaz
+
+
+def _arsiv(kok):
+    klasorler = []
+    for ebat, urun, seed in (("60X120", "A", 0), ("60X120", "B", 1), ("30X60", "C", 2)):
+        klasor = kok / "kaynak" / ebat / urun / "MAT"
+        jpeg_yaz(klasor / "buyuk.jpg", (1800, 1200), seed=seed)
+        jpeg_yaz(klasor / "kucuk.jpg", (300, 200), seed=10 + seed)
+        klasorler.append(klasor)
+    return envanter_yaz(kok / "envanter.xlsx", klasorler)
+
+
+def test_simulasyon_dosya_yazmaz_ve_toplamlar_tutarli(optimizer_ortami, monkeypatch):
+    monkeypatch.setattr(main_optimizer, "DRY_RUN", True)
+    envanter = _arsiv(optimizer_ortami)
+
+    main_optimizer.StokOptimizeEdici(envanter).baslat()
+
+    assert not (optimizer_ortami / "cikti").exists() or not any((optimizer_ortami / "cikti").rglob("*.jpg"))
+    rapor = pd.read_excel(optimizer_ortami / "simulasyon.xlsx").set_index("Ebat")
+    assert list(rapor.index) == ["30X60", "60X120", "TOPLAM"]
+
+    ebatlar, toplam = rapor.drop("TOPLAM"), rapor.loc["TOPLAM"]
+    assert list(ebatlar["Gorsel_Sayisi"]) == [2, 4]
+    assert list(ebatlar["Aynen_Kopya"]) == [1, 2]
+    assert list(ebatlar["Yeniden_Sikistirilacak"]) == [1, 2]
+    for sutun in ("Gorsel_Sayisi", "Aynen_Kopya", "Yeniden_Sikistirilacak", "Ornek_Sayisi"):
+        assert toplam[sutun] == ebatlar[sutun].sum()
+    for sutun in ("Kaynak_MB", "Tahmini_Cikti_MB"):
+        # Her satır ayrı ayrı 0.1 MB'a yuvarlanır
+        assert toplam[sutun] == pytest.approx(ebatlar[sutun].sum(), abs=0.05 * len(rapor))
+
+
+def test_tum_adaylar_orneklenince_tahmin_gercek_ciktiya_esit(optimizer_ortami, monkeypatch):
+    envanter = _arsiv(optimizer_ortami)
+
+    monkeypatch.setattr(main_optimizer, "DRY_RUN", True)
+    main_optimizer.StokOptimizeEdici(envanter).baslat()
+    tahmin = pd.read_excel(optimizer_ortami / "simulasyon.xlsx").set_index("Ebat").loc["TOPLAM"]
+
+    monkeypatch.setattr(main_optimizer, "DRY_RUN", False)
+    main_optimizer.StokOptimizeEdici(envanter).baslat()
+    gercek = sum(yol.stat().st_size for yol in (optimizer_ortami / "cikti").rglob("*.jpg"))
+
+    # Her Ebat'ta aday sayısı SIMULASYON_MIN_ORNEK'ten az: hepsi ölçülür, tahmin ölçümdür
+    assert tahmin["Ornek_Sayisi"] == tahmin["Yeniden_Sikistirilacak"] == 3
+    assert tahmin["Tahmini_Cikti_MB"] == pytest.approx(gercek / (1024 * 1024), abs=0.05)
@@ -0,0 +1,54 @@
+from PIL import Image
+
+import main_optimizer
+from conftest import envanter_yaz, jpeg_yaz
+
+
+def _turevler(kok):
+    return [
+        {"ad": "web", "kisa_kenar": 600, "max_mb": 0.2, "klasor": kok / "web"},
+        {"ad": "kucuk", "kisa_kenar": 200, "max_mb": 0.05, "klasor": kok / "kucuk"},
+    ]
+
+
+def test_her_seviye_kendi_boyutunda_ve_sinirinda(optimizer_ortami, monkeypatch):
+    monkeypatch.setattr(main_optimizer, "TUREVLER", _turevler(optimizer_ortami))
+    klasor = optimizer_ortami / "kaynak" / "60X120" / "A" / "MAT"
+    jpeg_yaz(klasor / "1.jpg", (1800, 1200), seed=5)
+    envanter = envanter_yaz(optimizer_ortami / "envanter.xlsx", [klasor])
+
+    main_optimizer.StokOptimizeEdici(envanter).baslat()
+
+    goreli = "60X120/A/MAT/1.jpg"
+    for kok, kisa_kenar, max_mb in ((optimizer_ortami / "cikti", 1000, 4.0),
+                                    (optimizer_ortami / "web", 600, 0.2),
+                                    (optimizer_ortami / "kucuk", 200, 0.05)):
+        yol = kok / goreli
+        with Image.open(yol) as img:
+            assert img.size == (kisa_kenar * 3 // 2, kisa_kenar)
+        assert yol.stat().st_size < max_mb * 1024 * 1024
+
+
+def test_gorsel_bir_kez_cozulur_ve_seviyeler_zincirlenir(optimizer_ortami, monkeypatch):
+    monkeypatch.setattr(main_optimizer, "TUREVLER", _turevler(optimizer_ortami))
+    optimizer = main_optimizer.StokOptimizeEdici(optimizer_ortami / "envanter.xlsx")
+    veri = jpeg_yaz(optimizer_ortami / "1.jpg", (1800, 1200), seed=5).read_bytes()
+
+    kucultulen = []
+    kucult = optimizer.kucult
+    def izle(img, hedef_boyut, *args, **kwargs):
+        kucultulen.append((img.size, hedef_boyut))
+        return kucult(img, hedef_boyut, *args, **kwargs)
+    monkeypatch.setattr(optimizer, "kucult", izle)
+
+    acilan = []
+    ac = Image.open
+    monkeypatch.setattr(main_optimizer.Image, "open", lambda *a, **k: acilan.append(1) or ac(*a, **k))
+
+    ciktilar, _ = optimizer.optimize_veri(veri)
+
+    assert len(acilan) == 1
+    assert set(ciktilar) == {"ana", "web", "kucuk"}
+    # Her türev bir önceki seviyenin çıktısından küçültülür (büyükten küçüğe)
+    assert [hedef for _, hedef in kucultulen] == [(1500, 1000), (900, 600), (300, 200)]
+    assert [kaynak for kaynak, _ in kucultulen[1:]] == [(1500, 1000), (900, 600)]